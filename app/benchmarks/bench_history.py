@@ -0,0 +1,137 @@
+"""
+Benchmark: consultas do histórico com 100 mil linhas sintéticas.
+
+Cria um banco de usuário em uma pasta temporária, preenche watch_history e
+mede as consultas de modules/history/watch_history.py na versão 1 do schema
+(só o índice único por episódio) e na versão atual (índices por data):
+- "Continuar assistindo" (último episódio de cada anime);
+- último episódio de um anime;
+- primeira página do histórico e uma página profunda (por cursor e, para
+  comparação, por OFFSET).
+Também mostra o plano de execução de cada consulta.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_history.py [linhas]
+"""
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+USER_ID = 1
+EPISODES_PER_ANIME = 50
+REPEAT = 20
+DEEP_PAGE = 500
+
+def create_database(home, rows):
+    # Path.home() lê HOME/USERPROFILE; os bancos ficam na pasta temporária
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    (Path(home) / "AppData" / "Local").mkdir(parents=True)
+    from modules.auth.auth import AuthSystem
+
+    # Conexão própria, sem create_user_database, para começar sem migrações
+    conn = sqlite3.connect(Path(home) / "user_1.db")
+    with conn:
+        AuthSystem().create_user_tables(conn, USER_ID)
+
+    random.seed(42)
+    start = datetime(2024, 1, 1)
+    animes = rows // EPISODES_PER_ANIME
+    data = []
+    for anime in range(animes):
+        for episode in range(1, EPISODES_PER_ANIME + 1):
+            watched_at = start + timedelta(seconds=random.randrange(365 * 24 * 3600))
+            data.append((USER_ID, f"anime-{anime}", f"Anime {anime}", episode, f"Episódio {episode}",
+                         random.randrange(1440), 1440, watched_at.strftime("%Y-%m-%d %H:%M:%S")))
+    with conn:
+        conn.executemany('''
+            INSERT INTO watch_history (user_id, anime_id, anime_title, episode_number, episode_title,
+                                       progress_seconds, total_seconds, watched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', data)
+    return conn
+
+def measure(fn):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def query_plan(conn, sql, params):
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return "; ".join(row[-1] for row in rows)
+
+def run_queries(conn):
+    from modules.history.watch_history import (WatchHistory, HISTORY_PAGE_SIZE, CONTINUE_WATCHING,
+                                               LATEST_EPISODE, HISTORY_NEXT_PAGE)
+
+    history = WatchHistory(USER_ID, conn)
+
+    # Cursor da página DEEP_PAGE, obtido uma vez fora da medição
+    offset = DEEP_PAGE * HISTORY_PAGE_SIZE
+    last = conn.execute('''
+        SELECT watched_at, id FROM watch_history WHERE user_id = ?
+        ORDER BY watched_at DESC, id DESC LIMIT 1 OFFSET ?
+    ''', (USER_ID, offset - 1)).fetchone()
+
+    def offset_page():
+        conn.execute('''
+            SELECT * FROM watch_history WHERE user_id = ?
+            ORDER BY watched_at DESC, id DESC LIMIT ? OFFSET ?
+        ''', (USER_ID, HISTORY_PAGE_SIZE, offset)).fetchall()
+
+    results = {
+        "continuar assistindo": measure(history.continue_watching),
+        "último episódio": measure(lambda: history.latest_episode("anime-7")),
+        "histórico, 1ª página": measure(history.history_page),
+        f"histórico, página {DEEP_PAGE} (cursor)": measure(lambda: history.history_page(tuple(last))),
+        f"histórico, página {DEEP_PAGE} (OFFSET)": measure(offset_page),
+    }
+    plans = {
+        "continuar assistindo": query_plan(conn, CONTINUE_WATCHING, (USER_ID, 20)),
+        "último episódio": query_plan(conn, LATEST_EPISODE, (USER_ID, "anime-7")),
+        "histórico (cursor)": query_plan(conn, HISTORY_NEXT_PAGE, (USER_ID, last[0], last[1], 50)),
+    }
+    return results, plans
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    from loguru import logger
+    logger.remove()
+    from modules.database.migrations import migrate_user_database, USER_DB_MIGRATIONS
+
+    with tempfile.TemporaryDirectory() as folder:
+        conn = create_database(folder, rows)
+
+        migrate_user_database(conn, target_version=1)
+        conn.execute("ANALYZE")
+        before, before_plans = run_queries(conn)
+
+        start = time.perf_counter()
+        migrate_user_database(conn)
+        migration_ms = (time.perf_counter() - start) * 1000
+        conn.execute("ANALYZE")
+        after, after_plans = run_queries(conn)
+        conn.close()
+
+    print(f"watch_history com {rows} linhas; mediana de {REPEAT} execuções")
+    print(f"{'consulta':<36}{'versão 1':>12}{f'versão {len(USER_DB_MIGRATIONS)}':>12}")
+    for name in before:
+        print(f"{name:<36}{before[name]:>9.2f} ms{after[name]:>9.2f} ms")
+    print(f"\nMigração para a versão {len(USER_DB_MIGRATIONS)}: {migration_ms:.0f} ms")
+
+    print("\nPlanos de execução (versão 1 -> atual):")
+    for name in before_plans:
+        print(f"  {name}:\n    {before_plans[name]}\n    {after_plans[name]}")
+
+if __name__ == "__main__":
+    main()
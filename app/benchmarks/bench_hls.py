@@ -0,0 +1,131 @@
+"""
+Benchmark: travamentos de um player HLS com e sem a camada local (/hls/...).
+
+Sobe uma "CDN" local com uma playlist master, uma variante VOD de segmentos
+e latência alta por pedido, e simula um player que lê os segmentos em ordem
+e consome cada um em SEGMENT_SECONDS (tempo real acelerado). Mede, direto e
+pelo servidor local:
+- tempo até o primeiro segmento;
+- número de travamentos e tempo total travado;
+- a mesma reprodução de novo (ex.: voltar depois de trocar de idioma).
+Também confere que os segmentos servidos são iguais aos originais.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_hls.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+SEGMENTS = 30
+SEGMENT_BYTES = 512 * 1024
+SEGMENT_SECONDS = 0.25
+LATENCY_SECONDS = 0.3
+BANDWIDTH_BYTES = 16 * 1024 * 1024
+
+class CdnHandler(BaseHTTPRequestHandler):
+    """Master, variante e segmentos, com latência por pedido e banda limitada"""
+    protocol_version = "HTTP/1.1"
+    segments = []
+
+    def do_GET(self):
+        time.sleep(LATENCY_SECONDS)
+        if self.path == "/master.m3u8":
+            body = b"#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=2000000\nvariant/720p.m3u8\n"
+        elif self.path == "/variant/720p.m3u8":
+            lines = ["#EXTM3U", "#EXT-X-TARGETDURATION:4", "#EXT-X-PLAYLIST-TYPE:VOD"]
+            for index in range(SEGMENTS):
+                lines += ["#EXTINF:4.0,", f"seg/{index}.ts"]
+            body = ("\n".join(lines + ["#EXT-X-ENDLIST"]) + "\n").encode()
+        elif self.path.startswith("/variant/seg/"):
+            body = self.segments[int(self.path.rsplit("/", 1)[1].split(".")[0])]
+        else:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            for offset in range(0, len(body), 64 * 1024):
+                self.wfile.write(body[offset:offset + 64 * 1024])
+                time.sleep(64 * 1024 / BANDWIDTH_BYTES)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def media_playlist(session, master_url):
+    master = session.get(master_url).text
+    variant = next(line for line in master.splitlines() if line and not line.startswith("#"))
+    variant_url = requests.compat.urljoin(master_url, variant)
+    playlist = session.get(variant_url).text
+    return [requests.compat.urljoin(variant_url, line)
+            for line in playlist.splitlines() if line and not line.startswith("#")]
+
+def play(master_url):
+    """Simula o player: baixa em ordem e consome cada segmento em tempo real"""
+    session = requests.Session()
+    began = time.perf_counter()
+    segment_urls = media_playlist(session, master_url)
+    first_segment = None
+    stalls, stalled = 0, 0.0
+    playhead_free_at = None
+    data = []
+
+    for url in segment_urls:
+        content = session.get(url).content
+        now = time.perf_counter()
+        if first_segment is None:
+            first_segment = now - began
+            playhead_free_at = now
+        elif now > playhead_free_at:
+            # O segmento anterior acabou antes deste chegar
+            stalls += 1
+            stalled += now - playhead_free_at
+        playhead_free_at = max(now, playhead_free_at) + SEGMENT_SECONDS
+        data.append(content)
+        # O player só pede o próximo quando o buffer tem espaço
+        time.sleep(max(0, playhead_free_at - SEGMENT_SECONDS - time.perf_counter()))
+
+    return first_segment * 1000, stalls, stalled * 1000, data
+
+def main():
+    home = tempfile.mkdtemp()
+    # Path.home() lê HOME/USERPROFILE; o cache fica na pasta temporária
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    (Path(home) / "AppData" / "Local").mkdir(parents=True)
+    from loguru import logger
+    logger.remove()
+    from modules.streaming.local_server import local_stream_url, stop_stream_server
+
+    CdnHandler.segments = [os.urandom(SEGMENT_BYTES) for _ in range(SEGMENTS)]
+    cdn = ThreadingHTTPServer(("127.0.0.1", 0), CdnHandler)
+    cdn.daemon_threads = True
+    threading.Thread(target=cdn.serve_forever, daemon=True).start()
+    remote_url = f"http://127.0.0.1:{cdn.server_address[1]}/master.m3u8"
+
+    print(f"CDN: {SEGMENTS} segmentos de {SEGMENT_BYTES // 1024} KiB, "
+          f"{LATENCY_SECONDS * 1000:.0f} ms de latência; cada segmento toca em {SEGMENT_SECONDS * 1000:.0f} ms")
+    print(f"{'reprodução':<22}{'1º segmento':>14}{'travamentos':>14}{'tempo travado':>16}")
+    runs = [("direto", remote_url), ("local", local_stream_url(remote_url)),
+            ("local, de novo", local_stream_url(remote_url))]
+    for name, url in runs:
+        first_ms, stalls, stalled_ms, data = play(url)
+        assert data == CdnHandler.segments, f"segmentos errados em {name}"
+        print(f"{name:<22}{first_ms:>11.0f} ms{stalls:>14}{stalled_ms:>13.0f} ms")
+
+    stop_stream_server()
+    cdn.shutdown()
+
+if __name__ == "__main__":
+    main()
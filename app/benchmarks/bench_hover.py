@@ -0,0 +1,150 @@
+"""
+Benchmark: CPU por frame da animação de hover dos cards.
+
+Compara a animação antiga (QPropertyAnimation em "geometry" de um card dentro
+de um QHBoxLayout) com o zoom pintado pelo delegate do AnimeGridView, que
+não altera a geometria. Cada ciclo é um hover de entrada e de saída completo.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_hover.py [ciclos]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QVBoxLayout, QFrame, QLabel
+from PySide6.QtCore import QObject, QEvent, QPropertyAnimation, QEasingCurve, QRect
+from PySide6.QtGui import QPixmap, QColor
+
+from styles.theme import apply_theme
+from modules.ui.anime_grid import AnimeGridView
+
+CARDS = 10
+FRAME_MS = 16
+
+def make_anime(i):
+    return {'id': str(i), 'name': f'Anime {i}', 'type': 'TV', 'episodes': 12, 'poster': f'poster-{i}'}
+
+def poster_loader(anime_id, url, on_loaded, on_failed):
+    pixmap = QPixmap(200, 280)
+    pixmap.fill(QColor("#445566"))
+    on_loaded(anime_id, pixmap)
+
+class LegacyCard(QFrame):
+    """Reprodução do AnimeCard antigo: hover anima a geometria (±5px)"""
+
+    def __init__(self, anime):
+        super().__init__()
+        self.setObjectName("legacy_card")
+        self.setFixedSize(200, 300)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        poster = QLabel()
+        poster.setFixedSize(180, 220)
+        poster.setPixmap(QPixmap(180, 220))
+        layout.addWidget(poster)
+        layout.addWidget(QLabel(anime['name']))
+        layout.addWidget(QLabel(f"{anime['type']} • {anime['episodes']} episódios"))
+        self.scale_animation = QPropertyAnimation(self, b"geometry")
+        self.scale_animation.setDuration(200)
+        self.scale_animation.setEasingCurve(QEasingCurve.OutCubic)
+
+    def hover(self, entering):
+        rect = self.geometry()
+        delta = 5 if entering else -5
+        self.scale_animation.setStartValue(rect)
+        self.scale_animation.setEndValue(QRect(rect.x() - delta, rect.y() - delta,
+                                               rect.width() + 2 * delta, rect.height() + 2 * delta))
+        self.scale_animation.start()
+        return self.scale_animation
+
+class EventCounter(QObject):
+    """Conta pinturas e pedidos de relayout de todos os widgets"""
+
+    def __init__(self):
+        super().__init__()
+        self.paints = 0
+        self.layouts = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.paints += 1
+        elif event.type() == QEvent.LayoutRequest:
+            self.layouts += 1
+        return False
+
+def measure(app, cycles, hover):
+    """Roda os ciclos de hover quadro a quadro
+
+    Retorna (ms de CPU por frame, frames, pinturas por frame, relayouts).
+
+    A animação é avançada manualmente (60 fps) e cada quadro é seguido de
+    processEvents(), que executa o relayout e a pintura pendentes. Assim a
+    medida não inclui o tempo ocioso entre os quadros.
+    """
+    frames = 0
+    app.processEvents()
+    counter = EventCounter()
+    app.installEventFilter(counter)
+    cpu_start = time.process_time()
+    for cycle in range(cycles):
+        for entering in (True, False):
+            animation = hover(cycle % CARDS, entering)
+            animation.pause()
+            for current_time in range(0, animation.duration() + 1, FRAME_MS):
+                animation.setCurrentTime(current_time)
+                app.processEvents()
+                frames += 1
+            animation.stop()
+    cpu = time.process_time() - cpu_start
+    app.removeEventFilter(counter)
+    frames = max(frames, 1)
+    return cpu * 1000 / frames, frames, counter.paints / frames, counter.layouts
+
+def build_legacy_row():
+    row = QWidget()
+    layout = QHBoxLayout(row)
+    cards = [LegacyCard(make_anime(i)) for i in range(CARDS)]
+    for card in cards:
+        layout.addWidget(card)
+    row.show()
+    return row, cards
+
+def build_grid():
+    view = AnimeGridView(poster_loader)
+    view.resize(CARDS * 220 + 40, 360)
+    view.set_animes([make_anime(i) for i in range(CARDS)])
+    view.show()
+    return view
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QApplication(sys.argv)
+    apply_theme(app)
+    results = []
+
+    row, legacy_cards = build_legacy_row()
+    results.append(("geometry (antigo)",) + measure(
+        app, cycles, lambda i, entering: legacy_cards[i].hover(entering)))
+    row.close()
+
+    view = build_grid()
+
+    def grid_hover(i, entering):
+        view.set_hovered_index(view.anime_model.index(i) if entering else view.anime_model.index(-1))
+        return view.hover_animations[i]
+
+    results.append(("AnimeGridView (zoom)",) + measure(app, cycles, grid_hover))
+    view.close()
+
+    print(f"Ciclos de hover: {cycles}")
+    print(f"{'Abordagem':<24}{'CPU/frame (ms)':>16}{'frames':>10}{'pinturas/frame':>16}{'relayouts':>11}")
+    for name, cpu_per_frame, frames, paints, layouts in results:
+        print(f"{name:<24}{cpu_per_frame:>16.3f}{frames:>10}{paints:>16.2f}{layouts:>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: latência do login por custo do bcrypt e travamento da interface.
+
+Para cada custo, cadastra um usuário em uma pasta temporária e mede:
+- a latência de AuthSystem.login_user (mediana das tentativas);
+- o maior intervalo sem processar eventos (com um timer de 5 ms rodando)
+  quando o login roda na thread da interface (antigo) e quando roda no
+  executor de tarefas, como o AuthWidget faz agora.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_login.py [tentativas]
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer, QEventLoop
+
+COSTS = [10, 11, 12, 13]
+TICK_MS = 5
+
+class StallMeter:
+    """Mede o maior intervalo entre dois ticks de um timer da interface"""
+
+    def __init__(self):
+        self.timer = QTimer()
+        self.timer.setInterval(TICK_MS)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.last = time.perf_counter()
+        self.max_gap = 0
+        self.timer.start()
+
+    def tick(self):
+        now = time.perf_counter()
+        self.max_gap = max(self.max_gap, now - self.last)
+        self.last = now
+
+    def stop(self):
+        self.tick()
+        self.timer.stop()
+        return self.max_gap * 1000
+
+def make_auth_system(home, cost):
+    from modules.database.connection_manager import set_app_data_path
+
+    # O banco de cada custo fica isolado; as conexões do custo anterior são fechadas
+    app_data = Path(home) / "AniPlay"
+    set_app_data_path(app_data)
+    (app_data / "auth_settings.json").write_text(json.dumps({"bcrypt_cost": cost}))
+
+    from modules.auth.auth import AuthSystem
+    auth_system = AuthSystem()
+    auth_system.register_user("bench_user", "bench@example.com", "senha-do-bench")
+    return auth_system
+
+def blocking_login(app, auth_system, meter):
+    meter.start()
+    # Como o handle_login antigo: o login roda dentro de um slot
+    QTimer.singleShot(0, lambda: auth_system.login_user("bench_user", "senha-do-bench"))
+    QTimer.singleShot(TICK_MS, app.exit)
+    app.exec()
+    return meter.stop()
+
+def task_login(auth_system, meter):
+    from modules.tasks.task_manager import run_task, PRIORITY_INTERACTIVE
+
+    loop = QEventLoop()
+    meter.start()
+    run_task(auth_system.login_user, "bench_user", "senha-do-bench",
+             priority=PRIORITY_INTERACTIVE).then(lambda outcome: loop.quit(), lambda error: loop.quit())
+    loop.exec()
+    return meter.stop()
+
+def main():
+    attempts = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    app = QApplication(sys.argv[:1])
+    from loguru import logger
+    logger.remove()
+
+    from modules.database.connection_manager import set_app_data_path
+
+    meter = StallMeter()
+    print(f"Login: mediana de {attempts} tentativas")
+    print(f"{'custo':>6}{'latência (ms)':>16}{'trava (síncrono)':>20}{'trava (tarefa)':>18}")
+    for cost in COSTS:
+        with tempfile.TemporaryDirectory() as home:
+            auth_system = make_auth_system(home, cost)
+
+            latencies = []
+            for _ in range(attempts):
+                start = time.perf_counter()
+                success, _ = auth_system.login_user("bench_user", "senha-do-bench")
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert success
+
+            blocking = [blocking_login(app, auth_system, meter) for _ in range(attempts)]
+            threaded = [task_login(auth_system, meter) for _ in range(attempts)]
+
+            print(f"{cost:>6}{statistics.median(latencies):>16.0f}"
+                  f"{statistics.median(blocking):>17.0f} ms{statistics.median(threaded):>15.0f} ms")
+            # Fecha o users.db antes de apagar a pasta (no Windows a remoção falharia)
+            set_app_data_path(None)
+
+    from modules.tasks.task_manager import get_task_manager
+    get_task_manager().shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark: CPU dos controles do player durante a reprodução.
+
+Compara os controles antigos (timer de 100 ms lendo a posição e barra e
+relógio redesenhados a cada positionChanged) com os atuais, atualizados pelo
+positionChanged só quando o que aparece muda e suspensos com os controles
+ocultos. O player recebe posições em tempo real a cada POSITION_INTERVAL_MS,
+como durante a reprodução de um episódio, por SECONDS segundos em janela e
+em tela cheia com os controles ocultos. Mede:
+- CPU do processo por segundo de vídeo;
+- quantas vezes a barra e o relógio foram pintados.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_player_controls.py [segundos]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SECONDS = 10
+POSITION_INTERVAL_MS = 40
+EPISODE_MS = 24 * 60 * 1000
+
+def waiting_resolver(episode, language, report_progress, cancel_event, on_late_source):
+    """Os links nunca chegam: o player fica sem stream e as posições vêm do benchmark"""
+    cancel_event.wait()
+    return None
+
+def main():
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else SECONDS
+    home = tempfile.mkdtemp()
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    (Path(home) / "AppData" / "Local").mkdir(parents=True)
+    from loguru import logger
+    logger.remove()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent, QTimer, QTime, QEventLoop
+    from styles.theme import apply_theme
+    from modules.ui.video_player import VideoPlayerDialog
+
+    class LegacyPlayer(VideoPlayerDialog):
+        """Reprodução dos controles antigos: polling de 100 ms e redesenho a cada posição"""
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.update_timer = QTimer()
+            self.update_timer.timeout.connect(self.update_controls)
+            self.update_timer.start(100)
+
+        def position_changed(self, position):
+            self.last_position = position
+            if not self.progress_slider.isSliderDown():
+                self.progress_slider.setValue(position)
+            current_time = QTime(0, 0, 0, 0).addMSecs(position)
+            self.current_time_label.setText(current_time.toString("mm:ss"))
+
+        def update_controls(self):
+            # O antigo lia position()/duration() do player tocando
+            if not self.progress_slider.isSliderDown():
+                self.progress_slider.setValue(self.last_position)
+
+        def hide_controls(self):
+            # O antigo animava com a altura mínima de 100 fixa: a barra não encolhia
+            if self.is_fullscreen and self.controls_visible:
+                self.controls_animation.setStartValue(100)
+                self.controls_animation.setEndValue(0)
+                self.controls_animation.start()
+                self.controls_visible = False
+
+        def done(self, result):
+            self.update_timer.stop()
+            super().done(result)
+
+    class PaintCounter(QObject):
+        def __init__(self):
+            super().__init__()
+            self.paints = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                self.paints += 1
+            return False
+
+    app = QApplication(sys.argv)
+    apply_theme(app)
+
+    def wait(ms):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def run(player_class, fullscreen):
+        dialog = player_class({'episode_data': {'number': 1}, 'anime': {'id': 'bench'}, 'streaming_links': {}},
+                              resolver=waiting_resolver)
+        dialog.resize(1280, 720)
+        dialog.show()
+        dialog.duration_changed(EPISODE_MS)
+        if fullscreen:
+            dialog.is_fullscreen = True
+            dialog.hide_controls()
+        wait(500)
+
+        counter = PaintCounter()
+        dialog.progress_slider.installEventFilter(counter)
+        dialog.current_time_label.installEventFilter(counter)
+        began = time.perf_counter()
+        ticker = QTimer()
+        ticker.timeout.connect(lambda: dialog.position_changed(int((time.perf_counter() - began) * 1000)))
+        ticker.start(POSITION_INTERVAL_MS)
+        cpu_before = time.process_time()
+        wait(seconds * 1000)
+        cpu = time.process_time() - cpu_before
+        ticker.stop()
+        dialog.done(0)
+        dialog.deleteLater()
+        wait(100)
+        return cpu / seconds * 1000, counter.paints
+
+    print(f"{seconds} s de vídeo, posição a cada {POSITION_INTERVAL_MS} ms")
+    print(f"{'controles':<12}{'cena':<24}{'CPU (ms/s)':>12}{'pinturas':>10}")
+    for name, player_class in (("antes", LegacyPlayer), ("depois", VideoPlayerDialog)):
+        for scene, fullscreen in (("janela", False), ("tela cheia, ocultos", True)):
+            cpu_ms, paints = run(player_class, fullscreen)
+            print(f"{name:<12}{scene:<24}{cpu_ms:>12.1f}{paints:>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark: qualidade inicial fixa (F-HD primeiro) x escolhida pela medição de vazão.
+
+Sobe uma origem local com banda total limitada e três arquivos "virtuais"
+(F-HD, HD e SD) com os tamanhos de um episódio de 24 minutos em cada
+bitrate. Mede a escolha de choose_quality depois de probe_before_start (a
+medição com prazo que o app faz antes da qualidade inicial) e simula
+PLAY_SECONDS de reprodução em cada qualidade escolhida:
+- tempo da medição;
+- tempo até o buffer inicial (STARTUP_BUFFER_SECONDS de vídeo);
+- travamentos e tempo travado.
+Depois repete a escolha como em uma segunda sessão do app: medição e
+tamanhos relidos de stream_hosts.json, sem nada baixado.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_quality_probe.py
+"""
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+BANDWIDTH_BYTES = 1_500_000
+EPISODE_SECONDS = 24 * 60
+BITRATES = {'F-HD': 2_000_000, 'HD': 1_000_000, 'SD': 500_000}
+PLAY_SECONDS = 8
+STARTUP_BUFFER_SECONDS = 2
+REBUFFER_SECONDS = 1
+CHUNK = 16 * 1024
+
+class ThrottledHandler(BaseHTTPRequestHandler):
+    """Arquivos de zeros com Range; todas as conexões dividem BANDWIDTH_BYTES"""
+    protocol_version = "HTTP/1.1"
+    link = threading.Lock()
+
+    def do_GET(self):
+        quality = self.path.strip("/").split(".")[0]
+        size = BITRATES[quality] * EPISODE_SECONDS
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        start = int(match.group(1)) if match else 0
+        end = min(int(match.group(2)), size - 1) if match and match.group(2) else size - 1
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        remaining = end - start + 1
+        try:
+            while remaining > 0:
+                length = min(CHUNK, remaining)
+                with self.link:
+                    time.sleep(length / BANDWIDTH_BYTES)
+                self.wfile.write(bytes(length))
+                remaining -= length
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def play(url, bitrate):
+    """Baixa em sequência e consome em tempo real; devolve (início, travamentos, tempo travado)
+
+    O vídeo trava quando o consumo alcança o que chegou e volta com
+    REBUFFER_SECONDS de vídeo no buffer.
+    """
+    began = time.perf_counter()
+    received = 0
+    started_at = None
+    # Segundos de vídeo já tocados, medidos até last_tick
+    played, last_tick = 0.0, None
+    stalls, stalled, stall_began = 0, 0.0, None
+    with requests.get(url, headers={"Range": f"bytes=0-{bitrate * PLAY_SECONDS - 1}"}, stream=True) as response:
+        for chunk in response.iter_content(CHUNK):
+            received += len(chunk)
+            now = time.perf_counter()
+            buffered = received / bitrate
+            if started_at is None:
+                if buffered >= STARTUP_BUFFER_SECONDS:
+                    started_at = last_tick = now
+                continue
+            if stall_began is None:
+                played = min(played + now - last_tick, buffered)
+                if played >= buffered and buffered < PLAY_SECONDS:
+                    stalls += 1
+                    stall_began = now
+            elif buffered - played >= min(REBUFFER_SECONDS, PLAY_SECONDS - played):
+                stalled += now - stall_began
+                stall_began = None
+            last_tick = now
+    if stall_began is not None:
+        stalled += time.perf_counter() - stall_began
+    return (started_at - began) * 1000, stalls, stalled * 1000
+
+def main():
+    home = tempfile.mkdtemp()
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    (Path(home) / "AppData" / "Local").mkdir(parents=True)
+    from loguru import logger
+    logger.remove()
+    import modules.streaming.quality_probe as quality_probe
+    from modules.streaming.quality_probe import probe_before_start, choose_quality, get_host_throughput
+
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledHandler)
+    origin.daemon_threads = True
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    links = {quality: f"http://127.0.0.1:{origin.server_address[1]}/{quality}.mp4" for quality in BITRATES}
+
+    print(f"Banda: {BANDWIDTH_BYTES * 8 / 1e6:.0f} Mbit/s; bitrates: "
+          + ", ".join(f"{q} {b * 8 / 1e6:.0f} Mbit/s" for q, b in BITRATES.items()))
+    began = time.perf_counter()
+    probe_before_start(links)
+    probe_ms = (time.perf_counter() - began) * 1000
+    chosen = choose_quality(links, EPISODE_SECONDS)
+    measured = get_host_throughput().throughput("127.0.0.1")
+    print(f"Medição: {probe_ms:.0f} ms, {measured * 8 / 1e6:.1f} Mbit/s medidos")
+
+    print(f"{'qualidade':<24}{'início':>10}{'travamentos':>14}{'tempo travado':>16}")
+    for name, quality in (("fixa (F-HD)", "F-HD"), (f"medida ({chosen})", chosen)):
+        startup_ms, stalls, stalled_ms = play(links[quality], BITRATES[quality])
+        print(f"{name:<24}{startup_ms:>7.0f} ms{stalls:>14}{stalled_ms:>13.0f} ms")
+
+    # Como ao abrir o app de novo: as medições vêm só do arquivo
+    quality_probe._host_throughput = None
+    began = time.perf_counter()
+    probe_before_start(links)
+    again = choose_quality(links, EPISODE_SECONDS)
+    print(f"Segunda sessão (medição e tamanhos lembrados): {again} em {(time.perf_counter() - began) * 1000:.0f} ms")
+    origin.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark: custo de importação por módulo e tempo até a primeira pintura.
+
+Cada medida roda em um processo novo (início a frio do interpretador):
+
+1. "python -X importtime -c 'import app'" lista o custo acumulado de cada
+   módulo carregado pela janela principal.
+2. O tempo até a primeira pintura vai do lançamento do processo até o
+   primeiro QEvent.Paint da AniPlayApp (sem iniciar a API do Aniwatch).
+
+O modo "eager" importa antes os módulos que hoje são carregados sob demanda
+(BeautifulSoup, downloader, QtMultimedia, QtWebEngine e o diálogo de
+detalhes), reproduzindo a abertura antiga.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_startup.py [repetições]
+"""
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Módulos que não fazem mais parte da abertura
+LAZY_MODULES = [
+    "bs4",
+    "modules.anime.animefire_downloader",
+    "PySide6.QtMultimedia",
+    "PySide6.QtMultimediaWidgets",
+    "PySide6.QtWebEngineWidgets",
+    "modules.ui.anime_details",
+    "modules.ui.video_player",
+]
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def child_env(home):
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = str(SRC)
+    # Banco e cache em uma pasta temporária: a medida não toca nos dados do usuário
+    env["HOME"] = env["USERPROFILE"] = home
+    return env
+
+def eager_imports():
+    """Importa os módulos preguiçosos, ignorando os que não existem nesta máquina"""
+    for name in LAZY_MODULES:
+        try:
+            __import__(name)
+        except Exception:
+            pass
+
+def import_costs(env, extra_code=""):
+    """Roda -X importtime e devolve ({módulo: (acumulado_us, profundidade)}, stdout)
+
+    O dicionário segue a ordem do -X importtime: dependências antes de quem as importou.
+    """
+    code = "import app\n" + extra_code
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=SRC, env=env, capture_output=True, text=True)
+    costs = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            _, cumulative_us, indent, name = match.groups()
+            costs[name] = (int(cumulative_us), len(indent) // 2)
+    return costs, result.stdout
+
+def direct_imports(costs, parent):
+    """Módulos importados diretamente por parent, com o custo acumulado de cada um"""
+    children = []
+    for name, (cumulative, depth) in costs.items():
+        if depth == 1:
+            children.append((cumulative, name))
+        elif depth == 0:
+            if name == parent:
+                return sorted(children, reverse=True)
+            children = []
+    return []
+
+def lazy_module_costs(env):
+    """Custo que cada módulo preguiçoso adicionaria se voltasse para a abertura"""
+    code = "\n".join(f"try:\n    import {name}\nexcept Exception:\n    print('falhou {name}')"
+                     for name in LAZY_MODULES)
+    base, _ = import_costs(env)
+    with_lazy, output = import_costs(env, code)
+    costs = {}
+    for name in LAZY_MODULES:
+        if name in with_lazy and name not in base and f"falhou {name}" not in output:
+            costs[name] = with_lazy[name][0]
+    return costs
+
+def first_paint(env, eager):
+    """Lança o processo filho e devolve os segundos até a primeira pintura"""
+    launched = time.time()
+    args = [sys.executable, str(Path(__file__).resolve()), "--child", str(launched)]
+    if eager:
+        args.append("--eager")
+    result = subprocess.run(args, cwd=SRC, env=env, capture_output=True, text=True, timeout=120)
+    for line in result.stdout.splitlines():
+        if line.startswith("first_paint "):
+            return float(line.split()[1])
+    raise RuntimeError(f"Processo filho não pintou a janela:\n{result.stderr[-2000:]}")
+
+def run_child(launched, eager):
+    if eager:
+        eager_imports()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent
+
+    app = QApplication(sys.argv[:1])
+    from styles.theme import apply_theme
+    from app import AniPlayApp
+
+    # A API (npm start) não faz parte da medida
+    AniPlayApp.init_aniwatch_api = lambda self: None
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                print(f"first_paint {time.time() - launched:.4f}", flush=True)
+                os._exit(0)
+            return False
+
+    apply_theme(app)
+    window = AniPlayApp()
+    watcher = FirstPaint()
+    window.installEventFilter(watcher)
+    window.show()
+    app.exec()
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with tempfile.TemporaryDirectory() as home:
+        (Path(home) / "AppData" / "Local").mkdir(parents=True)
+        env = child_env(home)
+
+        costs, _ = import_costs(env)
+        print(f"Importação de 'app': {costs['app'][0] / 1000:.1f} ms em {len(costs)} módulos")
+        print(f"{'Importado por app.py':<44}{'acumulado (ms)':>16}")
+        for cumulative, name in direct_imports(costs, "app")[:15]:
+            print(f"{name:<44}{cumulative / 1000:>16.1f}")
+
+        print()
+        print(f"{'Carregado sob demanda':<44}{'custo evitado (ms)':>20}")
+        lazy_costs = lazy_module_costs(env)
+        for name in LAZY_MODULES:
+            cost = lazy_costs.get(name)
+            print(f"{name:<44}{(f'{cost / 1000:.1f}' if cost else 'não instalado'):>20}")
+
+        print()
+        print(f"Tempo até a primeira pintura (mediana de {repetitions}, processo a frio)")
+        for label, eager in (("lazy (atual)", False), ("eager (antigo)", True)):
+            samples = [first_paint(env, eager) for _ in range(repetitions)]
+            print(f"{label:<20}{statistics.median(samples) * 1000:>10.0f} ms"
+                  f"   (min {min(samples) * 1000:.0f}, max {max(samples) * 1000:.0f})")
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        run_child(float(sys.argv[sys.argv.index("--child") + 1]), "--eager" in sys.argv)
+    else:
+        main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: proxy local com cache de blocos vs. acesso direto ao MP4 remoto.
+
+Sobe um servidor de arquivos local com suporte a Range, latência e banda
+limitadas (simulando a CDN), e mede, direto e pelo proxy (/range/...):
+- abrir o vídeo (primeiros 2 MiB);
+- seek para o meio e leitura de 2 MiB;
+- voltar ao começo (já baixado) e ler 2 MiB;
+- assistir de novo do começo, lendo 8 MiB.
+Também confere que os bytes servidos pelo proxy são iguais aos do arquivo.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_stream_proxy.py
+"""
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+FILE_SIZE = 48 * 1024 * 1024
+LATENCY_SECONDS = 0.15
+BANDWIDTH_BYTES = 16 * 1024 * 1024
+READ_SIZE = 2 * 1024 * 1024
+MIB = 1024 * 1024
+
+class ThrottledFileHandler(BaseHTTPRequestHandler):
+    """Servidor de origem: Range, latência por pedido e banda limitada"""
+    protocol_version = "HTTP/1.1"
+    content = b""
+
+    def do_GET(self):
+        time.sleep(LATENCY_SECONDS)
+        size = len(self.content)
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            start, end = 0, size - 1
+            self.send_response(200)
+        self.send_header("Content-Type", "video/mp4")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+
+        chunk = 64 * 1024
+        try:
+            for offset in range(start, end + 1, chunk):
+                self.wfile.write(self.content[offset:min(offset + chunk, end + 1)])
+                time.sleep(chunk / BANDWIDTH_BYTES)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+def read(url, start, length):
+    """Lê length bytes a partir de start como o FFmpeg: pedido aberto, fecha ao ter o suficiente"""
+    began = time.perf_counter()
+    data = bytearray()
+    with requests.get(url, headers={"Range": f"bytes={start}-"}, stream=True, timeout=30) as response:
+        for chunk in response.iter_content(64 * 1024):
+            data += chunk
+            if len(data) >= length:
+                break
+    return (time.perf_counter() - began) * 1000, bytes(data[:length])
+
+def main():
+    home = tempfile.mkdtemp()
+    # Path.home() lê HOME/USERPROFILE; o cache fica na pasta temporária
+    os.environ["HOME"] = os.environ["USERPROFILE"] = home
+    (Path(home) / "AppData" / "Local").mkdir(parents=True)
+    from loguru import logger
+    logger.remove()
+    from modules.streaming.local_server import local_stream_url, stop_stream_server
+
+    ThrottledFileHandler.content = os.urandom(FILE_SIZE)
+    origin = ThreadingHTTPServer(("127.0.0.1", 0), ThrottledFileHandler)
+    origin.daemon_threads = True
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    remote_url = f"http://127.0.0.1:{origin.server_address[1]}/episodio.mp4"
+    proxy_url = local_stream_url(remote_url)
+
+    middle = FILE_SIZE // 2
+    steps = [
+        ("abrir (0, 2 MiB)", 0, READ_SIZE),
+        ("seek para o meio (2 MiB)", middle, READ_SIZE),
+        ("voltar ao começo (2 MiB)", 0, READ_SIZE),
+        ("assistir de novo (8 MiB)", 0, 4 * READ_SIZE),
+    ]
+
+    print(f"Origem: {FILE_SIZE // MIB} MiB, {LATENCY_SECONDS * 1000:.0f} ms de latência, "
+          f"{BANDWIDTH_BYTES // MIB} MiB/s")
+    print(f"{'etapa':<28}{'direto':>12}{'proxy':>12}")
+    for name, start, length in steps:
+        direct_ms, _ = read(remote_url, start, length)
+        proxy_ms, data = read(proxy_url, start, length)
+        assert data == ThrottledFileHandler.content[start:start + length], f"bytes errados em {name}"
+        print(f"{name:<28}{direct_ms:>9.0f} ms{proxy_ms:>9.0f} ms")
+        # Dá tempo ao download à frente, como o tempo de assistir daria
+        time.sleep(0.5)
+
+    stop_stream_server()
+    origin.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Benchmark: troca de estilo por setStyleSheet vs tema global + estados dinâmicos.
+
+Mede o custo médio de três trocas de estilo, comparando a abordagem antiga
+(setStyleSheet por widget a cada evento) com o tema aplicado uma única vez na
+QApplication. Nos dois lados o widget muda de aparência de fato: o tema tem
+uma regra para o estado medido.
+- estado do pôster: QLabel[posterState="failed"], via set_style_state;
+- hover de aba: QPushButton[variant="tab"]:hover, pseudo-estado;
+- troca de aba: QPushButton[variant="tab"][active="true"], via set_style_state.
+
+Uso (na pasta app):
+    venv\\Scripts\\python.exe benchmarks\\bench_theme.py [iterações]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget, QHBoxLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPalette
+
+from styles.theme import apply_theme, set_style_state
+
+# CSS usado pela abordagem antiga (por widget, como no pôster e em show_tab),
+# com as mesmas cores das regras do tema
+LEGACY_POSTER_NORMAL = """
+    QLabel {
+        background: #2a2a2a;
+        border-radius: 10px;
+        border: 2px solid #444;
+    }
+"""
+LEGACY_POSTER_FAILED = """
+    QLabel {
+        background: #2a2a2a;
+        border-radius: 10px;
+        border: 2px solid #444;
+        color: #666;
+        font-size: 12px;
+    }
+"""
+LEGACY_TAB_BASE = """
+    QPushButton {
+        padding: 12px 24px;
+        border-radius: 8px;
+        text-align: center;
+        border: none;
+        color: white;
+        background: transparent;
+    }
+    QPushButton:hover {
+        background: #3a3a3a;
+    }
+"""
+LEGACY_TAB_ACTIVE = """
+    QPushButton {
+        background: #ff7b00;
+        color: white;
+    }
+"""
+
+def build_posters(use_theme):
+    row = QWidget()
+    layout = QHBoxLayout(row)
+    posters = []
+    for i in range(10):
+        poster = QLabel("Sem imagem")
+        poster.setObjectName("details_poster")
+        poster.setFixedSize(180, 220)
+        if not use_theme:
+            poster.setStyleSheet(LEGACY_POSTER_NORMAL)
+        layout.addWidget(poster)
+        posters.append(poster)
+    row.show()
+    return row, posters
+
+def build_tabs(use_theme):
+    bar = QWidget()
+    layout = QHBoxLayout(bar)
+    tabs = [QPushButton(name) for name in ("Início", "Busca", "Perfil")]
+    for tab in tabs:
+        if use_theme:
+            tab.setProperty("variant", "tab")
+            tab.setProperty("active", False)
+        else:
+            tab.setStyleSheet(LEGACY_TAB_BASE)
+        layout.addWidget(tab)
+    bar.show()
+    return bar, tabs
+
+def text_color(widget):
+    return widget.palette().color(QPalette.WindowText).name()
+
+def check_restyled(name, before, after):
+    """Sem mudança de cor o estado não casou com nenhuma regra e a medida não vale"""
+    if before == after:
+        raise SystemExit(f"{name}: o estado não mudou a aparência ({before})")
+
+def measure(app, iterations, action):
+    app.processEvents()
+    start = time.perf_counter()
+    for i in range(iterations):
+        action(i)
+        app.processEvents()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication(sys.argv)
+
+    # --- Abordagem antiga: sem tema global, CSS trocado a cada evento ---
+    row, posters = build_posters(use_theme=False)
+    normal = text_color(posters[0])
+    posters[0].setStyleSheet(LEGACY_POSTER_FAILED)
+    check_restyled("pôster (antigo)", normal, text_color(posters[0]))
+    posters[0].setStyleSheet(LEGACY_POSTER_NORMAL)
+
+    def legacy_poster(i):
+        poster = posters[i % len(posters)]
+        poster.setStyleSheet(LEGACY_POSTER_FAILED)
+        poster.setStyleSheet(LEGACY_POSTER_NORMAL)
+
+    legacy_poster_ms = measure(app, iterations, legacy_poster)
+
+    bar, tabs = build_tabs(use_theme=False)
+
+    def hover(i):
+        # O que o Qt faz ao entrar e sair com o mouse: muda o estado e repinta
+        tab = tabs[i % len(tabs)]
+        tab.setAttribute(Qt.WA_UnderMouse, True)
+        tab.repaint()
+        tab.setAttribute(Qt.WA_UnderMouse, False)
+        tab.repaint()
+
+    legacy_hover_ms = measure(app, iterations, hover)
+
+    def legacy_tab(i):
+        active = i % len(tabs)
+        for index, tab in enumerate(tabs):
+            tab.setStyleSheet(LEGACY_TAB_BASE + (LEGACY_TAB_ACTIVE if index == active else ""))
+
+    legacy_tab_ms = measure(app, iterations, legacy_tab)
+    row.close()
+    bar.close()
+
+    # --- Tema global: CSS interpretado uma vez, estados por pseudo-estado/propriedade ---
+    apply_theme(app)
+    row, posters = build_posters(use_theme=True)
+    normal = text_color(posters[0])
+    set_style_state(posters[0], "posterState", "failed")
+    check_restyled("pôster (tema)", normal, text_color(posters[0]))
+    set_style_state(posters[0], "posterState", None)
+
+    def themed_poster(i):
+        poster = posters[i % len(posters)]
+        set_style_state(poster, "posterState", "failed")
+        set_style_state(poster, "posterState", None)
+
+    themed_poster_ms = measure(app, iterations, themed_poster)
+
+    bar, tabs = build_tabs(use_theme=True)
+    themed_hover_ms = measure(app, iterations, hover)
+
+    def themed_tab(i):
+        active = i % len(tabs)
+        for index, tab in enumerate(tabs):
+            set_style_state(tab, "active", index == active)
+
+    themed_tab_ms = measure(app, iterations, themed_tab)
+
+    print(f"Iterações: {iterations}")
+    print(f"{'Operação':<22}{'setStyleSheet (ms)':>20}{'tema global (ms)':>20}{'ganho':>10}")
+    for name, legacy, themed in (
+        ("estado do pôster", legacy_poster_ms, themed_poster_ms),
+        ("hover de aba", legacy_hover_ms, themed_hover_ms),
+        ("troca de aba", legacy_tab_ms, themed_tab_ms),
+    ):
+        gain = legacy / themed if themed else float("inf")
+        print(f"{name:<22}{legacy:>20.3f}{themed:>20.3f}{gain:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,36 @@
 import requests
-import time
-import threading
 from loguru import logger
 
+from modules.tasks.task_manager import run_task, PRIORITY_SERVICES
+
 class ServerMonitor:
     def __init__(self, base_url: str = "http://localhost:4000", max_attempts: int = 30):
         self.base_url = base_url
         self.max_attempts = max_attempts
         self.is_ready = False
     
-    def wait_for_server(self, callback=None):
-        def check_server():
-            for attempt in range(self.max_attempts):
-                try:
-                    response = requests.get(f"{self.base_url}/health", timeout=2)
-                    if response.status_code == 200:
-                        self.is_ready = True
-                        logger.info("✅ Servidor da API está pronto!")
-                        if callback:
-                            callback(True)
-                        return
-                except requests.exceptions.RequestException:
-                    pass
-                
-                logger.info(f"⏳ Aguardando servidor... ({attempt + 1}/{self.max_attempts})")
-                time.sleep(2)
+    def check_server(self, task):
+        """Roda no executor de serviços até a API responder (ou o app fechar)"""
+        for attempt in range(self.max_attempts):
+            if task.is_cancelled():
+                return False
+            
+            try:
+                response = requests.get(f"{self.base_url}/health", timeout=2)
+                if response.status_code == 200:
+                    self.is_ready = True
+                    logger.info("✅ Servidor da API está pronto!")
+                    return True
+            except requests.exceptions.RequestException:
+                pass
             
-            logger.error("❌ Servidor não iniciou a tempo")
-            if callback:
-                callback(False)
+            logger.info(f"⏳ Aguardando servidor... ({attempt + 1}/{self.max_attempts})")
+            # Espera interrompível: o cancelamento acorda a tarefa na hora
+            task.token.event.wait(2)
         
-        thread = threading.Thread(target=check_server, daemon=True)
-        thread.start()
\ No newline at end of file
+        logger.error("❌ Servidor não iniciou a tempo")
+        return False
+    
+    def wait_for_server(self, owner=None):
+        """Agenda a verificação; o future emite finished(bool) na thread da interface"""
+        return run_task(self.check_server, priority=PRIORITY_SERVICES, owner=owner, with_task=True)
@@ -1,67 +1,75 @@
 import sys
 import subprocess
 from pathlib import Path
-import threading
-import sqlite3
 import datetime
 import json
 
 from PySide6.QtWidgets import (QMainWindow, QStackedWidget, QWidget, QVBoxLayout,
                                 QLabel, QPushButton, QHBoxLayout, QMessageBox, QFrame,
                                 QLineEdit, QListWidget, QScrollArea, QDialog)
-from PySide6.QtCore import Qt, QTimer, Signal, Slot, QThreadPool
+from PySide6.QtCore import Qt, QTimer, Slot
 from PySide6.QtGui import QPixmap
 from loguru import logger
 import jwt
 
 from api.server_monitor import ServerMonitor
-from image_loader import ImageLoader
+from image_loader import load_poster_image
 
 from modules.anime.anime import convert_anime_data
 from modules.anime.anime_data import get_search_anime
 from modules.ui.header import HeaderWidget
 from modules.cache.image_cache import ImageCacheManager
-from modules.ui.cards import AnimeCard
+from modules.ui.anime_grid import AnimeGridView
 from modules.auth.auth import AuthSystem
 from modules.auth.auth_widget import AuthWidget
 from modules.ui.home import Home
-from modules.anime.anime_data import get_animes_home_page
+from modules.database.connection_manager import get_connection_manager, user_db_name
+from modules.history.watch_progress import WatchProgressStore, get_watch_progress, set_watch_progress
+from modules.profiling.startup_profiler import get_startup_profiler
+from modules.tasks.task_manager import (get_task_manager, run_task, CancellationToken,
+                                        PRIORITY_INTERACTIVE, PRIORITY_VISIBLE_IMAGES, PRIORITY_SERVICES)
+from styles.theme import set_style_state
 
 class AniPlayApp(QMainWindow):
-    api_ready_signal = Signal(bool)
-
     def __init__(self):
         super().__init__()
         # Configura a janela principal
         self.setWindowTitle("AniPlay")
         self.resize(1200, 800)
+        self.profiler = get_startup_profiler()
 
         # Inicia o logger
-        self.setup_logger()
+        with self.profiler.phase("setup_logger"):
+            self.setup_logger()
         logger.info("AniPlay iniciado")
 
         # Usuario/autenticacao
-        self.auth_system = AuthSystem()
+        with self.profiler.phase("auth_system"):
+            self.auth_system = AuthSystem()
         self.current_user = None
         self.user_db = None
 
         # Inicializar módulos
-        self.cache_manager = ImageCacheManager(self.auth_system)
+        with self.profiler.phase("image_cache"):
+            self.cache_manager = ImageCacheManager(self.auth_system)
         
-        # Thread pool para carregamento de imagens
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(3)
+        # Posters aguardando download (callbacks por anime_id)
+        self.poster_callbacks = {}
+        self.search_token = None
+        self.home = None
 
-        self.init_ui()
-        self.try_auto_login()
+        with self.profiler.phase("init_ui"):
+            self.init_ui()
+        with self.profiler.phase("auto_login"):
+            self.try_auto_login()
 
         # Inicia a API do Aniwatch
-        self.init_aniwatch_api()
-
-        self.api_ready_signal.connect(self.on_api_ready)
+        with self.profiler.phase("start_api"):
+            self.init_aniwatch_api()
 
-        cache_size = self.cache_manager.get_cache_size()
-        cache_files_count = self.check_cache_files()
+        with self.profiler.phase("cache_scan"):
+            cache_size = self.cache_manager.get_cache_size()
+            cache_files_count = self.check_cache_files()
         logger.info(f"💾 Cache local: {cache_size:.2f} MB, {cache_files_count} arquivos")
 
         self.current_search = None
@@ -84,14 +92,21 @@ class AniPlayApp(QMainWindow):
 
     def load_anime_poster_async(self, anime_id, image_url, image_label):
         """Carrega uma imagem de forma assíncrona com cache"""
+        self.request_poster(
+            anime_id,
+            image_url,
+            lambda anime_id, pixmap: self.set_label_poster(image_label, pixmap),
+            lambda anime_id, error: self.set_label_poster_failed(image_label)
+        )
+
+    def request_poster(self, anime_id, image_url, on_loaded, on_failed=None):
+        """Obtém um poster (memória, disco ou download) e entrega via callback"""
         anime_id = str(anime_id).strip()
         
         # 1. Cache de memória
         if anime_id in self.cache_manager.poster_cache:
             logger.debug(f"✅ Imagem {anime_id} já em cache de memória")
-            pixmap = self.cache_manager.poster_cache[anime_id]
-            image_label.setPixmap(pixmap)
-            image_label.setText("")
+            on_loaded(anime_id, self.cache_manager.poster_cache[anime_id])
             return
         
         # 2. Cache de disco (síncrono)
@@ -99,11 +114,12 @@ class AniPlayApp(QMainWindow):
         if cache_pixmap:
             logger.debug(f"💾 Cache SÍNCRONO encontrado: {anime_id}")
             self.cache_manager.poster_cache[anime_id] = cache_pixmap
-            image_label.setPixmap(cache_pixmap)
-            image_label.setText("")
+            self.profiler.mark("first_poster")
+            on_loaded(anime_id, cache_pixmap)
             return
         
         # 3. Download (assíncrono)
+        self.poster_callbacks.setdefault(anime_id, []).append((on_loaded, on_failed))
         if anime_id in self.cache_manager.pending_images:
             logger.debug(f"⏳ ID {anime_id} já está sendo carregado")
             return
@@ -112,21 +128,16 @@ class AniPlayApp(QMainWindow):
         self.cache_manager.pending_images.add(anime_id)
         logger.debug(f"🚀 Iniciando carregamento assíncrono: {anime_id}")
         
-        # Cria o worker apenas para download (não para cache)
-        worker = ImageLoader(anime_id, image_url, self.cache_manager.cache_dir)
-        
-        # Conecta os sinais
-        worker.signals.image_loaded.connect(
-            lambda anime_id, pixmap: self.on_poster_loaded(anime_id, pixmap, image_label)
+        # Download no executor de imagens visíveis; o QPixmap é criado aqui, na thread da interface
+        run_task(
+            load_poster_image, anime_id, image_url, self.cache_manager.cache_dir,
+            priority=PRIORITY_VISIBLE_IMAGES
+        ).then(
+            lambda image, anime_id=anime_id: self.on_poster_loaded(anime_id, QPixmap.fromImage(image)),
+            lambda error, anime_id=anime_id: self.on_poster_failed(anime_id, error)
         )
-        worker.signals.image_failed.connect(
-            lambda anime_id, error: self.on_poster_failed(anime_id, error, image_label)
-        )
-        
-        # Inicia o worker no thread pool
-        self.thread_pool.start(worker)
 
-    def on_poster_loaded(self, anime_id, pixmap, image_label):
+    def on_poster_loaded(self, anime_id, pixmap):
         """Chamado quando uma imagem é carregada com sucesso"""
         # Remove da lista de pendentes
         if anime_id in self.cache_manager.pending_images:
@@ -134,27 +145,38 @@ class AniPlayApp(QMainWindow):
         
         # Salva no cache
         self.cache_manager.poster_cache[anime_id] = pixmap
+        self.profiler.mark("first_poster")
         
-        # Atualiza a UI
-        image_label.setPixmap(pixmap)
-        image_label.setText("")
+        # Entrega para todos que aguardavam esta imagem
+        for on_loaded, _ in self.poster_callbacks.pop(anime_id, []):
+            try:
+                on_loaded(anime_id, pixmap)
+            except RuntimeError:
+                pass  # Destino já foi destruído
         
         logger.debug(f"✅ Imagem {anime_id} carregada com sucesso")
 
-    def on_poster_failed(self, anime_id, error, image_label):
+    def on_poster_failed(self, anime_id, error):
         """Chamado quando falha ao carregar uma imagem"""
         # Remove da lista de pendentes
         if anime_id in self.cache_manager.pending_images:
             self.cache_manager.pending_images.remove(anime_id)
         
         logger.warning(f"❌ Falha ao carregar poster {anime_id}: {error}")
+        for _, on_failed in self.poster_callbacks.pop(anime_id, []):
+            if on_failed:
+                try:
+                    on_failed(anime_id, error)
+                except RuntimeError:
+                    pass  # Destino já foi destruído
+
+    def set_label_poster(self, image_label, pixmap):
+        image_label.setPixmap(pixmap)
+        image_label.setText("")
+
+    def set_label_poster_failed(self, image_label):
         image_label.setText("🎬\nSem imagem")
-        image_label.setStyleSheet(image_label.styleSheet() + """
-            QLabel {
-                color: #666;
-                font-size: 12px;
-            }
-        """)
+        set_style_state(image_label, "posterState", "failed")
 
     def try_auto_login(self):
         try:
@@ -227,14 +249,7 @@ class AniPlayApp(QMainWindow):
 
     def create_search_section(self):
         section = QWidget()
-        section.setStyleSheet("""
-            QWidget {
-                background: #2a2a2a;
-                padding: 20px;
-                border-radius: 10px;
-                margin-bottom: 30px;
-            }
-        """)
+        section.setObjectName("search_section")
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
@@ -246,33 +261,12 @@ class AniPlayApp(QMainWindow):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Digite o nome do anime...")
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-            }
-        """)
+        self.search_input.setObjectName("search_input")
         self.search_input.setMinimumWidth(400)
 
         self.search_btn = QPushButton("🔍 Buscar")
-        self.search_btn.setStyleSheet("""
-            QPushButton {
-                padding: 12px;
-                background: #ff7b00;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background: #ff9500;
-            }
-        """)
+        self.search_btn.setObjectName("search_btn")
+        self.search_btn.setProperty("variant", "primary")
 
         self.search_btn.clicked.connect(self.search_anime)
 
@@ -303,32 +297,45 @@ class AniPlayApp(QMainWindow):
             # Remove a mensagem "Digite algo..."
             self.hide_search_placeholder()
 
-            search_anime_data = get_search_anime(text)
-            if search_anime_data is None:
-                logger.error(f"❌ Nenhum anime chamado {text} foi encontrado na busca.")
-                self.show_no_results_message()
-                return
-            
-            anime_results = search_anime_data["data"]["animes"]
-            total_pages = search_anime_data["data"]["totalPages"]
-            current_page = search_anime_data["data"]["currentPage"]
-            
-            # Armazena informações da busca atual
-            self.current_search = {
-                "term": text,
-                "page": current_page,
-                "total_pages": total_pages
-            }
+            self.run_search(text, 1, lambda data: self.on_search_results(text, data))
+
+    def run_search(self, text, page, on_results):
+        """Busca em background; uma nova busca descarta a anterior"""
+        if self.search_token:
+            self.search_token.cancel()
+        self.search_token = CancellationToken()
+
+        run_task(
+            get_search_anime, text, page,
+            priority=PRIORITY_INTERACTIVE, token=self.search_token
+        ).then(on_results, lambda error: on_results(None))
+
+    def on_search_results(self, text, search_anime_data):
+        if search_anime_data is None:
+            logger.error(f"❌ Nenhum anime chamado {text} foi encontrado na busca.")
+            self.show_no_results_message()
+            return
+        
+        anime_results = search_anime_data["data"]["animes"]
+        total_pages = search_anime_data["data"]["totalPages"]
+        current_page = search_anime_data["data"]["currentPage"]
+        
+        # Armazena informações da busca atual
+        self.current_search = {
+            "term": text,
+            "page": current_page,
+            "total_pages": total_pages
+        }
+        
+        if anime_results:
+            results_section = self.create_anime_section(f'Resultados para "{text}"', convert_anime_data(anime_results), wrapping=True)
+            self.search_content_layout.addWidget(results_section, 1)
             
-            if anime_results:
-                results_section = self.create_anime_section(f'Resultados para "{text}"', convert_anime_data(anime_results))
-                self.search_content_layout.addWidget(results_section)  # CORREÇÃO AQUI
-                
-                # Adiciona controles de paginação se houver mais de uma página
-                if total_pages > 1:
-                    self.add_pagination_controls()
-            else:
-                self.show_no_results_message()
+            # Adiciona controles de paginação se houver mais de uma página
+            if total_pages > 1:
+                self.add_pagination_controls()
+        else:
+            self.show_no_results_message()
 
     def clear_search_results(self):
         """Remove todos os resultados anteriores da busca"""
@@ -359,14 +366,7 @@ class AniPlayApp(QMainWindow):
     def show_no_results_message(self):
         """Mostra mensagem quando não há resultados"""
         no_results_label = QLabel("Nenhum resultado encontrado para sua busca.")
-        no_results_label.setStyleSheet("""
-            QLabel {
-                text-align: center;
-                color: #888;
-                padding: 40px;
-                font-size: 16px;
-            }
-        """)
+        no_results_label.setProperty("role", "placeholder")
         no_results_label.setAlignment(Qt.AlignCenter)
         self.search_content_layout.addWidget(no_results_label)  # Usa o layout direto
 
@@ -378,31 +378,15 @@ class AniPlayApp(QMainWindow):
         
         # Botão página anterior
         prev_btn = QPushButton("← Anterior")
-        prev_btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px 16px;
-                background: #3a3a3a;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover:enabled {
-                background: #ff7b00;
-            }
-            QPushButton:disabled {
-                background: #2a2a2a;
-                color: #666;
-            }
-        """)
+        prev_btn.setProperty("variant", "pager")
         
         # Label da página atual
         page_label = QLabel(f"Página {self.current_search['page']} de {self.current_search['total_pages']}")
-        page_label.setStyleSheet("color: white; padding: 0 15px;")
+        page_label.setObjectName("page_label")
         
         # Botão próxima página
         next_btn = QPushButton("Próxima →")
-        next_btn.setStyleSheet(prev_btn.styleSheet())
+        next_btn.setProperty("variant", "pager")
         
         # Desabilitar botões quando necessário
         if self.current_search['page'] <= 1:
@@ -431,34 +415,28 @@ class AniPlayApp(QMainWindow):
         # Verifica se a página é válida
         if 1 <= new_page <= self.current_search['total_pages']:
             # Atualiza a busca com a nova página
-            search_anime_data = get_search_anime(self.current_search['term'], new_page)
+            self.run_search(self.current_search['term'], new_page, lambda data: self.on_page_results(new_page, data))
+
+    def on_page_results(self, new_page, search_anime_data):
+        if search_anime_data and search_anime_data["data"]["animes"]:
+            # Limpa resultados anteriores
+            self.clear_search_results()
+            self.hide_search_placeholder()
             
-            if search_anime_data and search_anime_data["data"]["animes"]:
-                # Limpa resultados anteriores
-                self.clear_search_results()
-                self.hide_search_placeholder()
-                
-                # Atualiza informações da busca atual
-                self.current_search['page'] = new_page
-                
-                # Mostra novos resultados
-                anime_results = search_anime_data["data"]["animes"]
-                results_section = self.create_anime_section("Resultados", convert_anime_data(anime_results))
-                self.search_content_layout.addWidget(results_section)  # CORREÇÃO AQUI
-                
-                # Adiciona controles de paginação atualizados
-                self.add_pagination_controls()
+            # Atualiza informações da busca atual
+            self.current_search['page'] = new_page
+            
+            # Mostra novos resultados
+            anime_results = search_anime_data["data"]["animes"]
+            results_section = self.create_anime_section("Resultados", convert_anime_data(anime_results), wrapping=True)
+            self.search_content_layout.addWidget(results_section, 1)
+            
+            # Adiciona controles de paginação atualizados
+            self.add_pagination_controls()
 
     def create_tabs(self):
         tabs_widget = QWidget()
-        tabs_widget.setStyleSheet("""
-            QWidget {
-                background: #2a2a2a;
-                border-radius: 10px;
-                padding: 5px;
-                margin-bottom: 20px;
-            }
-        """)
+        tabs_widget.setObjectName("tabs_bar")
 
         layout = QHBoxLayout()
         layout.setSpacing(5)
@@ -469,31 +447,11 @@ class AniPlayApp(QMainWindow):
         self.profile_tab = QPushButton("👤 Perfil")
         self.profile_tab.hide()  # Inicialmente escondido
 
-        # Estilização das abas (SEM flex)
-        tab_style = """
-            QPushButton {
-                padding: 12px 24px;
-                border-radius: 8px;
-                text-align: center;
-                border: none;
-                color: white;
-                background: transparent;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """
-
-        active_tab_style = """
-            QPushButton {
-                background: #ff7b00;
-                color: white;
-            }
-        """
-
-        self.home_tab.setStyleSheet(tab_style + active_tab_style)
-        self.search_tab.setStyleSheet(tab_style)
-        self.profile_tab.setStyleSheet(tab_style)
+        # Estilo das abas no tema; o estado ativo é uma propriedade dinâmica
+        for tab in (self.home_tab, self.search_tab, self.profile_tab):
+            tab.setProperty("variant", "tab")
+            tab.setProperty("active", False)
+        self.home_tab.setProperty("active", True)
 
         # Conectar clicks
         self.home_tab.clicked.connect(lambda: self.show_tab('home'))
@@ -526,12 +484,7 @@ class AniPlayApp(QMainWindow):
     def create_home_tab(self):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """)
+        self.home_scroll = scroll
 
         # Conteúdo principal
         self.home_container = QWidget()
@@ -541,13 +494,7 @@ class AniPlayApp(QMainWindow):
         # --- CARREGANDO (EXIBIDO ATÉ api_ready=True) ---
         self.loading_label = QLabel("Carregando")
         self.loading_label.setAlignment(Qt.AlignCenter)
-        self.loading_label.setStyleSheet("""
-            QLabel {
-                font-size: 32px;
-                color: #ff7b00;
-                padding: 50px;
-            }
-        """)
+        self.loading_label.setObjectName("loading_label")
 
         self.home_layout.addWidget(self.loading_label)
 
@@ -564,96 +511,42 @@ class AniPlayApp(QMainWindow):
         self.loading_dots = (self.loading_dots + 1) % 4
         self.loading_label.setText("Carregando" + "." * self.loading_dots)
 
-    def create_anime_card(self, anime):
-        """Cria um card de anime usando o novo componente modular"""
-        card = AnimeCard(anime, self.load_anime_poster_async)
-        return card
-
-    def create_anime_section(self, title, animes):
+    def create_anime_section(self, title, animes, wrapping=False):
         section = QWidget()
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 20)
 
         # Título da seção
         title_label = QLabel(title)
-        title_label.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                margin-bottom: 20px;
-                color: #ff7b00;
-                border-left: 4px solid #ff7b00;
-                padding-left: 15px;
-            }
-        """)
-
-        # Grid de animes
-        grid_widget = QWidget()
-        grid_layout = QHBoxLayout()
-        grid_layout.setSpacing(20)
-        grid_layout.setContentsMargins(0, 0, 0, 0)
-
-        for anime in animes[:10]:  # Limita a 10 animes por seção
-            card = self.create_anime_card(anime)
-            grid_layout.addWidget(card)
-
-        grid_widget.setLayout(grid_layout)
-
-        # Scroll horizontal para o grid
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setWidget(grid_widget)
-        scroll.setFixedHeight(370)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:horizontal {
-                background: #2a2a2a;
-                height: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #ff7b00;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #ff9500;
-            }
-        """)
+        title_label.setProperty("role", "section_title")
+
+        # Grade virtualizada: só os cards visíveis são pintados
+        grid = AnimeGridView(self.request_poster, wrapping=wrapping)
+        grid.set_animes(animes)
+        grid.anime_clicked.connect(self.show_anime_details)
 
         layout.addWidget(title_label)
-        layout.addWidget(scroll)
+        layout.addWidget(grid, 1)
         section.setLayout(layout)
         return section
 
+    def show_anime_details(self, anime):
+        # Importado no primeiro clique para não pesar na abertura da janela
+        from modules.ui.anime_details import AnimeDetailsDialog
+        dialog = AnimeDetailsDialog(anime, self.load_anime_poster_async, self)
+        dialog.exec()
+
     def create_search_tab(self):
         # Widget de scroll para a aba de busca
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-        """)
         
         # Widget de conteúdo - AGORA É ATRIBUTO DA CLASSE
         self.search_content_widget = QWidget()  # Mudei para atributo da classe
         self.search_content_layout = QVBoxLayout()  # Também como atributo
-        self.search_content_layout.setAlignment(Qt.AlignTop)
         
         message = QLabel("🔍 Digite algo na busca para encontrar animes")
-        message.setStyleSheet("""
-            QLabel {
-                text-align: center;
-                color: #888;
-                padding: 40px;
-                font-size: 16px;
-            }
-        """)
+        message.setProperty("role", "placeholder")
         message.setAlignment(Qt.AlignCenter)
 
         self.search_content_layout.addWidget(message)
@@ -668,57 +561,27 @@ class AniPlayApp(QMainWindow):
         layout.setAlignment(Qt.AlignCenter)
 
         message = QLabel("Faça login para ver seu perfil")
-        message.setStyleSheet("""
-            QLabel {
-                text-align: center;
-                padding: 40px;
-                color: #ff7b00;
-                font-size: 18px;
-            }
-        """)
+        message.setProperty("role", "profile_message")
 
         layout.addWidget(message)
         content.setLayout(layout)
         return content
 
     def show_tab(self, tab_name):
-        if tab_name == 'home':
-            self.content_stack.setCurrentIndex(0)
-            self.home_tab.setStyleSheet(self.get_tab_style(True))
-            self.search_tab.setStyleSheet(self.get_tab_style(False))
-            self.profile_tab.setStyleSheet(self.get_tab_style(False))
-        elif tab_name == 'search':
-            self.content_stack.setCurrentIndex(1)
-            self.home_tab.setStyleSheet(self.get_tab_style(False))
-            self.search_tab.setStyleSheet(self.get_tab_style(True))
-            self.profile_tab.setStyleSheet(self.get_tab_style(False))
-        elif tab_name == 'profile':
-            self.content_stack.setCurrentIndex(2)
-            self.home_tab.setStyleSheet(self.get_tab_style(False))
-            self.search_tab.setStyleSheet(self.get_tab_style(False))
-            self.profile_tab.setStyleSheet(self.get_tab_style(True))
-
-    def get_tab_style(self, active):
-        base_style = """
-            QPushButton {
-                padding: 12px 24px;
-                border-radius: 8px;
-                text-align: center;
-                border: none;
-                color: white;
-                background: transparent;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """
-        active_style = """
-            QPushButton {
-                background: #ff7b00;
-                color: white;
-            }
-        """
-        return base_style + (active_style if active else "")
+        tabs = {
+            'home': (0, self.home_tab),
+            'search': (1, self.search_tab),
+            'profile': (2, self.profile_tab)
+        }
+        if tab_name not in tabs:
+            return
+
+        index, active_tab = tabs[tab_name]
+        self.content_stack.setCurrentIndex(index)
+
+        # Só repolish das abas que mudaram de estado, sem reprocessar CSS
+        for _, tab in tabs.values():
+            set_style_state(tab, "active", tab is active_tab)
 
     def update_ui_after_login(self):
         """Atualiza a UI após o login bem-sucedido"""
@@ -749,7 +612,7 @@ class AniPlayApp(QMainWindow):
                 <p><strong>Email:</strong> {email}</p>
                 <p><strong>Membro desde:</strong> {datetime.datetime.now().strftime('%d/%m/%Y')}</p>
             """)
-            user_info.setStyleSheet("color: white; font-size: 14px;")
+            user_info.setObjectName("profile_info")
             
             profile_layout.addWidget(user_info)
             new_profile_widget.setLayout(profile_layout)
@@ -772,10 +635,11 @@ class AniPlayApp(QMainWindow):
         if reply == QMessageBox.Yes:
             self.auth_system.clear_session()
             
-            self.current_user = None
+            self.stop_watch_progress()
             if self.user_db:
-                self.user_db.close()
+                get_connection_manager().close_database(self.user_db)
                 self.user_db = None
+            self.current_user = None
             
             # Resetar UI usando o header modularizado
             self.header.update_user_info(None)
@@ -799,14 +663,7 @@ class AniPlayApp(QMainWindow):
         layout.setAlignment(Qt.AlignCenter)
 
         message = QLabel("Faça login para ver seu perfil")
-        message.setStyleSheet("""
-            QLabel {
-                text-align: center;
-                padding: 40px;
-                color: #ff7b00;
-                font-size: 18px;
-            }
-        """)
+        message.setProperty("role", "profile_message")
 
         layout.addWidget(message)
         self.profile_content.setLayout(layout)
@@ -818,12 +675,7 @@ class AniPlayApp(QMainWindow):
         auth_dialog.setWindowTitle("AniPlay - Autenticação")
         auth_dialog.setModal(True)
         auth_dialog.resize(400, 500)
-        auth_dialog.setStyleSheet("""
-            QDialog {
-                background: #2a2a2a;
-                border-radius: 10px;
-            }
-        """)
+        auth_dialog.setObjectName("auth_dialog")
         
         # Criar o AuthWidget dentro do diálogo
         auth_widget = AuthWidget(self.auth_system, lambda token: self.on_auth_success(token, auth_dialog))
@@ -853,13 +705,13 @@ class AniPlayApp(QMainWindow):
     def load_user_data(self):
         try:
             user_id = self.current_user['user_id']
-            user_db_path = self.auth_system.get_app_data_path() / f"user_{user_id}.db"
+            # Nome do banco pessoal; cada thread pega a sua conexão no gerenciador
+            self.user_db = user_db_name(user_id)
+            self.stop_watch_progress()
+            set_watch_progress(WatchProgressStore(user_id))
             
-            self.user_db = sqlite3.connect(user_db_path)
-            
-            cursor = self.user_db.cursor()
-            cursor.execute("SELECT theme, language FROM preferences WHERE user_id = ?", (user_id,))
-            prefs = cursor.fetchone()
+            conn = get_connection_manager().connection(self.user_db)
+            prefs = conn.execute("SELECT theme, language FROM preferences WHERE user_id = ?", (user_id,)).fetchone()
             
             if prefs:
                 theme, language = prefs
@@ -868,6 +720,13 @@ class AniPlayApp(QMainWindow):
         except Exception as e:
             logger.error(f"❌ Erro ao carregar dados do usuário: {e}")
 
+    def stop_watch_progress(self):
+        """Grava o progresso pendente e encerra a fila do usuário atual"""
+        store = get_watch_progress()
+        if store:
+            store.stop()
+            set_watch_progress(None)
+
     def setup_logger(self):
         logger.remove()
 
@@ -884,26 +743,26 @@ class AniPlayApp(QMainWindow):
         def start_api():
             api_path = Path(__file__).parent.parent.parent / "aniwatch-api"
             
-            if api_path.exists():
-                logger.info(f"Executando npm start em: {api_path}")
-                self.api_process = subprocess.Popen(
-                    "npm start", 
-                    cwd=str(api_path), 
-                    shell=True
-                )
-                logger.info("🚀 Processo da API iniciado")
-                
-                self.start_api_monitoring()
-            else:
+            if not api_path.exists():
                 logger.error(f"❌ Diretório não encontrado: {api_path}")
-        
-        threading.Thread(target=start_api, daemon=True).start()
+                return False
+            
+            logger.info(f"Executando npm start em: {api_path}")
+            self.api_process = subprocess.Popen(
+                "npm start", 
+                cwd=str(api_path), 
+                shell=True
+            )
+            logger.info("🚀 Processo da API iniciado")
+            return True
+        
+        run_task(start_api, priority=PRIORITY_SERVICES).then(
+            lambda started: started and self.start_api_monitoring()
+        )
 
     def start_api_monitoring(self):
         self.server_monitor = ServerMonitor()
-        self.server_monitor.wait_for_server(
-            lambda ready: self.api_ready_signal.emit(ready)
-        )
+        self.server_monitor.wait_for_server(owner=self).then(self.on_api_status_changed)
 
     @Slot(bool)
     def on_api_status_changed(self, is_ready):
@@ -911,23 +770,37 @@ class AniPlayApp(QMainWindow):
             self.on_api_ready()
   
     def on_api_ready(self):
+        self.profiler.mark("api_ready")
         self.cache_manager.pending_images.clear()
-
-         # Para animação
+        self.poster_callbacks.clear()
+
+        # Seções são montadas em fatias, começando pelas visíveis
+        if self.home:
+            self.home.stop()
+        self.home = Home(self.home_layout, self.create_anime_section, self.home_scroll)
+        self.home.loaded.connect(self.on_home_loaded)
+        self.home.load_failed.connect(self.on_home_load_failed)
+
+    def on_home_loaded(self):
+        self.profiler.mark("home_data_loaded")
+        # Para animação (o Home já removeu o label do layout)
         self.loading_timer.stop()
-        self.loading_label.hide()
 
-        home_sections = Home(self.home_layout, self.create_anime_section)
+    def on_home_load_failed(self, error):
+        self.loading_timer.stop()
+        self.loading_label.setText("❌ Não foi possível carregar a página inicial")
 
     def closeEvent(self, event):
         # Log do tamanho do cache ao fechar
         cache_size = self.cache_manager.get_cache_size()
         logger.info(f"💾 Cache final: {cache_size:.2f} MB")
         
-        # Limpa o thread pool
-        self.thread_pool.clear()
-        self.thread_pool.waitForDone(3000)
+        # Cancela as tarefas pendentes e espera os executores
+        get_task_manager().shutdown()
         
-        if self.user_db:
-            self.user_db.close()
+        self.stop_watch_progress()
+        get_connection_manager().close_all()
+        # Import tardio: http.server só entra no processo quando algo é reproduzido
+        from modules.streaming.local_server import stop_stream_server
+        stop_stream_server()
         event.accept()
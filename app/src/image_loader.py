@@ -1,94 +1,82 @@
 import requests
-import os
 from pathlib import Path
-from PySide6.QtCore import QRunnable, QThreadPool, Signal, QObject, Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
 from loguru import logger
 
-class ImageSignals(QObject):
-    image_loaded = Signal(str, QPixmap)
-    image_failed = Signal(str, str)
+POSTER_SIZE = (200, 280)
 
-class ImageLoader(QRunnable):
-    def __init__(self, anime_id, image_url, cache_dir):
-        super().__init__()
-        self.anime_id = anime_id
-        self.image_url = image_url
-        self.cache_dir = cache_dir
-        self.signals = ImageSignals()
-        self.setAutoDelete(True)
+# Roda nos executores de tarefas: usa QImage, pois QPixmap só pode ser
+# criado na thread da interface (a conversão é feita no callback)
 
-    def get_cache_path(self):
-        extension = Path(self.image_url).suffix.lower()
+def get_cache_path(anime_id, image_url, cache_dir):
+    extension = Path(image_url).suffix.lower()
 
-        if extension not in [".jpg", ".jpeg", ".png", ".webp"]:
-            extension = ".jpg"
+    if extension not in [".jpg", ".jpeg", ".png", ".webp"]:
+        extension = ".jpg"
 
-        return self.cache_dir / f"{self.anime_id}{extension}"
+    return cache_dir / f"{anime_id}{extension}"
 
-    def load_from_cache(self):
-        cache_path = self.get_cache_path()
-        if cache_path.exists():
-            try:
-                file_size = cache_path.stat().st_size
-                if file_size < 1024:
-                    logger.warning(f"🗑️ Cache muito pequeno, removendo: {cache_path}")
-                    cache_path.unlink()
-                    return None
-                    
-                pixmap = QPixmap(str(cache_path))
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(200, 280, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                    logger.debug(f"✅ Cache válido: {cache_path.name}, tamanho: {pixmap.width()}x{pixmap.height()}")
-                    return scaled_pixmap
-                else:
-                    logger.warning(f"❌ Cache corrompido (pixmap isNull): {cache_path}")
-                    cache_path.unlink()
-            except Exception as e:
-                logger.warning(f"❌ Erro ao carregar cache {cache_path}: {e}")
-                try:
-                    cache_path.unlink()
-                except:
-                    pass
-        return None
+def scale_poster(image):
+    return image.scaled(*POSTER_SIZE, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
 
-    def save_to_cache(self, image_data):
+def load_from_cache(anime_id, image_url, cache_dir):
+    cache_path = get_cache_path(anime_id, image_url, cache_dir)
+    if cache_path.exists():
         try:
-            cache_path = self.get_cache_path()
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, 'wb') as f:
-                f.write(image_data)
-            logger.debug(f"💾 Imagem salva em cache: {cache_path}")
-        except Exception as e:
-            logger.warning(f"❌ Erro ao salvar cache {cache_path}: {e}")
-
-    def run(self):
-        cached_pixmap = self.load_from_cache()
-        if cached_pixmap:
-            logger.debug(f"💾 Cache HIT: {self.anime_id}")
-            self.signals.image_loaded.emit(self.anime_id, cached_pixmap)
-            return
-        else:
-            cache_path = self.get_cache_path()
-            logger.debug(f"💾 Cache MISS: {self.anime_id} - {cache_path}")
-
-        try:
-            logger.debug(f"🌐 Baixando: {self.anime_id} - {self.image_url}")
-            response = requests.get(self.image_url, timeout=10)
-            if response.status_code == 200:
-                self.save_to_cache(response.content)
+            file_size = cache_path.stat().st_size
+            if file_size < 1024:
+                logger.warning(f"🗑️ Cache muito pequeno, removendo: {cache_path}")
+                cache_path.unlink()
+                return None
                 
-                pixmap = QPixmap()
-                if pixmap.loadFromData(response.content):
-                    scaled_pixmap = pixmap.scaled(200, 280, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                    self.signals.image_loaded.emit(self.anime_id, scaled_pixmap)
-                    logger.debug(f"✅ Imagem carregada: {self.anime_id}")
-                else:
-                    logger.error(f"❌ Falha ao carregar dados da imagem: {self.anime_id}")
-                    self.signals.image_failed.emit(self.anime_id, "Falha ao carregar dados da imagem")
+            image = QImage(str(cache_path))
+            if not image.isNull():
+                logger.debug(f"✅ Cache válido: {cache_path.name}, tamanho: {image.width()}x{image.height()}")
+                return scale_poster(image)
             else:
-                logger.error(f"❌ HTTP {response.status_code} para {self.anime_id}")
-                self.signals.image_failed.emit(self.anime_id, f"HTTP {response.status_code}")
+                logger.warning(f"❌ Cache corrompido (imagem nula): {cache_path}")
+                cache_path.unlink()
         except Exception as e:
-            logger.error(f"❌ Exception para {self.anime_id}: {e}")
-            self.signals.image_failed.emit(self.anime_id, str(e))
\ No newline at end of file
+            logger.warning(f"❌ Erro ao carregar cache {cache_path}: {e}")
+            try:
+                cache_path.unlink()
+            except:
+                pass
+    return None
+
+def save_to_cache(cache_path, image_data):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            f.write(image_data)
+        logger.debug(f"💾 Imagem salva em cache: {cache_path}")
+    except Exception as e:
+        logger.warning(f"❌ Erro ao salvar cache {cache_path}: {e}")
+
+def load_poster_image(anime_id, image_url, cache_dir):
+    """Carrega o poster do cache de disco ou da rede e retorna um QImage já redimensionado
+
+    Lança exceção em caso de falha (vira o sinal failed da tarefa).
+    """
+    cached_image = load_from_cache(anime_id, image_url, cache_dir)
+    if cached_image:
+        logger.debug(f"💾 Cache HIT: {anime_id}")
+        return cached_image
+
+    cache_path = get_cache_path(anime_id, image_url, cache_dir)
+    logger.debug(f"💾 Cache MISS: {anime_id} - {cache_path}")
+
+    logger.debug(f"🌐 Baixando: {anime_id} - {image_url}")
+    response = requests.get(image_url, timeout=10)
+    if response.status_code != 200:
+        raise RuntimeError(f"HTTP {response.status_code}")
+
+    save_to_cache(cache_path, response.content)
+
+    image = QImage()
+    if not image.loadFromData(response.content):
+        raise RuntimeError("Falha ao carregar dados da imagem")
+
+    logger.debug(f"✅ Imagem carregada: {anime_id}")
+    return scale_poster(image)
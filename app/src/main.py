@@ -1,34 +1,40 @@
 import sys
 import ctypes
+
+# O profiler vem antes de tudo: os imports abaixo entram no relatório
+from modules.profiling.startup_profiler import get_startup_profiler
+profiler = get_startup_profiler()
+profiler.start_import_tracking()
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon, QFont
 
-from app import AniPlayApp
+with profiler.phase("import_app"):
+    from app import AniPlayApp
+from styles.theme import apply_theme
 
 import os
 os.environ["QT_MULTIMEDIA_BACKEND"] = "ffmpeg"  # Força usar ffmpeg
 os.environ["QT_OPENGL"] = "software"  # Desativa OpenGL
 os.environ["QMLSCENE_DEVICE"] = "softwarecontext"  # Contexto software
-os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = (
-    "--disable-gpu "
-    "--disable-software-rasterizer "
-    "--disable-webgl "
-    "--disable-gpu-compositing "
-    "--disable-gpu-rasterization "
-    "--use-angle=swiftshader"
-)
 
 
 def main():
     myappid = 'thrillerempress.aniplay_app'
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
 
-    app = QApplication(sys.argv)
-    font = QFont("Arial", 10)
-    app.setFont(font)
-    app.setWindowIcon(QIcon("./icon.ico"))
-    aniplay = AniPlayApp()
-    aniplay.showMaximized()
+    with profiler.phase("qt_application"):
+        app = QApplication(sys.argv)
+        font = QFont("Arial", 10)
+        app.setFont(font)
+        app.setWindowIcon(QIcon("./icon.ico"))
+    with profiler.phase("apply_theme"):
+        apply_theme(app)
+    with profiler.phase("main_window"):
+        aniplay = AniPlayApp()
+    profiler.mark_on_first_paint(aniplay, "window_shown")
+    with profiler.phase("show_window"):
+        aniplay.showMaximized()
     sys.exit(app.exec())
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
 import requests
 from loguru import logger
 
+# Sem timeout uma requisição travada prende a thread do executor para sempre
+REQUEST_TIMEOUT = 15
+
 def get_anime_by_name(anime_name):
     """
     Busca anime por nome usando a API do AniList
@@ -35,7 +38,7 @@ def get_anime_by_name(anime_name):
         response = requests.post('https://graphql.anilist.co', json={
             'query': query,
             'variables': variables
-        })
+        }, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -106,7 +109,7 @@ def get_anime_by_id(anime_id):
     response = requests.post('https://graphql.anilist.co', json={
         'query': query,
         'variables': variables
-    })
+    }, timeout=REQUEST_TIMEOUT)
     
     return response.json()
 
@@ -114,7 +117,7 @@ def get_anime_episodes(anime_id):
     try:
         url = f"http://localhost:4000/api/v2/hianime/anime/{anime_id}/episodes"
         
-        response = requests.get(url)
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -132,7 +135,7 @@ def get_search_anime(search, page=1):
     try:
         url = f"http://localhost:4000/api/v2/hianime/search?q={search}&page={page}"
         
-        response = requests.get(url)
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -150,7 +153,7 @@ def get_animes_home_page():
     try:
         url = f"http://localhost:4000/api/v2/hianime/home"
         
-        response = requests.get(url)
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
@@ -168,7 +171,7 @@ def get_anime_info(anime_id):
     try:
         url = f"http://localhost:4000/api/v2/hianime/anime/{anime_id}"
         
-        response = requests.get(url)
+        response = requests.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             data = response.json()
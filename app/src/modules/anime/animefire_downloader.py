@@ -1,12 +1,15 @@
 import os
 import requests
-from bs4 import BeautifulSoup
 import re
 import time
-import re
 import unicodedata
 from loguru import logger
 
+def parse_html(html):
+    # BeautifulSoup custa caro para importar e só é usado ao abrir um episódio
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, 'html.parser')
+
 class AnimeFireDownloader:
     def __init__(self, qualidade_desejada='F-HD', baixar_todas_qualidades=False, intervalo_entre_downloads=20):
         """
@@ -28,7 +31,7 @@ class AnimeFireDownloader:
         """
         logger.info("🔎 Analisando HTML em busca de links de streaming...")
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parse_html(html)
         streaming_links = {}
         
         # 1. Procura por tags de vídeo
@@ -76,25 +79,45 @@ class AnimeFireDownloader:
         logger.info(f"📊 Total de links de streaming encontrados: {len(streaming_links)}")
         return streaming_links
 
-    def obter_links_streaming_episodio(self, link_episodio):
+    def obter_links_streaming_episodio(self, link_episodio, callback_progresso=None, evento_cancelamento=None):
         """
         Obtém links de streaming para um episódio.
         
         Args:
             link_episodio (str): Link do episódio no AnimeFire
+            callback_progresso (callable): Recebe mensagens de progresso (opcional)
+            evento_cancelamento (threading.Event): Interrompe a busca entre as etapas (opcional)
             
         Returns:
             dict: Informações de streaming
         """
         logger.info(f"🔍 Buscando links de streaming para: {link_episodio}")
         
+        def progresso(mensagem):
+            if callback_progresso:
+                callback_progresso(mensagem)
+        
+        def cancelado():
+            return evento_cancelamento is not None and evento_cancelamento.is_set()
+        
+        resultado_cancelado = {
+            'success': False,
+            'cancelled': True,
+            'error': 'Busca cancelada'
+        }
+        
         try:
             # Primeiro: tenta acessar a página do episódio diretamente
             logger.info(f"📡 Acessando página do episódio...")
+            progresso("Acessando página do episódio...")
             response = requests.get(link_episodio, timeout=10)
             logger.info(f"📄 Status da página do episódio: {response.status_code}")
             
+            if cancelado():
+                return resultado_cancelado
+            
             if response.status_code == 200:
+                progresso("Procurando links de vídeo...")
                 streaming_links = self.extrair_links_streaming(response.text)
                 logger.info(f"🔗 Links encontrados na página do episódio: {list(streaming_links.keys())}")
                 
@@ -108,10 +131,15 @@ class AnimeFireDownloader:
                         link_download = self.modificar_link_para_download(nome_obra, numero_episodio)
                         logger.info(f"📥 Link de download: {link_download}")
                         
+                        progresso("Acessando página de download...")
                         download_response = requests.get(link_download, timeout=10)
                         logger.info(f"📄 Status da página de download: {download_response.status_code}")
                         
+                        if cancelado():
+                            return resultado_cancelado
+                        
                         if download_response.status_code == 200:
+                            progresso("Procurando links de vídeo...")
                             streaming_links = self.extrair_links_streaming(download_response.text)
                             logger.info(f"🔗 Links encontrados na página de download: {list(streaming_links.keys())}")
                         else:
@@ -232,7 +260,7 @@ class AnimeFireDownloader:
         Returns:
             dict: Dicionário com as qualidades como chaves e links como valores
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = parse_html(html)
         links = {}
         qualidade_tags = soup.find_all('a', href=True)
         
@@ -243,27 +271,38 @@ class AnimeFireDownloader:
                 
         return links
     
-    def baixar_video(self, url, caminho_do_arquivo):
+    def baixar_video(self, url, caminho_do_arquivo, evento_cancelamento=None):
         """
         Baixa e salva o vídeo no caminho especificado.
         
         Args:
             url (str): URL do vídeo para download
             caminho_do_arquivo (str): Caminho onde o arquivo será salvo
+            evento_cancelamento (threading.Event, opcional): Interrompe o download entre os blocos
             
         Returns:
             bool: True se o download foi bem-sucedido, False caso contrário
         """
         try:
-            resposta = requests.get(url, stream=True)
+            # Timeout de conexão e de leitura entre blocos, não do download inteiro
+            resposta = requests.get(url, stream=True, timeout=(10, 30))
             if resposta.status_code == 200:
                 os.makedirs(os.path.dirname(caminho_do_arquivo), exist_ok=True)
                 
                 with open(caminho_do_arquivo, 'wb') as f:
                     for chunk in resposta.iter_content(chunk_size=8192):
+                        if evento_cancelamento and evento_cancelamento.is_set():
+                            break
                         if chunk:
                             f.write(chunk)
                 
+                if evento_cancelamento and evento_cancelamento.is_set():
+                    # Não deixa um arquivo pela metade com cara de completo
+                    resposta.close()
+                    os.remove(caminho_do_arquivo)
+                    print(f'⏹️ Download cancelado: {caminho_do_arquivo}')
+                    return False
+                
                 print(f'✅ Vídeo salvo em: {caminho_do_arquivo}')
                 return True
             else:
@@ -329,7 +368,7 @@ class AnimeFireDownloader:
         
         # Fazendo a requisição à página de download
         try:
-            response = requests.get(link_download)
+            response = requests.get(link_download, timeout=10)
             if response.status_code == 200:
                 # Extraindo links das qualidades disponíveis
                 links_de_qualidade = self.extrair_links_de_qualidade(response.text)
@@ -1,54 +1,46 @@
 import sqlite3
 import re
-from pathlib import Path
-from passlib.context import CryptContext
 import jwt
 import datetime
 from loguru import logger
 import json
 
+from modules.auth.password_hasher import PasswordHasher
+from modules.database.connection_manager import (get_connection_manager, get_app_data_path,
+                                                 user_db_name, USERS_DB)
+from modules.database.migrations import migrate_user_database
+
 class AuthSystem:
     def __init__(self):
-        self.pwd_context = CryptContext(
-            schemes=["sha256_crypt"],
-            deprecated="auto",
-            sha256_crypt__default_rounds=30000
-        )
         self.secret_key = "0132456789ABCDEF"
+        self.db = get_connection_manager()
+        # Criado no primeiro login/cadastro: abrir o app não gera nenhum hash
+        self._hasher = None
         self.setup_database()
-        logger.info("✅ Sistema de auth inicializado com SHA256")
+        logger.info("✅ Sistema de auth inicializado")
 
-        try:
-            self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-            test_hash = self.pwd_context.hash("test")
-            logger.info("Backend bcrypt carregado com sucesso")
-        except Exception as e:
-            logger.warning(f"bcrypt não disponível: {e}, usando sha256_crypt")
-            self.pwd_context = CryptContext(schemes=["sha256_crypt"], deprecated="auto")
+    @property
+    def hasher(self):
+        if self._hasher is None:
+            self._hasher = PasswordHasher(self.get_app_data_path() / "auth_settings.json")
+        return self._hasher
     
     def setup_database(self):
-        db_path = self.get_app_data_path() / "users.db"
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        with self.db.transaction(USERS_DB) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    email TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
         
-        conn.commit()
-        conn.close()
         logger.info("Banco de dados de usuários inicializado")
     
     def get_app_data_path(self):
-        app_data = Path.home() / "AppData" / "Local" / "AniPlay"
-        app_data.mkdir(exist_ok=True)
-        return app_data
+        return get_app_data_path()
     
     def validate_email(self, email):
         pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
@@ -62,21 +54,32 @@ class AuthSystem:
         try:
             if len(password) > 72:
                 logger.warning("Senha muito longa, truncando para 72 caracteres")
-                password = password[:72]
-            return self.pwd_context.hash(password)
+            return self.hasher.hash(password)
         except Exception as e:
             logger.error(f"Erro ao fazer hash da senha: {e}")
             raise
     
     def verify_password(self, password, hashed):
         try:
-            if len(password) > 72:
-                password = password[:72]
-            return self.pwd_context.verify(password, hashed)
+            return self.hasher.verify(password, hashed)
         except Exception as e:
             logger.error(f"Erro ao verificar senha: {e}")
             return False
     
+    def rehash_if_needed(self, user_id, password, hashed):
+        """Atualiza o hash salvo se o esquema ou o custo ficaram para trás"""
+        try:
+            if not self.hasher.needs_rehash(hashed):
+                return
+            
+            new_hash = self.hash_password(password)
+            with self.db.transaction(USERS_DB) as conn:
+                conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", (new_hash, user_id))
+            logger.info(f"🔐 Hash da senha do usuário {user_id} atualizado")
+        except Exception as e:
+            # O login continua válido mesmo se a atualização falhar
+            logger.error(f"❌ Erro ao atualizar hash da senha: {e}")
+    
     def register_user(self, username, email, password):
         try:
             if not self.validate_username(username):
@@ -88,25 +91,21 @@ class AuthSystem:
             if len(password) < 6:
                 return False, "Senha deve ter pelo menos 6 caracteres"
             
-            db_path = self.get_app_data_path() / "users.db"
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT id FROM users WHERE username = ? OR email = ?", 
-                         (username, email))
-            if cursor.fetchone():
+            conn = self.db.connection(USERS_DB)
+            existing = conn.execute("SELECT id FROM users WHERE username = ? OR email = ?", 
+                                    (username, email)).fetchone()
+            if existing:
                 return False, "Usuário ou email já existe"
             
+            # O hash fica fora da transação: não segura o lock de escrita do banco
             password_hash = self.hash_password(password)
             
-            cursor.execute(
-                "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
-                (username, email, password_hash)
-            )
-            
-            conn.commit()
-            user_id = cursor.lastrowid
-            conn.close()
+            with self.db.transaction(USERS_DB) as conn:
+                cursor = conn.execute(
+                    "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
+                    (username, email, password_hash)
+                )
+                user_id = cursor.lastrowid
             
             self.create_user_database(user_id)
             
@@ -121,16 +120,10 @@ class AuthSystem:
     
     def login_user(self, username, password):
         try:
-            db_path = self.get_app_data_path() / "users.db"
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            result = self.db.connection(USERS_DB).execute(
                 "SELECT id, username, password_hash FROM users WHERE username = ?", 
                 (username,)
-            )
-            result = cursor.fetchone()
-            conn.close()
+            ).fetchone()
             
             if not result:
                 return False, "Usuário não encontrado"
@@ -138,6 +131,8 @@ class AuthSystem:
             user_id, db_username, password_hash = result
             
             if self.verify_password(password, password_hash):
+                self.rehash_if_needed(user_id, password, password_hash)
+                
                 token = jwt.encode({
                     'user_id': user_id,
                     'username': db_username,
@@ -156,56 +151,9 @@ class AuthSystem:
     def create_user_database(self, user_id):
         """Cria banco de dados pessoal para o usuário"""
         try:
-            user_db_path = self.get_app_data_path() / f"user_{user_id}.db"
-            conn = sqlite3.connect(user_db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS preferences (
-                    user_id INTEGER PRIMARY KEY,
-                    theme TEXT DEFAULT 'dark',
-                    language TEXT DEFAULT 'pt-BR',
-                    auto_play INTEGER DEFAULT 1,
-                    default_quality TEXT DEFAULT '1080p',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS favorites (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,  -- 🔥 COLUNA ADICIONADA
-                    anime_id TEXT NOT NULL,
-                    anime_title TEXT NOT NULL,
-                    anime_image TEXT,
-                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES preferences (user_id),
-                    UNIQUE(user_id, anime_id)
-                )
-            ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS watch_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,  -- 🔥 COLUNA ADICIONADA
-                    anime_id TEXT NOT NULL,
-                    anime_title TEXT NOT NULL,
-                    episode_number INTEGER,
-                    episode_title TEXT,
-                    progress_seconds INTEGER DEFAULT 0,
-                    total_seconds INTEGER DEFAULT 0,
-                    watched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES preferences (user_id)
-                )
-            ''')
-            
-            cursor.execute(
-                "INSERT OR IGNORE INTO preferences (user_id) VALUES (?)",
-                (user_id,)
-            )
-            
-            conn.commit()
-            conn.close()
+            with self.db.transaction(user_db_name(user_id)) as conn:
+                self.create_user_tables(conn, user_id)
+            migrate_user_database(self.db.connection(user_db_name(user_id)))
             logger.info(f"✅ Banco de dados do usuário {user_id} criado com sucesso")
             
         except Exception as e:
@@ -213,6 +161,53 @@ class AuthSystem:
             import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
     
+    def create_user_tables(self, conn, user_id):
+        """Cria as tabelas do banco pessoal (dentro da transação de quem chama)"""
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS preferences (
+                user_id INTEGER PRIMARY KEY,
+                theme TEXT DEFAULT 'dark',
+                language TEXT DEFAULT 'pt-BR',
+                auto_play INTEGER DEFAULT 1,
+                default_quality TEXT DEFAULT '1080p',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS favorites (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,  -- 🔥 COLUNA ADICIONADA
+                anime_id TEXT NOT NULL,
+                anime_title TEXT NOT NULL,
+                anime_image TEXT,
+                added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES preferences (user_id),
+                UNIQUE(user_id, anime_id)
+            )
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS watch_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,  -- 🔥 COLUNA ADICIONADA
+                anime_id TEXT NOT NULL,
+                anime_title TEXT NOT NULL,
+                episode_number INTEGER,
+                episode_title TEXT,
+                progress_seconds INTEGER DEFAULT 0,
+                total_seconds INTEGER DEFAULT 0,
+                watched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES preferences (user_id)
+            )
+        ''')
+        
+        cursor.execute(
+            "INSERT OR IGNORE INTO preferences (user_id) VALUES (?)",
+            (user_id,)
+        )
+    
     def verify_token(self, token):
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=['HS256'])
@@ -290,16 +285,10 @@ class AuthSystem:
 
     def get_user_info(self, user_id):
         try:
-            db_path = self.get_app_data_path() / "users.db"
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            result = self.db.connection(USERS_DB).execute(
                 "SELECT username, email FROM users WHERE id = ?", 
                 (user_id,)
-            )
-            result = cursor.fetchone()
-            conn.close()
+            ).fetchone()
             
             if result:
                 username, email = result
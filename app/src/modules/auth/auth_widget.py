@@ -3,6 +3,9 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QPushButton,
 from PySide6.QtCore import Qt
 from loguru import logger
 
+from modules.tasks.task_manager import run_task, PRIORITY_INTERACTIVE
+from styles.theme import set_style_state
+
 class AuthWidget(QWidget):
     def __init__(self, auth_system, on_login_success):
         super().__init__()
@@ -26,14 +29,7 @@ class AuthWidget(QWidget):
         # Título do AniPlay (igual ao HTML)
         title = QLabel("🎬 AniPlay")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 36px;
-                margin-bottom: 20px;
-                color: #ff7b00;
-                font-weight: bold;
-            }
-        """)
+        title.setObjectName("auth_title")
         container_layout.addWidget(title)
         
         # Abas de autenticação
@@ -45,30 +41,11 @@ class AuthWidget(QWidget):
         self.login_tab_btn = QPushButton("Entrar")
         self.register_tab_btn = QPushButton("Cadastrar")
         
-        # Estilização das abas
-        tab_style = """
-            QPushButton {
-                padding: 12px 24px;
-                border: none;
-                color: white;
-                background: transparent;
-                border-bottom: 2px solid transparent;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """
-        
-        active_tab_style = """
-            QPushButton {
-                border-bottom: 2px solid #ff7b00;
-                color: #ff7b00;
-            }
-        """
-        
-        self.login_tab_btn.setStyleSheet(tab_style + active_tab_style)
-        self.register_tab_btn.setStyleSheet(tab_style)
+        # Estilo das abas no tema; o estado ativo é uma propriedade dinâmica
+        self.login_tab_btn.setProperty("variant", "auth_tab")
+        self.register_tab_btn.setProperty("variant", "auth_tab")
+        self.login_tab_btn.setProperty("active", True)
+        self.register_tab_btn.setProperty("active", False)
         
         self.login_tab_btn.clicked.connect(self.show_login)
         self.register_tab_btn.clicked.connect(self.show_register)
@@ -88,18 +65,6 @@ class AuthWidget(QWidget):
         main_layout.addWidget(self.container)
         self.setLayout(main_layout)
         
-        # Aplicar estilo geral
-        self.setStyleSheet("""
-            QWidget {
-                background: #1a1a1a;
-                color: white;
-            }
-            QFrame#auth_container {
-                background: #2a2a2a;
-                border-radius: 10px;
-            }
-        """)
-        
         # Telas de login e registro
         self.login_widget = self.create_login_widget()
         self.stacked_layout.addWidget(self.login_widget)
@@ -118,61 +83,18 @@ class AuthWidget(QWidget):
         # Campos de input
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Email ou Username:")
-        self.username_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.username_input.setMinimumHeight(45)
         layout.addWidget(self.username_input)
         
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Senha:")
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.password_input.setMinimumHeight(45)
         layout.addWidget(self.password_input)
         
         # Botão de login
         self.login_btn = QPushButton("Entrar")
-        self.login_btn.setStyleSheet("""
-            QPushButton {
-                padding: 12px;
-                background: #ff7b00;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #ff9500;
-            }
-            QPushButton:disabled {
-                background: #666;
-                color: #999;
-            }
-        """)
+        self.login_btn.setProperty("variant", "submit")
         self.login_btn.setMinimumHeight(45)
         self.login_btn.clicked.connect(self.handle_login)
         layout.addWidget(self.login_btn)
@@ -180,21 +102,10 @@ class AuthWidget(QWidget):
         # Link para cadastro
         switch_layout = QHBoxLayout()
         switch_label = QLabel("Não tem conta?")
-        switch_label.setStyleSheet("color: #ccc;")
+        switch_label.setProperty("role", "switch_label")
         
         self.switch_to_register_btn = QPushButton("Cadastre-se")
-        self.switch_to_register_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #ff7b00;
-                border: none;
-                text-decoration: underline;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                color: #ff9500;
-            }
-        """)
+        self.switch_to_register_btn.setProperty("variant", "link")
         self.switch_to_register_btn.clicked.connect(self.show_register)
         
         switch_layout.addWidget(switch_label)
@@ -214,98 +125,29 @@ class AuthWidget(QWidget):
         # Campos de registro
         self.reg_username_input = QLineEdit()
         self.reg_username_input.setPlaceholderText("Username:")
-        self.reg_username_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.reg_username_input.setMinimumHeight(45)
         layout.addWidget(self.reg_username_input)
         
         self.reg_email_input = QLineEdit()
         self.reg_email_input.setPlaceholderText("Email:")
-        self.reg_email_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.reg_email_input.setMinimumHeight(45)
         layout.addWidget(self.reg_email_input)
         
         self.reg_password_input = QLineEdit()
         self.reg_password_input.setPlaceholderText("Senha:")
         self.reg_password_input.setEchoMode(QLineEdit.Password)
-        self.reg_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.reg_password_input.setMinimumHeight(45)
         layout.addWidget(self.reg_password_input)
         
         self.reg_confirm_password_input = QLineEdit()
         self.reg_confirm_password_input.setPlaceholderText("Confirmar Senha:")
         self.reg_confirm_password_input.setEchoMode(QLineEdit.Password)
-        self.reg_confirm_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                background: #3a3a3a;
-                color: white;
-                border: 1px solid #444;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border-color: #ff7b00;
-            }
-        """)
         self.reg_confirm_password_input.setMinimumHeight(45)
         layout.addWidget(self.reg_confirm_password_input)
         
         # Botão de registro
         self.register_confirm_btn = QPushButton("Cadastrar")
-        self.register_confirm_btn.setStyleSheet("""
-            QPushButton {
-                padding: 12px;
-                background: #ff7b00;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #ff9500;
-            }
-            QPushButton:disabled {
-                background: #666;
-                color: #999;
-            }
-        """)
+        self.register_confirm_btn.setProperty("variant", "submit")
         self.register_confirm_btn.setMinimumHeight(45)
         self.register_confirm_btn.clicked.connect(self.handle_register)
         layout.addWidget(self.register_confirm_btn)
@@ -313,21 +155,10 @@ class AuthWidget(QWidget):
         # Link para login
         switch_layout = QHBoxLayout()
         switch_label = QLabel("Já tem conta?")
-        switch_label.setStyleSheet("color: #ccc;")
+        switch_label.setProperty("role", "switch_label")
         
         self.switch_to_login_btn = QPushButton("Faça login")
-        self.switch_to_login_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #ff7b00;
-                border: none;
-                text-decoration: underline;
-                padding: 5px;
-            }
-            QPushButton:hover {
-                color: #ff9500;
-            }
-        """)
+        self.switch_to_login_btn.setProperty("variant", "link")
         self.switch_to_login_btn.clicked.connect(self.show_login)
         
         switch_layout.addWidget(switch_label)
@@ -346,13 +177,17 @@ class AuthWidget(QWidget):
             self.show_message("Atenção", "Por favor, preencha todos os campos.", "warning")
             return
         
-        self.login_btn.setText("Entrando...")
-        self.login_btn.setEnabled(False)
-        
-        success, result = self.auth_system.login_user(username, password)
+        self.set_busy(self.login_btn, "Entrando...")
         
-        self.login_btn.setText("Entrar")
-        self.login_btn.setEnabled(True)
+        # bcrypt e SQLite rodam fora da thread da interface
+        run_task(
+            self.auth_system.login_user, username, password,
+            priority=PRIORITY_INTERACTIVE, owner=self
+        ).then(self.on_login_finished, lambda error: self.on_login_finished((False, error)))
+    
+    def on_login_finished(self, outcome):
+        success, result = outcome
+        self.set_idle(self.login_btn, "Entrar")
         
         if success:
             self.on_login_success(result)
@@ -381,13 +216,16 @@ class AuthWidget(QWidget):
             self.show_message("Erro", "O usuário deve ter pelo menos 3 caracteres.", "error")
             return
         
-        self.register_confirm_btn.setText("Cadastrando...")
-        self.register_confirm_btn.setEnabled(False)
-        
-        success, result = self.auth_system.register_user(username, email, password)
+        self.set_busy(self.register_confirm_btn, "Cadastrando...")
         
-        self.register_confirm_btn.setText("Cadastrar")
-        self.register_confirm_btn.setEnabled(True)
+        run_task(
+            self.auth_system.register_user, username, email, password,
+            priority=PRIORITY_INTERACTIVE, owner=self
+        ).then(self.on_register_finished, lambda error: self.on_register_finished((False, error)))
+    
+    def on_register_finished(self, outcome):
+        success, result = outcome
+        self.set_idle(self.register_confirm_btn, "Cadastrar")
         
         if success:
             self.show_message("Sucesso!", result, "success")
@@ -396,37 +234,28 @@ class AuthWidget(QWidget):
         else:
             self.show_message("Erro no Registro", result, "error")
     
+    def set_busy(self, button, text):
+        """Trava o formulário enquanto as credenciais são verificadas"""
+        button.setText(text)
+        self.stacked_layout.setEnabled(False)
+        self.login_tab_btn.setEnabled(False)
+        self.register_tab_btn.setEnabled(False)
+    
+    def set_idle(self, button, text):
+        button.setText(text)
+        self.stacked_layout.setEnabled(True)
+        self.login_tab_btn.setEnabled(True)
+        self.register_tab_btn.setEnabled(True)
+    
     def show_register(self):
         self.stacked_layout.setCurrentIndex(1)
-        self.login_tab_btn.setStyleSheet(self.get_tab_style(False))
-        self.register_tab_btn.setStyleSheet(self.get_tab_style(True))
+        set_style_state(self.login_tab_btn, "active", False)
+        set_style_state(self.register_tab_btn, "active", True)
     
     def show_login(self):
         self.stacked_layout.setCurrentIndex(0)
-        self.login_tab_btn.setStyleSheet(self.get_tab_style(True))
-        self.register_tab_btn.setStyleSheet(self.get_tab_style(False))
-    
-    def get_tab_style(self, active):
-        base_style = """
-            QPushButton {
-                padding: 12px 24px;
-                border: none;
-                color: white;
-                background: transparent;
-                border-bottom: 2px solid transparent;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """
-        active_style = """
-            QPushButton {
-                border-bottom: 2px solid #ff7b00;
-                color: #ff7b00;
-            }
-        """
-        return base_style + (active_style if active else "")
+        set_style_state(self.login_tab_btn, "active", True)
+        set_style_state(self.register_tab_btn, "active", False)
     
     def clear_register_fields(self):
         self.reg_username_input.clear()
@@ -435,44 +264,22 @@ class AuthWidget(QWidget):
         self.reg_confirm_password_input.clear()
     
     def show_message(self, title, message, type="info"):
-        colors = {
-            "error": {"bg": "#2a2a2a", "border": "#e53e3e", "icon": "❌"},
-            "warning": {"bg": "#2a2a2a", "border": "#dd6b20", "icon": "⚠️"}, 
-            "success": {"bg": "#2a2a2a", "border": "#38a169", "icon": "✅"},
-            "info": {"bg": "#2a2a2a", "border": "#3182ce", "icon": "ℹ️"}
+        icons = {
+            "error": "❌",
+            "warning": "⚠️",
+            "success": "✅",
+            "info": "ℹ️"
         }
         
-        color_info = colors.get(type, colors["info"])
+        if type not in icons:
+            type = "info"
         
         msg = QMessageBox()
-        msg.setWindowTitle(f"{color_info['icon']} {title}")
+        msg.setWindowTitle(f"{icons[type]} {title}")
         msg.setText(message)
         
-        msg.setStyleSheet(f"""
-            QMessageBox {{
-                background-color: {color_info['bg']};
-                color: #f7fafc;
-                border: 2px solid {color_info['border']};
-                border-radius: 10px;
-            }}
-            QMessageBox QLabel {{
-                color: #f7fafc;
-                font-size: 14px;
-                padding: 10px;
-            }}
-            QMessageBox QPushButton {{
-                background-color: {color_info['border']};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 20px;
-                font-size: 12px;
-                min-width: 80px;
-            }}
-            QMessageBox QPushButton:hover {{
-                background-color: #4a5568;
-            }}
-        """)
+        # Cores por tipo definidas no tema (styles/auth_styles.py)
+        msg.setProperty("messageType", type)
         
         if type == "error":
             msg.setIcon(QMessageBox.Critical)
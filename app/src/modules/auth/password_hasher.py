@@ -0,0 +1,124 @@
+import json
+import math
+import time
+import importlib.util
+from loguru import logger
+
+# Custo do bcrypt: calibrado na primeira vez que uma senha é gerada, para que
+# um hash leve cerca de BCRYPT_TARGET_MS nesta máquina, dentro dos limites
+BCRYPT_TARGET_MS = 250
+BCRYPT_MIN_COST = 10
+BCRYPT_MAX_COST = 14
+# Custo usado para medir a máquina (barato, e o tempo dobra a cada +1)
+BCRYPT_PROBE_COST = 10
+# Senhas antigas (e o fallback sem bcrypt) usam sha256_crypt
+SHA256_ROUNDS = 30000
+# bcrypt só considera os primeiros 72 bytes da senha
+MAX_PASSWORD_BYTES = 72
+
+def bcrypt_available():
+    """Detecta o backend sem gerar nenhum hash"""
+    return importlib.util.find_spec("bcrypt") is not None
+
+def is_bcrypt_hash(hashed):
+    return hashed.startswith(("$2a$", "$2b$", "$2y$"))
+
+def bcrypt_cost(hashed):
+    return int(hashed.split("$")[2])
+
+class PasswordHasher:
+    """Gera e verifica senhas; nada é carregado ou calculado até o primeiro uso
+
+    Usa a biblioteca bcrypt diretamente (o backend bcrypt do passlib não
+    funciona com o bcrypt 5). Hashes sha256_crypt antigos continuam válidos
+    e são trocados por bcrypt no próximo login (needs_rehash).
+    """
+
+    def __init__(self, settings_path):
+        self.settings_path = settings_path
+        self._bcrypt = None
+        self._legacy_context = None
+        self._cost = None
+        self.use_bcrypt = bcrypt_available()
+        if not self.use_bcrypt:
+            logger.warning("⚠️ bcrypt não disponível, usando sha256_crypt")
+
+    @property
+    def bcrypt(self):
+        if self._bcrypt is None:
+            import bcrypt
+            self._bcrypt = bcrypt
+        return self._bcrypt
+
+    @property
+    def legacy_context(self):
+        if self._legacy_context is None:
+            from passlib.context import CryptContext
+            self._legacy_context = CryptContext(
+                schemes=["sha256_crypt"],
+                deprecated="auto",
+                sha256_crypt__default_rounds=SHA256_ROUNDS
+            )
+        return self._legacy_context
+
+    @property
+    def cost(self):
+        """Custo do bcrypt: configurado em auth_settings.json ou calibrado uma vez"""
+        if self._cost is None:
+            settings = self.load_settings()
+            cost = settings.get("bcrypt_cost")
+            if not isinstance(cost, int):
+                cost = self.calibrate_cost()
+                settings["bcrypt_cost"] = cost
+                self.save_settings(settings)
+            self._cost = cost
+        return self._cost
+
+    def calibrate_cost(self, target_ms=BCRYPT_TARGET_MS):
+        bcrypt = self.bcrypt
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(BCRYPT_PROBE_COST))
+        probe_ms = max((time.perf_counter() - start) * 1000, 1)
+
+        cost = BCRYPT_PROBE_COST + int(math.floor(math.log2(target_ms / probe_ms)))
+        cost = max(BCRYPT_MIN_COST, min(BCRYPT_MAX_COST, cost))
+        logger.info(f"🔐 Custo do bcrypt calibrado: {cost} (custo {BCRYPT_PROBE_COST} levou {probe_ms:.0f} ms)")
+        return cost
+
+    def load_settings(self):
+        try:
+            with open(self.settings_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def save_settings(self, settings):
+        try:
+            with open(self.settings_path, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.error(f"❌ Erro ao salvar configurações de segurança: {e}")
+
+    def hash(self, password):
+        if not self.use_bcrypt:
+            return self.legacy_context.hash(password[:MAX_PASSWORD_BYTES])
+        secret = password.encode('utf-8')[:MAX_PASSWORD_BYTES]
+        return self.bcrypt.hashpw(secret, self.bcrypt.gensalt(self.cost)).decode('ascii')
+
+    def verify(self, password, hashed):
+        if is_bcrypt_hash(hashed):
+            if not self.use_bcrypt:
+                logger.error("❌ Senha salva com bcrypt, mas o bcrypt não está instalado")
+                return False
+            secret = password.encode('utf-8')[:MAX_PASSWORD_BYTES]
+            return self.bcrypt.checkpw(secret, hashed.encode('ascii'))
+        # Hashes antigos: a senha era truncada em 72 caracteres
+        return self.legacy_context.verify(password[:MAX_PASSWORD_BYTES], hashed)
+
+    def needs_rehash(self, hashed):
+        """True se o hash usa um esquema antigo ou um custo menor que o atual"""
+        if not self.use_bcrypt:
+            return self.legacy_context.needs_update(hashed)
+        if not is_bcrypt_hash(hashed):
+            return True
+        return bcrypt_cost(hashed) < self.cost
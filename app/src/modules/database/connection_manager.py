@@ -0,0 +1,188 @@
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from loguru import logger
+
+USERS_DB = "users.db"
+
+# Aplicados em toda conexão nova. WAL deixa leituras e escritas de threads
+# diferentes andarem juntas; NORMAL é seguro com WAL e evita um fsync por commit
+CONNECTION_PRAGMAS = [
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", -8000),  # KiB
+]
+BUSY_TIMEOUT_SECONDS = 5
+# Statements preparados mantidos por conexão (reutilizados pelo texto do SQL)
+STATEMENT_CACHE_SIZE = 128
+
+_app_data_path = None
+
+def get_app_data_path():
+    """Pasta de dados do app, criada uma única vez"""
+    global _app_data_path
+    if _app_data_path is None:
+        app_data = Path.home() / "AppData" / "Local" / "AniPlay"
+        app_data.mkdir(parents=True, exist_ok=True)
+        _app_data_path = app_data
+    return _app_data_path
+
+def set_app_data_path(path=None):
+    """Troca a pasta de dados (benchmarks e ferramentas); None volta para a do usuário
+
+    As conexões abertas na pasta anterior são fechadas antes, então só pode
+    ser chamada sem tarefas usando o banco.
+    """
+    global _app_data_path
+    if _connection_manager is not None:
+        _connection_manager.close_all()
+    if path is not None:
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+    _app_data_path = path
+
+def user_db_name(user_id):
+    return f"user_{user_id}.db"
+
+def close_connection(conn):
+    try:
+        conn.close()
+    except sqlite3.Error as e:
+        logger.error(f"❌ Erro ao fechar conexão: {e}")
+
+def close_connections(connections):
+    for conn, _ in list(connections.values()):
+        close_connection(conn)
+    connections.clear()
+
+class ThreadConnections:
+    """Conexões de uma thread (nome -> (conexão, geração))
+
+    Quando a thread termina e o objeto é liberado, as conexões são fechadas.
+    """
+
+    def __init__(self):
+        self.connections = {}
+        weakref.finalize(self, close_connections, self.connections)
+
+class ConnectionManager:
+    """Uma conexão por (thread, banco), aberta no primeiro uso e reaproveitada
+
+    Cada thread usa e fecha só as suas conexões: close_database só avisa (pela
+    geração do banco) e cada thread fecha a sua no próximo uso, ou ao
+    terminar. Só close_all, na saída, fecha as conexões de todas as threads.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        # Conexões de cada thread viva, para o close_all
+        self.threads = weakref.WeakSet()
+        # Threads do Qt (QThreadPool), pelo endereço do QThread
+        self.qt_threads = {}
+        # Incrementada ao fechar um banco: as threads percebem e reabrem
+        self.generations = {}
+
+    def thread_connections(self):
+        holder = getattr(self.local, "holder", None)
+        if holder is not None:
+            return holder
+        # Threads criadas pelo Qt perdem o threading.local ao fim de cada
+        # tarefa; as conexões delas ficam com o QThread, que avisa ao terminar
+        if isinstance(threading.current_thread(), threading._DummyThread):
+            holder = self.qt_thread_connections()
+        else:
+            holder = ThreadConnections()
+        self.local.holder = holder
+        with self.lock:
+            self.threads.add(holder)
+        return holder
+
+    def qt_thread_connections(self):
+        from PySide6.QtCore import QThread, Qt
+        import shiboken6
+
+        thread = QThread.currentThread()
+        key = shiboken6.getCppPointer(thread)[0]
+        with self.lock:
+            holder = self.qt_threads.get(key)
+            if holder is not None:
+                return holder
+            holder = self.qt_threads[key] = ThreadConnections()
+        # Direto: roda na própria thread, que fecha as suas conexões
+        thread.finished.connect(lambda: self.qt_thread_finished(key), Qt.DirectConnection)
+        return holder
+
+    def qt_thread_finished(self, key):
+        with self.lock:
+            holder = self.qt_threads.pop(key, None)
+        if holder is not None:
+            close_connections(holder.connections)
+
+    def connection(self, name):
+        connections = self.thread_connections().connections
+        with self.lock:
+            generation = self.generations.get(name, 0)
+
+        entry = connections.get(name)
+        if entry is not None:
+            if entry[1] == generation:
+                return entry[0]
+            # O banco foi fechado (ex.: logout) desde o último uso desta thread
+            close_connection(entry[0])
+
+        conn = self.open(name)
+        connections[name] = (conn, generation)
+        return conn
+
+    def open(self, name):
+        path = get_app_data_path() / name
+        # check_same_thread=False: a conexão pode ser fechada na saída do app
+        # ou pelo finalizador de uma thread que terminou
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SECONDS,
+                               cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        for pragma, value in CONNECTION_PRAGMAS:
+            conn.execute(f"PRAGMA {pragma} = {value}")
+        logger.debug(f"🗄️ Conexão aberta: {name} ({threading.current_thread().name})")
+        return conn
+
+    @contextmanager
+    def transaction(self, name):
+        """Commit ao final do bloco, rollback se houver exceção"""
+        conn = self.connection(name)
+        with conn:
+            yield conn
+
+    def close_database(self, name):
+        """Fecha um banco (ex.: logout)
+
+        A conexão desta thread fecha agora; as das outras threads, quando
+        elas voltarem a usar o banco ou terminarem, para não fechar uma
+        conexão no meio de uma consulta.
+        """
+        with self.lock:
+            self.generations[name] = self.generations.get(name, 0) + 1
+        entry = self.thread_connections().connections.pop(name, None)
+        if entry is not None:
+            close_connection(entry[0])
+
+    def close_all(self):
+        """Fecha as conexões de todas as threads; só na saída, com as tarefas já paradas"""
+        with self.lock:
+            holders = list(self.threads)
+            for holder in holders:
+                for name in list(holder.connections):
+                    self.generations[name] = self.generations.get(name, 0) + 1
+        for holder in holders:
+            close_connections(holder.connections)
+
+_connection_manager = None
+
+def get_connection_manager():
+    global _connection_manager
+    if _connection_manager is None:
+        _connection_manager = ConnectionManager()
+    return _connection_manager
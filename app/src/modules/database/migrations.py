@@ -0,0 +1,104 @@
+import sqlite3
+from loguru import logger
+
+# Migrações do banco pessoal (user_{id}.db), aplicadas em ordem. A versão
+# aplicada fica em PRAGMA user_version; nunca altere uma migração já publicada,
+# acrescente outra no fim da lista.
+USER_DB_MIGRATIONS = [
+    # 1: chave do progresso por episódio (upsert e retomada); duplicatas
+    # antigas são descartadas, fica a linha mais nova de cada episódio
+    [
+        '''DELETE FROM watch_history WHERE id NOT IN (
+               SELECT MAX(id) FROM watch_history
+               GROUP BY user_id, anime_id, episode_number)''',
+        '''CREATE UNIQUE INDEX IF NOT EXISTS idx_watch_history_episode
+           ON watch_history (user_id, anime_id, episode_number)''',
+    ],
+    # 2: "Continuar assistindo", histórico paginado e favoritos recentes
+    [
+        '''CREATE INDEX IF NOT EXISTS idx_watch_history_recent
+           ON watch_history (user_id, watched_at DESC)''',
+        '''CREATE INDEX IF NOT EXISTS idx_watch_history_anime_recent
+           ON watch_history (user_id, anime_id, watched_at DESC)''',
+        '''CREATE INDEX IF NOT EXISTS idx_favorites_recent
+           ON favorites (user_id, added_at DESC)''',
+    ],
+]
+
+# Migrações do banco de métricas de reprodução (playback_metrics.db), do aparelho
+METRICS_DB_MIGRATIONS = [
+    # 1: um trecho de reprodução por linha (mesma fonte e qualidade do começo ao fim)
+    [
+        '''CREATE TABLE IF NOT EXISTS playback_segments (
+               id INTEGER PRIMARY KEY AUTOINCREMENT,
+               session_started_at REAL NOT NULL,
+               anime_id TEXT,
+               episode_number INTEGER,
+               language TEXT,
+               provider TEXT,
+               host TEXT,
+               quality TEXT,
+               first_frame_ms INTEGER,
+               startup_buffer_ms INTEGER,
+               watched_ms INTEGER NOT NULL DEFAULT 0,
+               rebuffer_count INTEGER NOT NULL DEFAULT 0,
+               rebuffer_ms INTEGER NOT NULL DEFAULT 0,
+               seek_count INTEGER NOT NULL DEFAULT 0,
+               seek_ms INTEGER NOT NULL DEFAULT 0,
+               switched INTEGER NOT NULL DEFAULT 0,
+               error_count INTEGER NOT NULL DEFAULT 0,
+               last_error TEXT
+           )''',
+        '''CREATE INDEX IF NOT EXISTS idx_playback_segments_started
+           ON playback_segments (session_started_at)''',
+    ],
+]
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def migrate(conn, migrations, target_version=None):
+    """Aplica as migrações pendentes, cada uma em sua própria transação
+
+    Retorna a versão final. Uma migração que falha é desfeita por inteiro e
+    as seguintes não rodam. Se a conexão já está em uma transação (ex.: dentro
+    de ConnectionManager.transaction), cada migração vira um SAVEPOINT dela.
+    """
+    if target_version is None:
+        target_version = len(migrations)
+    version = get_schema_version(conn)
+
+    while version < target_version:
+        statements = migrations[version]
+        if conn.in_transaction:
+            savepoint = f"migration_{version + 1}"
+            begin, commit = f"SAVEPOINT {savepoint}", f"RELEASE {savepoint}"
+            rollback = (f"ROLLBACK TO {savepoint}", f"RELEASE {savepoint}")
+        else:
+            begin, commit, rollback = "BEGIN", "COMMIT", ("ROLLBACK",)
+        try:
+            conn.execute(begin)
+            for statement in statements:
+                conn.execute(statement)
+            # PRAGMA não aceita parâmetros; version é sempre um int
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.execute(commit)
+        except sqlite3.Error as e:
+            logger.error(f"❌ Migração {version + 1} falhou: {e}")
+            try:
+                for statement in rollback:
+                    conn.execute(statement)
+            except sqlite3.Error as rollback_error:
+                # Sem transação aberta (o BEGIN falhou) não há o que desfazer
+                logger.warning(f"⚠️ Não foi possível desfazer a migração {version + 1}: {rollback_error}")
+            break
+        version += 1
+        logger.info(f"🗄️ Banco migrado para a versão {version}")
+
+    return version
+
+def migrate_user_database(conn, target_version=None):
+    return migrate(conn, USER_DB_MIGRATIONS, target_version)
+
+def migrate_metrics_database(conn, target_version=None):
+    return migrate(conn, METRICS_DB_MIGRATIONS, target_version)
@@ -0,0 +1,93 @@
+from modules.database.connection_manager import get_connection_manager, user_db_name
+
+HISTORY_PAGE_SIZE = 50
+CONTINUE_WATCHING_LIMIT = 20
+
+HISTORY_COLUMNS = ("id", "anime_id", "anime_title", "episode_number", "episode_title",
+                   "progress_seconds", "total_seconds", "watched_at")
+
+# Último episódio de cada anime: percorre idx_watch_history_recent do mais novo
+# para o mais antigo e fica com a linha que é a mais nova do seu anime
+# (idx_watch_history_anime_recent); para assim que junta `limit` animes, sem
+# agrupar o histórico inteiro
+CONTINUE_WATCHING = '''
+    SELECT id, anime_id, anime_title, episode_number, episode_title,
+           progress_seconds, total_seconds, watched_at
+    FROM watch_history AS w
+    WHERE user_id = ? AND id = (
+        SELECT id FROM watch_history
+        WHERE user_id = w.user_id AND anime_id = w.anime_id
+        ORDER BY watched_at DESC, id DESC
+        LIMIT 1
+    )
+    ORDER BY watched_at DESC, id DESC
+    LIMIT ?
+'''
+
+LATEST_EPISODE = '''
+    SELECT id, anime_id, anime_title, episode_number, episode_title,
+           progress_seconds, total_seconds, watched_at
+    FROM watch_history
+    WHERE user_id = ? AND anime_id = ?
+    ORDER BY watched_at DESC
+    LIMIT 1
+'''
+
+# Paginação por cursor (watched_at, id): o custo não cresce com a página,
+# ao contrário de OFFSET
+HISTORY_FIRST_PAGE = '''
+    SELECT id, anime_id, anime_title, episode_number, episode_title,
+           progress_seconds, total_seconds, watched_at
+    FROM watch_history
+    WHERE user_id = ?
+    ORDER BY watched_at DESC, id DESC
+    LIMIT ?
+'''
+
+HISTORY_NEXT_PAGE = '''
+    SELECT id, anime_id, anime_title, episode_number, episode_title,
+           progress_seconds, total_seconds, watched_at
+    FROM watch_history
+    WHERE user_id = ? AND (watched_at, id) < (?, ?)
+    ORDER BY watched_at DESC, id DESC
+    LIMIT ?
+'''
+
+def as_dict(row):
+    return dict(zip(HISTORY_COLUMNS, row))
+
+class WatchHistory:
+    """Consultas de leitura do histórico de um usuário"""
+
+    def __init__(self, user_id, conn=None):
+        self.user_id = user_id
+        # conn explícita para benchmarks; no app, a conexão da thread atual
+        self.conn = conn
+
+    def connection(self):
+        return self.conn or get_connection_manager().connection(user_db_name(self.user_id))
+
+    def continue_watching(self, limit=CONTINUE_WATCHING_LIMIT):
+        """Último episódio assistido de cada anime, do mais recente para o mais antigo"""
+        rows = self.connection().execute(CONTINUE_WATCHING, (self.user_id, limit)).fetchall()
+        return [as_dict(row) for row in rows]
+
+    def latest_episode(self, anime_id):
+        row = self.connection().execute(LATEST_EPISODE, (self.user_id, anime_id)).fetchone()
+        return as_dict(row) if row else None
+
+    def history_page(self, cursor=None, page_size=HISTORY_PAGE_SIZE):
+        """Uma página do histórico; retorna (itens, cursor da próxima página ou None)"""
+        if cursor is None:
+            rows = self.connection().execute(HISTORY_FIRST_PAGE, (self.user_id, page_size)).fetchall()
+        else:
+            watched_at, last_id = cursor
+            rows = self.connection().execute(
+                HISTORY_NEXT_PAGE, (self.user_id, watched_at, last_id, page_size)
+            ).fetchall()
+
+        items = [as_dict(row) for row in rows]
+        next_cursor = None
+        if len(items) == page_size:
+            next_cursor = (items[-1]["watched_at"], items[-1]["id"])
+        return items, next_cursor
@@ -0,0 +1,147 @@
+import threading
+from loguru import logger
+
+from modules.database.connection_manager import get_connection_manager, user_db_name
+from modules.database.migrations import migrate_user_database
+
+# Posições pendentes são gravadas a cada FLUSH_INTERVAL_SECONDS (ou antes, no pause/fechar)
+FLUSH_INTERVAL_SECONDS = 10
+# Não vale retomar do começo nem a poucos segundos do fim
+RESUME_MIN_SECONDS = 5
+RESUME_END_MARGIN_SECONDS = 30
+
+UPSERT_PROGRESS = '''
+    INSERT INTO watch_history (user_id, anime_id, anime_title, episode_number, episode_title,
+                               progress_seconds, total_seconds, watched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(user_id, anime_id, episode_number) DO UPDATE SET
+        anime_title = excluded.anime_title,
+        episode_title = excluded.episode_title,
+        progress_seconds = excluded.progress_seconds,
+        total_seconds = excluded.total_seconds,
+        watched_at = excluded.watched_at
+'''
+
+SELECT_PROGRESS = '''
+    SELECT progress_seconds, total_seconds FROM watch_history
+    WHERE user_id = ? AND anime_id = ? AND episode_number = ?
+'''
+
+class WatchProgressStore:
+    """Fila write-behind do progresso de episódios de um usuário
+
+    O player chama record() a cada mudança de posição; só a última posição de
+    cada episódio fica na fila, e uma thread própria grava tudo em uma única
+    transação no intervalo, no pause ou ao fechar. O player nunca escreve no
+    SQLite diretamente.
+    """
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.db_name = user_db_name(user_id)
+        self.pending = {}
+        # Linhas sendo gravadas agora: ainda valem para a retomada
+        self.in_flight = {}
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.flushed = threading.Condition(self.lock)
+        self.thread = threading.Thread(target=self.run, name="watch-progress-writer", daemon=True)
+        self.thread.start()
+
+    def record(self, anime, episode, position_ms, duration_ms):
+        """Guarda a posição atual (não bloqueia); substitui a anterior do mesmo episódio"""
+        anime_id = anime.get('id')
+        episode_number = episode.get('number')
+        if not anime_id or episode_number is None or duration_ms <= 0:
+            return
+
+        with self.lock:
+            self.pending[(anime_id, episode_number)] = (
+                self.user_id, anime_id, anime.get('name', ''), episode_number, episode.get('title', ''),
+                position_ms // 1000, duration_ms // 1000
+            )
+
+    def flush(self):
+        """Pede a gravação imediata, sem esperar"""
+        self.wake.set()
+
+    def flush_and_wait(self, timeout=3):
+        """Grava o que estiver pendente e espera terminar (logout, fechar o app)"""
+        with self.lock:
+            self.wake.set()
+            return self.flushed.wait_for(lambda: not self.pending and not self.in_flight, timeout)
+
+    def stop(self):
+        self.flush_and_wait()
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout=3)
+
+    def run(self):
+        self.ensure_schema()
+        while not self.stopping:
+            self.wake.wait(FLUSH_INTERVAL_SECONDS)
+            self.wake.clear()
+            self.write_pending()
+
+    def ensure_schema(self):
+        # Bancos criados antes das migrações são atualizados no primeiro login;
+        # o upsert depende do índice único da migração 1
+        try:
+            migrate_user_database(get_connection_manager().connection(self.db_name))
+        except Exception as e:
+            logger.error(f"❌ Erro ao migrar o banco do usuário: {e}")
+
+    def write_pending(self):
+        with self.lock:
+            self.in_flight, self.pending = self.pending, {}
+
+        if self.in_flight:
+            try:
+                with get_connection_manager().transaction(self.db_name) as conn:
+                    conn.executemany(UPSERT_PROGRESS, list(self.in_flight.values()))
+                logger.debug(f"💾 Progresso gravado ({len(self.in_flight)} episódios)")
+            except Exception as e:
+                logger.error(f"❌ Erro ao gravar progresso: {e}")
+
+        with self.lock:
+            self.in_flight = {}
+            self.flushed.notify_all()
+
+    def get_resume_position(self, anime_id, episode_number):
+        """Posição salva (ms) para retomar o episódio, ou 0
+
+        Consulta primeiro a fila (o episódio pode ter sido fechado há pouco) e
+        depois o índice (user_id, anime_id, episode_number).
+        """
+        key = (anime_id, episode_number)
+        with self.lock:
+            row = self.pending.get(key) or self.in_flight.get(key)
+        if row:
+            progress_seconds, total_seconds = row[5], row[6]
+        else:
+            try:
+                conn = get_connection_manager().connection(self.db_name)
+                saved = conn.execute(SELECT_PROGRESS, (self.user_id, anime_id, episode_number)).fetchone()
+            except Exception as e:
+                logger.error(f"❌ Erro ao ler progresso: {e}")
+                return 0
+            if not saved:
+                return 0
+            progress_seconds, total_seconds = saved
+
+        if progress_seconds < RESUME_MIN_SECONDS or progress_seconds > total_seconds - RESUME_END_MARGIN_SECONDS:
+            return 0
+        return progress_seconds * 1000
+
+_watch_progress = None
+
+def set_watch_progress(store):
+    """Definido no login e limpo no logout"""
+    global _watch_progress
+    _watch_progress = store
+
+def get_watch_progress():
+    """Store do usuário logado, ou None"""
+    return _watch_progress
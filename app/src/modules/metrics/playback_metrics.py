@@ -0,0 +1,234 @@
+import csv
+import sys
+import threading
+import time
+from loguru import logger
+
+from modules.database.connection_manager import get_connection_manager
+from modules.database.migrations import migrate_metrics_database
+from modules.tasks.task_manager import run_task, PRIORITY_PREFETCH
+
+PLAYBACK_METRICS_DB = "playback_metrics.db"
+# Trechos mais antigos são apagados a cada gravação
+METRICS_RETENTION_DAYS = 90
+SUMMARY_DAYS = 30
+
+INSERT_SEGMENT = '''
+    INSERT INTO playback_segments (session_started_at, anime_id, episode_number, language,
+                                   provider, host, quality, first_frame_ms, startup_buffer_ms,
+                                   watched_ms, rebuffer_count, rebuffer_ms, seek_count, seek_ms,
+                                   switched, error_count, last_error)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+DELETE_OLD_SEGMENTS = "DELETE FROM playback_segments WHERE session_started_at < ?"
+
+# Por fonte e qualidade, as piores primeiro: mais tempo travado por minuto
+# assistido, depois mais erros e início mais lento
+SELECT_SUMMARY = '''
+    SELECT provider, host, quality,
+           COUNT(DISTINCT session_started_at) AS sessions,
+           SUM(watched_ms) AS watched_ms,
+           SUM(rebuffer_count) AS rebuffers,
+           SUM(rebuffer_ms) AS rebuffer_ms,
+           60.0 * SUM(rebuffer_ms) / MAX(SUM(watched_ms), 1) AS stall_seconds_per_minute,
+           AVG(first_frame_ms) AS first_frame_ms,
+           AVG(startup_buffer_ms) AS startup_buffer_ms,
+           1.0 * SUM(seek_ms) / MAX(SUM(seek_count), 1) AS seek_ms,
+           SUM(switched) AS switches,
+           SUM(error_count) AS errors
+    FROM playback_segments
+    WHERE session_started_at >= ?
+    GROUP BY provider, host, quality
+    ORDER BY stall_seconds_per_minute DESC, errors DESC, first_frame_ms DESC
+'''
+
+SUMMARY_COLUMNS = ["provider", "host", "quality", "sessions", "watched_ms", "rebuffers", "rebuffer_ms",
+                   "stall_seconds_per_minute", "first_frame_ms", "startup_buffer_ms", "seek_ms",
+                   "switches", "errors"]
+
+def elapsed_ms(since):
+    return int((time.perf_counter() - since) * 1000)
+
+class StreamSegment:
+    """Trecho de uma sessão tocado em uma mesma fonte e qualidade"""
+
+    def __init__(self, provider, host, quality, language, preloaded):
+        self.provider = provider
+        self.language = language
+        self.host = host
+        self.quality = quality
+        self.loading_since = None if preloaded else time.perf_counter()
+        self.startup_buffer_ms = None
+        self.watched_ms = 0
+        self.rebuffer_count = 0
+        self.rebuffer_ms = 0
+        self.seek_count = 0
+        self.seek_ms = 0
+        self.switched = False
+        self.error_count = 0
+        self.last_error = None
+
+class PlaybackSession:
+    """Métricas de qualidade de experiência de um episódio no player
+
+    Começa no clique (ou na troca para o próximo episódio) e termina ao
+    fechar o player ou trocar de episódio. Cada troca de fonte ou qualidade
+    abre um trecho novo, para que travamentos e erros fiquem com a fonte e a
+    qualidade em que aconteceram.
+    """
+
+    def __init__(self, anime_id, episode_number):
+        self.started_at = time.time()
+        self.origin = time.perf_counter()
+        self.anime_id = anime_id
+        self.episode_number = episode_number
+        self.finished = False
+        self.first_frame_ms = None
+        self.segments = []
+        self.segment = None
+        self.playing_since = None
+        self.seek_since = None
+
+    @property
+    def waiting_frame(self):
+        """Ainda há um quadro a medir (o primeiro ou o de um seek)"""
+        return self.first_frame_ms is None or self.seek_since is not None
+
+    def stream_started(self, provider, host, quality, language, preloaded=False):
+        """Novo stream no player; preloaded quando já veio com buffer (player oculto)"""
+        if self.segment:
+            self.close_segment(switched=True)
+        self.segment = StreamSegment(provider, host, quality, language, preloaded)
+        self.segments.append(self.segment)
+
+    def close_segment(self, switched=False):
+        self.add_watched_time()
+        self.segment.switched = switched
+        self.seek_since = None
+
+    def add_watched_time(self):
+        if self.playing_since is not None and self.segment:
+            self.segment.watched_ms += elapsed_ms(self.playing_since)
+            self.playing_since = time.perf_counter()
+
+    def playing(self, is_playing):
+        self.add_watched_time()
+        self.playing_since = time.perf_counter() if is_playing else None
+
+    def buffered(self):
+        segment = self.segment
+        if segment and segment.loading_since is not None and segment.startup_buffer_ms is None:
+            segment.startup_buffer_ms = elapsed_ms(segment.loading_since)
+
+    def frame(self):
+        if self.first_frame_ms is None:
+            self.first_frame_ms = elapsed_ms(self.origin)
+            logger.info(f"🖼️ Primeiro quadro em {self.first_frame_ms} ms")
+        if self.seek_since is not None and self.segment:
+            self.segment.seek_ms += elapsed_ms(self.seek_since)
+            self.seek_since = None
+
+    def seek_started(self):
+        # Arrastar a barra gera vários seeks seguidos: contam como um só
+        if self.seek_since is None and self.segment:
+            self.segment.seek_count += 1
+        self.seek_since = time.perf_counter()
+
+    def rebuffered(self, seconds):
+        if self.segment:
+            self.segment.rebuffer_count += 1
+            self.segment.rebuffer_ms += int(seconds * 1000)
+
+    def error(self, message):
+        if self.segment:
+            self.segment.error_count += 1
+            self.segment.last_error = message
+
+    def finish(self):
+        """Linhas para playback_segments; depois disso a sessão não grava mais nada"""
+        if self.segment:
+            self.close_segment()
+        self.finished = True
+        rows = []
+        for index, segment in enumerate(self.segments):
+            rows.append((
+                self.started_at, self.anime_id, self.episode_number, segment.language,
+                segment.provider, segment.host, segment.quality,
+                self.first_frame_ms if index == 0 else None, segment.startup_buffer_ms,
+                segment.watched_ms, segment.rebuffer_count, segment.rebuffer_ms,
+                segment.seek_count, segment.seek_ms, int(segment.switched),
+                segment.error_count, segment.last_error,
+            ))
+        return rows
+
+class PlaybackMetricsStore:
+    """Grava as sessões em playback_metrics.db (fora da thread da interface) e resume"""
+
+    def __init__(self):
+        self.schema_lock = threading.Lock()
+        self.schema_ready = False
+
+    def connection(self):
+        conn = get_connection_manager().connection(PLAYBACK_METRICS_DB)
+        with self.schema_lock:
+            if not self.schema_ready:
+                migrate_metrics_database(conn)
+                self.schema_ready = True
+        return conn
+
+    def record(self, session):
+        if session.finished:
+            return
+        rows = session.finish()
+        if rows:
+            run_task(self.write_rows, rows, priority=PRIORITY_PREFETCH)
+
+    def write_rows(self, rows):
+        try:
+            conn = self.connection()
+            with conn:
+                conn.executemany(INSERT_SEGMENT, rows)
+                conn.execute(DELETE_OLD_SEGMENTS, (time.time() - METRICS_RETENTION_DAYS * 86400,))
+        except Exception as e:
+            logger.error(f"❌ Erro ao gravar métricas de reprodução: {e}")
+
+    def summary(self, days=SUMMARY_DAYS):
+        """Por fonte e qualidade, das piores para as melhores"""
+        cursor = self.connection().execute(SELECT_SUMMARY, (time.time() - days * 86400,))
+        return [dict(zip(SUMMARY_COLUMNS, row)) for row in cursor]
+
+    def export_summary(self, path, days=SUMMARY_DAYS):
+        rows = self.summary(days)
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=SUMMARY_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        logger.info(f"📤 Resumo de reprodução exportado: {path} ({len(rows)} fontes)")
+        return rows
+
+    def log_summary(self, days=SUMMARY_DAYS):
+        logger.info(f"📊 Reprodução nos últimos {days} dias (piores primeiro)")
+        logger.info(f"   {'fonte':<34}{'qual.':<7}{'sessões':>8}{'trav./min':>10}"
+                    f"{'1º quadro':>11}{'seek':>8}{'trocas':>8}{'erros':>7}")
+        for row in self.summary(days):
+            source = f"{row['provider'] or '-'} {row['host'] or '-'}"
+            logger.info(f"   {source[:33]:<34}{row['quality'] or '-':<7}{row['sessions']:>8}"
+                        f"{row['stall_seconds_per_minute']:>9.1f}s"
+                        f"{row['first_frame_ms'] or 0:>9.0f}ms{row['seek_ms']:>6.0f}ms"
+                        f"{row['switches']:>8}{row['errors']:>7}")
+
+_playback_metrics = None
+
+def get_playback_metrics():
+    global _playback_metrics
+    if _playback_metrics is None:
+        _playback_metrics = PlaybackMetricsStore()
+    return _playback_metrics
+
+if __name__ == "__main__":
+    # Na pasta src: python -m modules.metrics.playback_metrics [resumo.csv]
+    store = get_playback_metrics()
+    store.log_summary()
+    if len(sys.argv) > 1:
+        store.export_summary(sys.argv[1])
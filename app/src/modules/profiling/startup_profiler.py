@@ -0,0 +1,219 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from loguru import logger
+
+# Flag de linha de comando (ou variável de ambiente) que liga a medição dos
+# imports, o relatório (na pasta de dados) e o resumo ao sair
+SUMMARY_FLAG = "--startup-profile"
+SUMMARY_ENV = "ANIPLAY_STARTUP_PROFILE"
+REPORT_FILE = "startup_profile.json"
+SUMMARY_TOP_IMPORTS = 10
+
+def profiling_requested():
+    return SUMMARY_FLAG in sys.argv or SUMMARY_ENV in os.environ
+
+class TimedLoader:
+    """Repassa tudo ao loader original, cronometrando a carga de um módulo
+
+    O tempo vai da criação do módulo ao fim da execução, então inclui os
+    imports que ele faz (tempo cumulativo, como no -X importtime).
+    """
+
+    def __init__(self, loader, profiler, name):
+        self.loader = loader
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def create_module(self, spec):
+        self.start = time.perf_counter()
+        self.profiler.import_depth += 1
+        create_module = getattr(self.loader, "create_module", None)
+        try:
+            return create_module(spec) if create_module else None
+        except BaseException:
+            self.finish(None)
+            raise
+
+    def exec_module(self, module):
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.finish(module)
+
+    def finish(self, module):
+        self.profiler.import_depth -= 1
+        self.profiler.imports.append({
+            "module": self.name,
+            "cumulative_ms": round((time.perf_counter() - self.start) * 1000, 2),
+            "depth": self.profiler.import_depth,
+        })
+        # O módulo fica com o loader verdadeiro
+        if module is not None:
+            module.__loader__ = self.loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self.loader
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+class ImportTimer:
+    """Finder no início do sys.meta_path: acha o módulo pelos demais e cronometra o loader
+
+    Fica em sys.meta_path só até a janela aparecer. Um hook em
+    builtins.__import__ não daria para remover: o PySide6 encadeia o dele
+    por cima.
+    """
+
+    def __init__(self, profiler):
+        self.profiler = profiler
+
+    def find_spec(self, name, path, target=None):
+        if threading.current_thread() is not self.profiler.main_thread:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = TimedLoader(spec.loader, self.profiler, name)
+        return spec
+
+class StartupProfiler:
+    """Mede as fases da abertura, os imports e os marcos (janela visível, primeiro poster)
+
+    Os tempos são relativos à criação do profiler, que acontece na primeira
+    linha do main.py. Com a flag de profiling, os imports também são medidos
+    e o relatório JSON é gravado na pasta de dados ao sair do app.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+        self.phases = []
+        self.marks = {}
+        self.imports = []
+        self.phase_depth = 0
+        self.import_depth = 0
+        self.import_timer = None
+        self.main_thread = threading.current_thread()
+        self.paint_watchers = []
+
+    def now_ms(self):
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        """Cronometra um bloco; fases podem ser aninhadas"""
+        start = self.now_ms()
+        self.phase_depth += 1
+        try:
+            yield
+        finally:
+            self.phase_depth -= 1
+            self.phases.append({
+                "name": name,
+                "start_ms": round(start, 2),
+                "duration_ms": round(self.now_ms() - start, 2),
+                "depth": self.phase_depth,
+            })
+
+    def mark(self, name):
+        """Registra um marco; só a primeira ocorrência conta"""
+        if name not in self.marks:
+            self.marks[name] = round(self.now_ms(), 2)
+            logger.debug(f"⏱️ {name}: {self.marks[name]:.0f} ms")
+
+    def mark_on_first_paint(self, widget, name):
+        """Marca quando o widget for pintado pela primeira vez"""
+        from PySide6.QtCore import QObject, QEvent
+
+        profiler = self
+
+        class FirstPaintWatcher(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    profiler.mark(name)
+                    obj.removeEventFilter(self)
+                    if name == "window_shown":
+                        profiler.stop_import_tracking()
+                return False
+
+        watcher = FirstPaintWatcher()
+        widget.installEventFilter(watcher)
+        # Mantém o filtro vivo até a primeira pintura
+        self.paint_watchers.append(watcher)
+
+    def start_import_tracking(self):
+        """Cronometra os imports feitos na thread principal até a janela aparecer"""
+        if self.import_timer is not None or not profiling_requested():
+            return
+        self.import_timer = ImportTimer(self)
+        sys.meta_path.insert(0, self.import_timer)
+
+    def stop_import_tracking(self):
+        if self.import_timer is None:
+            return
+        try:
+            sys.meta_path.remove(self.import_timer)
+        except ValueError:
+            pass
+        self.import_timer = None
+
+    def report(self):
+        return {
+            "started_at": self.started_at,
+            "marks_ms": self.marks,
+            "phases": sorted(self.phases, key=lambda phase: phase["start_ms"]),
+            "imports": self.imports,
+        }
+
+    def write_report(self, path=None):
+        try:
+            if path is None:
+                from modules.database.connection_manager import get_app_data_path
+                path = get_app_data_path() / REPORT_FILE
+            path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        except OSError as e:
+            logger.error(f"❌ Erro ao salvar relatório de inicialização: {e}")
+
+    def log_summary(self):
+        logger.info("⏱️ Resumo da inicialização")
+        for name, at in self.marks.items():
+            logger.info(f"   {name:<28}{at:>10.0f} ms")
+
+        logger.info("   Fases:")
+        for phase in sorted(self.phases, key=lambda phase: phase["start_ms"]):
+            name = "  " * phase["depth"] + phase["name"]
+            logger.info(f"   {name:<28}{phase['duration_ms']:>10.1f} ms")
+
+        # Nível 0: imports do main.py; nível 1: o que cada um deles puxou
+        top_imports = sorted((entry for entry in self.imports if entry["depth"] <= 1),
+                             key=lambda entry: entry["cumulative_ms"], reverse=True)
+        logger.info(f"   Imports mais caros ({len(self.imports)} módulos):")
+        for entry in top_imports[:SUMMARY_TOP_IMPORTS]:
+            logger.info(f"   {entry['module']:<28}{entry['cumulative_ms']:>10.1f} ms")
+
+    def on_exit(self):
+        self.stop_import_tracking()
+        if profiling_requested():
+            self.write_report()
+            self.log_summary()
+
+_startup_profiler = None
+
+def get_startup_profiler():
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+        atexit.register(_startup_profiler.on_exit)
+    return _startup_profiler
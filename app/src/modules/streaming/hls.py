@@ -0,0 +1,309 @@
+import hashlib
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import PurePosixPath
+from urllib.parse import urljoin, urlsplit
+import requests
+from loguru import logger
+
+from modules.database.connection_manager import get_app_data_path
+from modules.streaming.local_server import get_stream_server
+from modules.streaming.range_cache import BlockCache, UPSTREAM_TIMEOUT
+
+# Segmentos baixados à frente do último pedido pelo player
+HLS_PREFETCH_SEGMENTS = 6
+# Downloads simultâneos de segmentos (todas as playlists juntas)
+HLS_PREFETCH_WORKERS = 3
+HLS_CACHE_BYTES = 1024 ** 3
+PLAYLIST_CONTENT_TYPE = "application/vnd.apple.mpegurl"
+SEGMENT_CONTENT_TYPES = {
+    ".ts": "video/mp2t",
+    ".m4s": "video/iso.segment",
+    ".mp4": "video/mp4",
+    ".aac": "audio/aac",
+}
+
+URI_ATTRIBUTE = re.compile(r'URI="([^"]*)"')
+BYTERANGE_ATTRIBUTE = re.compile(r',?BYTERANGE="(\d+)(?:@(\d+))?"')
+# Tags cujo URI= aponta para outra playlist
+PLAYLIST_URI_TAGS = ("#EXT-X-MEDIA:", "#EXT-X-I-FRAME-STREAM-INF:")
+# Tags cujo URI= aponta para um recurso da origem: init segment (fMP4) e chave
+INIT_SEGMENT_TAG = "#EXT-X-MAP:"
+KEY_TAG = "#EXT-X-KEY:"
+
+def url_key(url, byte_range=None):
+    if byte_range:
+        url = f"{url}#{byte_range[0]}-{byte_range[1]}"
+    return hashlib.sha1(url.encode()).hexdigest()[:20]
+
+def is_hls_url(url):
+    return ".m3u8" in url.lower().split("?", 1)[0]
+
+class Segment:
+    def __init__(self, url, byte_range=None, headers=None):
+        self.url = url
+        # (primeiro, último) byte, para playlists com #EXT-X-BYTERANGE
+        self.byte_range = byte_range
+        self.headers = headers or {}
+        self.key = url_key(url, byte_range)
+
+    @property
+    def extension(self):
+        # O demuxer HLS do FFmpeg recusa segmentos sem uma extensão conhecida
+        extension = PurePosixPath(urlsplit(self.url).path).suffix.lower()
+        return extension or ".ts"
+
+    @property
+    def content_type(self):
+        return SEGMENT_CONTENT_TYPES.get(self.extension, "application/octet-stream")
+
+class Playlist:
+    """Uma playlist remota e os segmentos da última versão lida"""
+
+    def __init__(self, key, url, headers=None):
+        self.key = key
+        self.url = url
+        # Cabeçalhos exigidos pela origem; valem também para variantes e segmentos
+        self.headers = headers or {}
+        # Trocada inteira a cada leitura; playlists ao vivo deslizam, então os
+        # segmentos são achados pela chave, não pela posição
+        self.segments = []
+        # VOD (#EXT-X-ENDLIST) não muda: guarda o texto já reescrito
+        self.rewritten = None
+        # Init segments e chaves: chave -> (Segment, vai para o cache)
+        self.resources = {}
+
+class HlsRoute:
+    """Rota /hls/: playlists reescritas para o servidor local e segmentos com cache
+
+    /hls/p/<chave>.m3u8 devolve a playlist remota com variantes, segmentos,
+    init segments e chaves apontando para cá; /hls/s/<playlist>/<segmento>
+    serve o segmento do cache em disco, baixando se preciso, e agenda os
+    HLS_PREFETCH_SEGMENTS seguintes. /hls/r/<playlist>/<recurso> serve init
+    segments (do cache) e chaves, com os cabeçalhos da playlist. O cache é por URL do segmento, então o
+    que já foi baixado continua valendo depois de trocar de idioma ou qualidade.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.session = requests.Session()
+        self.playlists = {}
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        # Na fila do executor, ainda sem download começado
+        self.scheduled = set()
+        self.executor = ThreadPoolExecutor(max_workers=HLS_PREFETCH_WORKERS, thread_name_prefix="hls-prefetch")
+
+    def local_url(self, url, headers=None):
+        key = url_key(url)
+        with self.lock:
+            if key not in self.playlists:
+                self.playlists[key] = Playlist(key, url, headers)
+            elif headers:
+                self.playlists[key].headers = headers
+        return get_stream_server().url_for("hls", f"p/{key}.m3u8")
+
+    def handle(self, request, method, path):
+        kind, _, rest = path.partition("/")
+        if kind == "p":
+            self.serve_playlist(request, method, rest.removesuffix(".m3u8"))
+        elif kind == "s":
+            playlist_key, _, segment_name = rest.partition("/")
+            self.serve_segment(request, method, playlist_key, segment_name.split(".", 1)[0])
+        elif kind == "r":
+            playlist_key, _, resource_name = rest.partition("/")
+            self.serve_resource(request, method, playlist_key, resource_name.split(".", 1)[0])
+        else:
+            request.send_error(404)
+
+    def serve_playlist(self, request, method, key):
+        playlist = self.playlists.get(key)
+        if playlist is None:
+            request.send_error(404)
+            return
+
+        text = playlist.rewritten
+        if text is None:
+            response = self.session.get(playlist.url, headers=playlist.headers, timeout=UPSTREAM_TIMEOUT)
+            response.raise_for_status()
+            # Redirecionamentos mudam a base das URIs relativas
+            text = self.rewrite(playlist, response.text, response.url)
+            if "#EXT-X-ENDLIST" in text:
+                playlist.rewritten = text
+
+        body = text.encode()
+        request.send_response(200)
+        request.send_header("Content-Type", PLAYLIST_CONTENT_TYPE)
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        if method != "HEAD":
+            request.wfile.write(body)
+
+    def rewrite(self, playlist, text, base_url):
+        lines = []
+        segments = []
+        next_is_playlist = False
+        byte_range = None
+        next_offset = 0
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            if line.startswith("#"):
+                if line.startswith("#EXT-X-STREAM-INF:"):
+                    next_is_playlist = True
+                elif line.startswith("#EXT-X-BYTERANGE:"):
+                    length, _, offset = line.split(":", 1)[1].partition("@")
+                    start = int(offset) if offset else next_offset
+                    byte_range = (start, start + int(length) - 1)
+                    next_offset = byte_range[1] + 1
+                    # O intervalo vai no cache do segmento; o player não precisa dele
+                    continue
+                if "URI=" in line:
+                    line = self.rewrite_uri_attribute(playlist, line, base_url)
+                lines.append(line)
+                continue
+
+            url = urljoin(base_url, line)
+            if next_is_playlist:
+                lines.append(self.local_url(url, playlist.headers))
+                next_is_playlist = False
+            else:
+                segment = Segment(url, byte_range, playlist.headers)
+                lines.append(get_stream_server().url_for("hls", f"s/{playlist.key}/{segment.key}{segment.extension}"))
+                segments.append(segment)
+                byte_range = None
+
+        if segments:
+            playlist.segments = segments
+        return "\n".join(lines) + "\n"
+
+    def rewrite_uri_attribute(self, playlist, line, base_url):
+        match = URI_ATTRIBUTE.search(line)
+        url = urljoin(base_url, match.group(1))
+        if line.startswith(PLAYLIST_URI_TAGS):
+            url = self.local_url(url, playlist.headers)
+        elif line.startswith((INIT_SEGMENT_TAG, KEY_TAG)) and url.startswith(("http://", "https://")):
+            byte_range = None
+            if line.startswith(INIT_SEGMENT_TAG):
+                range_match = BYTERANGE_ATTRIBUTE.search(line)
+                if range_match:
+                    start = int(range_match.group(2) or 0)
+                    byte_range = (start, start + int(range_match.group(1)) - 1)
+                    # O intervalo vai no cache, como nos segmentos
+                    line = BYTERANGE_ATTRIBUTE.sub("", line)
+            url = self.resource_url(playlist, url, byte_range, cacheable=line.startswith(INIT_SEGMENT_TAG))
+        return URI_ATTRIBUTE.sub(lambda _: f'URI="{url}"', line, count=1)
+
+    def resource_url(self, playlist, url, byte_range, cacheable):
+        """Init segment (em cache) ou chave servidos por aqui, com os cabeçalhos da playlist"""
+        resource = Segment(url, byte_range, playlist.headers)
+        playlist.resources[resource.key] = (resource, cacheable)
+        extension = resource.extension if cacheable else ".key"
+        return get_stream_server().url_for("hls", f"r/{playlist.key}/{resource.key}{extension}")
+
+    def serve_segment(self, request, method, playlist_key, segment_key):
+        playlist = self.playlists.get(playlist_key)
+        segments = playlist.segments if playlist else []
+        index = next((i for i, segment in enumerate(segments) if segment.key == segment_key), None)
+        if index is None:
+            request.send_error(404)
+            return
+
+        segment = segments[index]
+        data = self.segment_data(segment)
+        self.prefetch(segments[index + 1:index + 1 + HLS_PREFETCH_SEGMENTS])
+
+        request.send_response(200)
+        request.send_header("Content-Type", segment.content_type)
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        if method != "HEAD":
+            request.wfile.write(data)
+
+    def serve_resource(self, request, method, playlist_key, resource_key):
+        playlist = self.playlists.get(playlist_key)
+        entry = playlist.resources.get(resource_key) if playlist else None
+        if entry is None:
+            request.send_error(404)
+            return
+
+        resource, cacheable = entry
+        data = self.segment_data(resource) if cacheable else self.download(resource)
+        request.send_response(200)
+        request.send_header("Content-Type", resource.content_type if cacheable else "application/octet-stream")
+        request.send_header("Content-Length", str(len(data)))
+        request.end_headers()
+        if method != "HEAD":
+            request.wfile.write(data)
+
+    def segment_data(self, segment):
+        """Do cache, de um download já em andamento ou baixado agora, nesta thread"""
+        data = self.cache.read(segment.key, 0)
+        if data is not None:
+            return data
+
+        with self.lock:
+            future = self.in_flight.get(segment.key)
+            owner = future is None
+            if owner:
+                future = self.in_flight[segment.key] = Future()
+        if not owner:
+            return future.result(timeout=UPSTREAM_TIMEOUT[0] + UPSTREAM_TIMEOUT[1])
+
+        try:
+            data = self.download(segment)
+            self.cache.write(segment.key, 0, data)
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.in_flight.pop(segment.key, None)
+
+    def download(self, segment):
+        headers = dict(segment.headers)
+        if segment.byte_range:
+            headers["Range"] = f"bytes={segment.byte_range[0]}-{segment.byte_range[1]}"
+        response = self.session.get(segment.url, headers=headers, timeout=UPSTREAM_TIMEOUT)
+        response.raise_for_status()
+        return response.content
+
+    def prefetch(self, segments):
+        for segment in segments:
+            with self.lock:
+                pending = segment.key in self.in_flight or segment.key in self.scheduled
+                if not pending:
+                    self.scheduled.add(segment.key)
+            if not pending and not self.cache.has(segment.key, 0):
+                self.executor.submit(self.prefetch_segment, segment)
+            elif not pending:
+                with self.lock:
+                    self.scheduled.discard(segment.key)
+
+    def prefetch_segment(self, segment):
+        try:
+            self.segment_data(segment)
+        except Exception as e:
+            logger.debug(f"⚠️ Falha ao antecipar segmento HLS: {e}")
+        finally:
+            with self.lock:
+                self.scheduled.discard(segment.key)
+
+_hls_route = None
+_hls_route_lock = threading.Lock()
+
+def get_hls_route():
+    """Rota HLS, registrada no servidor local no primeiro uso"""
+    global _hls_route
+    with _hls_route_lock:
+        if _hls_route is None:
+            route = HlsRoute(BlockCache(get_app_data_path() / "cache" / "hls", HLS_CACHE_BYTES))
+            get_stream_server().add_route("hls", route)
+            _hls_route = route
+        return _hls_route
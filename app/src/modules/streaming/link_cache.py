@@ -0,0 +1,40 @@
+import time
+
+# Os links de streaming costumam expirar; depois disso, resolve de novo
+LINK_CACHE_TTL_SECONDS = 30 * 60
+
+class StreamLinkCache:
+    """Links de streaming já resolvidos, por (anime, episódio, idioma)
+
+    Usado só na thread da interface (nos callbacks das tarefas), então não
+    precisa de trava. Reabrir um episódio ou trocar de idioma não repete a
+    raspagem enquanto os links valerem.
+    """
+
+    def __init__(self, ttl=LINK_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.entries = {}
+
+    def get(self, anime_id, episode_number, language):
+        entry = self.entries.get((anime_id, episode_number, language))
+        if entry is None:
+            return None
+        links, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self.entries[(anime_id, episode_number, language)]
+            return None
+        return links
+
+    def put(self, anime_id, episode_number, language, links):
+        self.entries[(anime_id, episode_number, language)] = (links, time.monotonic())
+
+    def discard(self, anime_id, episode_number, language):
+        self.entries.pop((anime_id, episode_number, language), None)
+
+_link_cache = None
+
+def get_link_cache():
+    global _link_cache
+    if _link_cache is None:
+        _link_cache = StreamLinkCache()
+    return _link_cache
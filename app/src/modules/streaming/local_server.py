@@ -0,0 +1,127 @@
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+from loguru import logger
+
+# Desligue para o player abrir as URLs remotas diretamente
+STREAM_PROXY_ENABLED = True
+
+class StreamRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.dispatch(self, "GET")
+
+    def do_HEAD(self):
+        self.server.dispatch(self, "HEAD")
+
+    def log_message(self, format, *args):
+        # Um log por pedido do player seria ruído; erros passam pelo dispatch
+        pass
+
+class LocalStreamServer(ThreadingHTTPServer):
+    """Servidor HTTP em 127.0.0.1 que o player abre no lugar das URLs remotas
+
+    Cada rota é registrada por nome (o primeiro trecho do caminho, ex.: /range/...)
+    e recebe (handler, método, resto do caminho). Cada conexão do player roda
+    em uma thread própria.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StreamRequestHandler)
+        self.routes = {}
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def add_route(self, name, route):
+        self.routes[name] = route
+
+    def url_for(self, name, path):
+        return f"{self.base_url}/{name}/{path}"
+
+    def dispatch(self, request, method):
+        name, _, rest = urlsplit(request.path).path.lstrip("/").partition("/")
+        route = self.routes.get(name)
+        if route is None:
+            request.send_error(404)
+            return
+        try:
+            route.handle(request, method, rest)
+        except (BrokenPipeError, ConnectionResetError):
+            # O player fechou a conexão (seek, troca de stream, fechou a janela)
+            request.close_connection = True
+        except Exception as e:
+            logger.error(f"❌ Erro no servidor local ({name}): {e}")
+            request.close_connection = True
+            try:
+                request.send_error(502, str(e))
+            except OSError:
+                pass
+
+    def handle_error(self, request, client_address):
+        # Conexão derrubada pelo player entre dois pedidos não é erro
+        error = sys.exc_info()[1]
+        if isinstance(error, (BrokenPipeError, ConnectionResetError)):
+            return
+        logger.error(f"❌ Erro no servidor local ({client_address[0]}): {error}")
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, name="local-stream-server", daemon=True)
+        self.thread.start()
+        logger.info(f"📡 Servidor local de streams em {self.base_url}")
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+_stream_server = None
+_stream_server_lock = threading.Lock()
+# Cabeçalhos que a origem exige por URL (ex.: Referer), registrados por quem resolve o stream
+_stream_headers = {}
+_stream_headers_lock = threading.Lock()
+
+def get_stream_server():
+    """Servidor local, iniciado no primeiro uso"""
+    global _stream_server
+    with _stream_server_lock:
+        if _stream_server is None:
+            server = LocalStreamServer()
+            server.start()
+            _stream_server = server
+        return _stream_server
+
+def stop_stream_server():
+    global _stream_server
+    with _stream_server_lock:
+        if _stream_server is not None:
+            _stream_server.stop()
+            _stream_server = None
+
+def register_stream_headers(url, headers):
+    """Cabeçalhos a enviar à origem quando o player abrir url pelo servidor local"""
+    if headers:
+        with _stream_headers_lock:
+            _stream_headers[url] = dict(headers)
+
+def local_stream_url(url):
+    """URL que o player deve abrir para um stream; a remota se não houver rota para ela"""
+    if not STREAM_PROXY_ENABLED or not url.startswith(("http://", "https://")):
+        return url
+    with _stream_headers_lock:
+        headers = _stream_headers.get(url)
+    try:
+        from modules.streaming.hls import is_hls_url
+        if is_hls_url(url):
+            from modules.streaming.hls import get_hls_route
+            return get_hls_route().local_url(url, headers)
+        from modules.streaming.range_cache import get_range_route
+        return get_range_route().local_url(url, headers)
+    except Exception as e:
+        logger.error(f"❌ Servidor local indisponível, usando a URL remota: {e}")
+        return url
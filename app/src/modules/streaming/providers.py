@@ -0,0 +1,209 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import requests
+from loguru import logger
+
+from modules.streaming.local_server import register_stream_headers
+from modules.streaming.quality_probe import probe_before_start, ranked_qualities
+
+# Tempo máximo de uma corrida; provedores mais lentos ficam de fora
+PROVIDER_TIMEOUT_SECONDS = 20
+# Depois do primeiro stream válido, quanto esperar pelos outros antes de escolher
+RACE_GRACE_SECONDS = 1.0
+TTFB_TIMEOUT = (5, 5)
+# Dois idiomas x dois provedores resolvendo ao mesmo tempo
+PROVIDER_WORKERS = 4
+
+ANIWATCH_SOURCES_URL = "http://localhost:4000/api/v2/hianime/episode/sources"
+ANIWATCH_SERVERS = ("hd-1", "hd-2")
+# O "dub" do aniwatch é a dublagem em inglês, não substitui a brasileira
+ANIWATCH_CATEGORIES = {'legendado': 'sub'}
+# O "sub" tem áudio japonês e as legendas em faixas à parte: só serve como
+# legendado com uma faixa em português (pelo começo do rótulo, ex.: "Portuguese - Brazilian Portuguese")
+ANIWATCH_SUBTITLE_LANGUAGES = ("portuguese", "português")
+
+class StreamSource:
+    """Links de um provedor para um episódio, com o tempo até o primeiro byte medido
+
+    subtitles: legendas em arquivos à parte ({'url', 'label'}), que o player
+    carrega e mostra junto com o vídeo.
+    """
+
+    def __init__(self, provider, streaming_links, headers=None, subtitles=None):
+        self.provider = provider
+        self.streaming_links = streaming_links
+        self.headers = headers or {}
+        self.subtitles = subtitles or []
+        self.ttfb = None
+
+    def preferred_quality(self):
+        return ranked_qualities(self.streaming_links)[0]
+
+class AnimeFireProvider:
+    """Raspagem do AnimeFire; episode_link(episódio, dub) monta a URL da página"""
+
+    name = "animefire"
+
+    def __init__(self, episode_link, downloader):
+        self.episode_link = episode_link
+        self.downloader = downloader
+
+    def resolve(self, episode, language, report_progress, cancel_event):
+        episode_link = self.episode_link(episode, dub=language == 'dublado')
+        logger.info(f"🔗 Link do episódio gerado: {episode_link}")
+        if cancel_event.is_set():
+            return None
+
+        streaming_info = self.downloader.obter_links_streaming_episodio(
+            episode_link,
+            callback_progresso=report_progress,
+            evento_cancelamento=cancel_event
+        )
+        if not streaming_info['success'] or not streaming_info.get('streaming_links'):
+            raise RuntimeError(streaming_info.get('error', 'Erro desconhecido'))
+        return StreamSource(self.name, streaming_info['streaming_links'])
+
+class AniwatchProvider:
+    """Fontes HLS da API local do aniwatch (/episode/sources), pelo episodeId"""
+
+    name = "aniwatch"
+
+    def resolve(self, episode, language, report_progress, cancel_event):
+        category = ANIWATCH_CATEGORIES.get(language)
+        episode_id = episode.get('episodeId')
+        if not category or not episode_id:
+            return None
+
+        errors = []
+        for server in ANIWATCH_SERVERS:
+            if cancel_event.is_set():
+                return None
+            response = requests.get(ANIWATCH_SOURCES_URL, timeout=TTFB_TIMEOUT, params={
+                'animeEpisodeId': episode_id, 'server': server, 'category': category})
+            if response.status_code != 200:
+                errors.append(f"{server}: {response.status_code}")
+                continue
+            data = response.json().get('data') or {}
+            streaming_links = {}
+            for source in data.get('sources', []):
+                if source.get('url'):
+                    streaming_links.setdefault(source.get('quality') or 'Auto', source['url'])
+            if not streaming_links:
+                errors.append(f"{server}: sem fontes")
+                continue
+            subtitles = portuguese_subtitles(data.get('tracks') or data.get('subtitles') or [])
+            if not subtitles:
+                errors.append(f"{server}: sem legenda em português")
+                continue
+            return StreamSource(self.name, streaming_links, data.get('headers'), subtitles)
+        raise RuntimeError(f"aniwatch sem fontes ({', '.join(errors)})")
+
+def portuguese_subtitles(tracks):
+    """Faixas de legenda em português da resposta do aniwatch, como {'url', 'label'}"""
+    subtitles = []
+    for track in tracks:
+        url = track.get('file') or track.get('url')
+        label = track.get('label') or track.get('lang') or ''
+        # "thumbnails" são as miniaturas da barra de progresso
+        if not url or track.get('kind') == 'thumbnails':
+            continue
+        if label.lower().startswith(ANIWATCH_SUBTITLE_LANGUAGES):
+            subtitles.append({'url': url, 'label': label})
+    return subtitles
+
+def measure_ttfb(url, headers=None, timeout=TTFB_TIMEOUT):
+    """Segundos até o primeiro byte do stream; erro se a origem recusar"""
+    began = time.perf_counter()
+    with requests.get(url, headers={**(headers or {}), "Range": "bytes=0-0"},
+                      stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        next(response.iter_content(1), None)
+    return time.perf_counter() - began
+
+def resolve_and_probe(provider, episode, language, report_progress, cancel_event):
+    source = provider.resolve(episode, language, report_progress, cancel_event)
+    if source is None or cancel_event.is_set():
+        return None
+    source.ttfb = measure_ttfb(source.streaming_links[source.preferred_quality()], source.headers)
+    # Host sem medição recente: mede antes de o player escolher a qualidade
+    # inicial, com prazo curto (passado o prazo, começa pela maior)
+    probe_before_start(source.streaming_links, source.headers)
+    return source
+
+_executor = ThreadPoolExecutor(max_workers=PROVIDER_WORKERS, thread_name_prefix="stream-provider")
+
+def race_providers(providers, episode, language, report_progress, cancel_event, on_late_source=None,
+                   timeout=PROVIDER_TIMEOUT_SECONDS, grace=RACE_GRACE_SECONDS):
+    """Consulta os provedores em paralelo e devolve as fontes válidas, a mais rápida primeiro
+
+    Cada provedor resolve e mede o tempo até o primeiro byte da sua melhor
+    qualidade. A corrida termina quando todos responderam, grace segundos
+    depois da primeira fonte válida ou no timeout. As demais fontes ficam na
+    lista para o player trocar se a primeira falhar durante a reprodução.
+    Provedores que respondem depois da corrida chamam on_late_source(lista,
+    fonte) da thread deles; quem recebe acrescenta a fonte no fim da lista na
+    thread que a usa (a lista devolvida pode já estar com a interface).
+    """
+    futures = {_executor.submit(resolve_and_probe, provider, episode, language, report_progress, cancel_event):
+               provider for provider in providers}
+    pending = set(futures)
+    sources, errors = [], []
+    deadline = time.monotonic() + timeout
+
+    while pending and not cancel_event.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        # Em fatias curtas para notar o cancelamento
+        done, pending = wait(pending, timeout=min(remaining, 0.2), return_when=FIRST_COMPLETED)
+        for future in done:
+            provider = futures[future]
+            try:
+                source = future.result()
+            except Exception as e:
+                logger.warning(f"⚠️ Provedor {provider.name} falhou: {e}")
+                errors.append(f"{provider.name}: {e}")
+                continue
+            if source is None:
+                continue
+            logger.info(f"🏁 {provider.name}: primeiro byte em {source.ttfb * 1000:.0f} ms")
+            sources.append(source)
+            deadline = min(deadline, time.monotonic() + grace)
+
+    if cancel_event.is_set():
+        return []
+    if not sources:
+        raise RuntimeError("; ".join(errors) or "Nenhum provedor tem este episódio")
+
+    sources.sort(key=lambda source: source.ttfb)
+    for source in sources:
+        register_source_headers(source)
+    for future in pending:
+        provider = futures[future]
+        logger.info(f"⏰ Provedor {provider.name} ficou de fora da corrida")
+        if on_late_source:
+            future.add_done_callback(lambda future, provider=provider: deliver_late_source(
+                sources, provider, future, cancel_event, on_late_source))
+    logger.info(f"✅ Usando {sources[0].provider} ({len(sources) - 1} alternativa(s))")
+    return sources
+
+def register_source_headers(source):
+    for url in source.streaming_links.values():
+        register_stream_headers(url, source.headers)
+
+def deliver_late_source(sources, provider, future, cancel_event, on_late_source):
+    """Fonte que chegou depois da corrida (thread do provedor): repassada a on_late_source"""
+    try:
+        source = future.result()
+    except Exception as e:
+        logger.debug(f"⚠️ Provedor {provider.name} falhou depois da corrida: {e}")
+        return
+    if source is None or cancel_event.is_set():
+        return
+    register_source_headers(source)
+    logger.info(f"➕ {provider.name} respondeu depois da corrida: entra como alternativa")
+    try:
+        on_late_source(sources, source)
+    except RuntimeError as e:
+        # O player foi fechado entre o cancelamento e a entrega
+        logger.debug(f"⚠️ Fonte atrasada de {provider.name} descartada: {e}")
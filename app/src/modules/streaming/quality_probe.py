@@ -0,0 +1,254 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from urllib.parse import urlsplit
+import requests
+from loguru import logger
+
+from modules.database.connection_manager import get_app_data_path
+from modules.streaming.hls import is_hls_url
+
+# Da maior para a menor; qualidades com outros nomes vêm depois
+PREFERRED_QUALITIES = ['F-HD', 'HD', 'SD']
+# Cada qualidade baixa até PROBE_BYTES ou por até PROBE_SECONDS, o que vier antes
+PROBE_BYTES = 512 * 1024
+PROBE_SECONDS = 2.0
+# Antes de escolher a qualidade inicial a leitura é mais curta, e a espera
+# por ela tem prazo: se passar, começa pela maior qualidade
+START_PROBE_SECONDS = 1.0
+START_PROBE_DEADLINE_SECONDS = 2.5
+PROBE_TIMEOUT = (5, 5)
+# Com menos que isso a conta da vazão é dominada pela latência
+MIN_PROBE_BYTES = 64 * 1024
+PROBE_WORKERS = 6
+CHUNK_SIZE = 16 * 1024
+# Dentro desse tempo a medição do host é reaproveitada e só os tamanhos são
+# lidos: medir de novo com um stream tocando do mesmo host subestimaria a banda
+PROBE_REUSE_SECONDS = 30 * 60
+# Vazão necessária em relação ao bitrate para tocar sem travar
+THROUGHPUT_MARGIN = 1.3
+# Peso da medição nova na média guardada por host
+THROUGHPUT_SMOOTHING = 0.5
+MEASUREMENT_MAX_AGE_SECONDS = 30 * 24 * 3600
+# Duração usada no bitrate enquanto a do vídeo não é conhecida
+ASSUMED_EPISODE_SECONDS = 24 * 60
+# Bytes/s típicos de cada qualidade, quando o tamanho do arquivo não é conhecido
+TYPICAL_BITRATES = {'F-HD': 300_000, 'HD': 150_000, 'SD': 75_000}
+
+def host_of(url):
+    return urlsplit(url).hostname or ""
+
+def ranked_qualities(streaming_links):
+    known = [quality for quality in PREFERRED_QUALITIES if quality in streaming_links]
+    return known + [quality for quality in streaming_links if quality not in PREFERRED_QUALITIES]
+
+class UrlProbe:
+    def __init__(self, latency, received, first_byte_at, finished_at, size):
+        self.latency = latency
+        self.received = received
+        self.first_byte_at = first_byte_at
+        self.finished_at = finished_at
+        self.size = size
+
+class HostThroughput:
+    """Vazão (bytes/s) e latência medidas por host, lembradas entre sessões
+
+    Fica em stream_hosts.json na pasta de dados; cada medição nova entra em
+    uma média com a anterior. Os tamanhos dos arquivos vistos nas medições dão
+    o bitrate de cada qualidade: por URL em memória e, por host e qualidade,
+    salvos junto com a vazão (episódios novos do host usam o último visto).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        # Medições de um mesmo host não rodam juntas (dividiriam a banda)
+        self.host_locks = {}
+        self.hosts = self.load()
+        self.sizes = {}
+
+    def load(self):
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self):
+        """Grava as medições (chamado com self.lock)"""
+        temporary = self.path.with_suffix(".tmp")
+        try:
+            temporary.write_text(json.dumps(self.hosts))
+            temporary.replace(self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Não foi possível salvar as medições de streams: {e}")
+
+    def host_lock(self, host):
+        with self.lock:
+            return self.host_locks.setdefault(host, threading.Lock())
+
+    def measurement(self, host, max_age=MEASUREMENT_MAX_AGE_SECONDS):
+        with self.lock:
+            entry = self.hosts.get(host)
+        # Um host só com tamanhos ainda não tem vazão medida
+        if entry and "throughput" in entry and time.time() - entry["updated"] <= max_age:
+            return entry
+        return None
+
+    def throughput(self, host):
+        entry = self.measurement(host)
+        return entry["throughput"] if entry else None
+
+    def record(self, host, throughput, latency=None):
+        """Junta uma medição à média do host; sem latency, mantém a anterior"""
+        with self.lock:
+            previous = self.hosts.setdefault(host, {})
+            if "throughput" in previous and time.time() - previous["updated"] <= MEASUREMENT_MAX_AGE_SECONDS:
+                throughput = previous["throughput"] + THROUGHPUT_SMOOTHING * (throughput - previous["throughput"])
+                if latency is None:
+                    latency = previous["latency"]
+                else:
+                    latency = previous["latency"] + THROUGHPUT_SMOOTHING * (latency - previous["latency"])
+            if latency is None:
+                latency = 0.0
+            previous.update(throughput=throughput, latency=latency, updated=time.time())
+            self.save()
+        logger.info(f"📶 {host}: {throughput * 8 / 1e6:.1f} Mbit/s, latência {latency * 1000:.0f} ms")
+
+    def record_sizes(self, host, sizes):
+        """Tamanhos medidos em um host ({qualidade: (url, bytes)}), salvos por qualidade"""
+        sizes = {quality: (url, size) for quality, (url, size) in sizes.items() if size}
+        if not sizes:
+            return
+        with self.lock:
+            known = self.hosts.setdefault(host, {}).setdefault("sizes", {})
+            for quality, (url, size) in sizes.items():
+                self.sizes[url] = size
+                known[quality] = size
+            self.save()
+
+    def bitrate(self, url, quality, duration_seconds=None):
+        """Bytes/s necessários para tocar url em tempo real"""
+        with self.lock:
+            size = self.sizes.get(url) or self.hosts.get(host_of(url), {}).get("sizes", {}).get(quality)
+        if size:
+            return size / (duration_seconds or ASSUMED_EPISODE_SECONDS)
+        return TYPICAL_BITRATES.get(quality, TYPICAL_BITRATES['F-HD'])
+
+def total_size(response):
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range and not content_range.endswith("/*"):
+        return int(content_range.rsplit("/", 1)[1])
+    if response.status_code == 200:
+        return int(response.headers.get("Content-Length", 0)) or None
+    return None
+
+def probe_url(url, headers, max_bytes=PROBE_BYTES, max_seconds=PROBE_SECONDS):
+    """Latência e bytes recebidos de um começo de arquivo, mais o tamanho total"""
+    began = time.perf_counter()
+    with requests.get(url, headers={**headers, "Range": f"bytes=0-{max_bytes - 1}"},
+                      stream=True, timeout=PROBE_TIMEOUT) as response:
+        response.raise_for_status()
+        first_byte_at = None
+        received = 0
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if first_byte_at is None:
+                first_byte_at = time.perf_counter()
+            received += len(chunk)
+            if received >= max_bytes or time.perf_counter() - first_byte_at > max_seconds:
+                break
+        finished_at = time.perf_counter()
+        first_byte_at = first_byte_at or finished_at
+        return UrlProbe(first_byte_at - began, received, first_byte_at, finished_at, total_size(response))
+
+_executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="quality-probe")
+# Roda probe_qualities para probe_before_start, que espera com prazo
+_start_executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="quality-probe-start")
+
+def probe_qualities(streaming_links, headers=None, max_seconds=PROBE_SECONDS):
+    """Mede todas as qualidades ao mesmo tempo e atualiza a vazão de cada host
+
+    Os pedidos para um mesmo host dividem a banda, então a vazão do host é a
+    soma do que chegou dividida pelo tempo de todos juntos. Devolve
+    {qualidade: UrlProbe} das que responderam; playlists HLS ficam de fora
+    (já se adaptam à banda sozinhas).
+    """
+    headers = headers or {}
+    links = {quality: url for quality, url in streaming_links.items() if not is_hls_url(url)}
+    estimator = get_host_throughput()
+    by_host = {}
+    for quality, url in links.items():
+        by_host.setdefault(host_of(url), []).append(quality)
+
+    probes = {}
+    for host, qualities in by_host.items():
+        with estimator.host_lock(host):
+            # Medição recente: basta o tamanho de cada arquivo
+            fresh = estimator.measurement(host, PROBE_REUSE_SECONDS) is not None
+            max_bytes = 1 if fresh else PROBE_BYTES
+            futures = {quality: _executor.submit(probe_url, links[quality], headers, max_bytes, max_seconds)
+                       for quality in qualities}
+            host_probes = {}
+            for quality, future in futures.items():
+                try:
+                    host_probes[quality] = future.result()
+                except Exception as e:
+                    logger.debug(f"⚠️ Medição da qualidade {quality} falhou: {e}")
+            estimator.record_sizes(host, {quality: (links[quality], probe.size)
+                                          for quality, probe in host_probes.items()})
+            if host_probes and not fresh:
+                received = sum(probe.received for probe in host_probes.values())
+                elapsed = (max(probe.finished_at for probe in host_probes.values())
+                           - min(probe.first_byte_at for probe in host_probes.values()))
+                latency = min(probe.latency for probe in host_probes.values())
+                if elapsed > 0 and received >= MIN_PROBE_BYTES:
+                    estimator.record(host, received / elapsed, latency)
+            probes.update(host_probes)
+    return probes
+
+def probe_before_start(streaming_links, headers=None, deadline=START_PROBE_DEADLINE_SECONDS):
+    """Mede as qualidades antes da escolha da inicial, se algum host não tem medição recente
+
+    A leitura é curta (START_PROBE_SECONDS) e a espera vai até deadline: a
+    medição que não termina a tempo segue sozinha e vale para as próximas
+    escolhas, e esta fica com a maior qualidade (choose_quality sem medição).
+    Com medição recente nada é lido: os tamanhos lembrados dão o bitrate.
+    """
+    estimator = get_host_throughput()
+    hosts = {host_of(url) for url in streaming_links.values() if not is_hls_url(url)}
+    if all(estimator.measurement(host, PROBE_REUSE_SECONDS) for host in hosts):
+        return
+    future = _start_executor.submit(probe_qualities, streaming_links, headers, START_PROBE_SECONDS)
+    try:
+        future.result(timeout=deadline)
+    except TimeoutError:
+        logger.info(f"⏱️ Medição da vazão passou de {deadline:.1f}s: começando pela maior qualidade")
+    except Exception as e:
+        logger.debug(f"⚠️ Medição das qualidades falhou: {e}")
+
+def choose_quality(streaming_links, duration_seconds=None):
+    """A maior qualidade cuja vazão medida no host dá conta do bitrate
+
+    Sem medição para o host, fica com a maior, como antes; se nenhuma der
+    conta, a menor.
+    """
+    ranked = ranked_qualities(streaming_links)
+    estimator = get_host_throughput()
+    for quality in ranked:
+        url = streaming_links[quality]
+        throughput = estimator.throughput(host_of(url))
+        if throughput is None or is_hls_url(url):
+            return quality
+        if throughput >= estimator.bitrate(url, quality, duration_seconds) * THROUGHPUT_MARGIN:
+            return quality
+    return ranked[-1]
+
+_host_throughput = None
+_host_throughput_lock = threading.Lock()
+
+def get_host_throughput():
+    global _host_throughput
+    with _host_throughput_lock:
+        if _host_throughput is None:
+            _host_throughput = HostThroughput(get_app_data_path() / "stream_hosts.json")
+        return _host_throughput
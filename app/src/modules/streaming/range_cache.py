@@ -0,0 +1,426 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import requests
+from loguru import logger
+
+from modules.database.connection_manager import get_app_data_path
+from modules.streaming.local_server import get_stream_server
+
+# Blocos pequenos: o player só recebe um bloco quando ele chega inteiro
+BLOCK_SIZE = 256 * 1024
+# Quanto baixar à frente do último bloco entregue ao player
+READ_AHEAD_BLOCKS = 16 * 1024 * 1024 // BLOCK_SIZE
+# Um leitor que pede um bloco até essa distância à frente do download em
+# andamento espera por ele, em vez de reiniciar o download naquele ponto
+RESTART_DISTANCE_BLOCKS = 1024 * 1024 // BLOCK_SIZE
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+# Ao passar do limite, apaga os blocos usados há mais tempo até sobrar essa fração
+EVICT_TO_FRACTION = 0.9
+UPSTREAM_TIMEOUT = (10, 30)
+BLOCK_WAIT_SECONDS = 30
+CHUNK_SIZE = 64 * 1024
+# Downloads menores que isso não entram na vazão medida do host
+THROUGHPUT_SAMPLE_BYTES = 2 * 1024 * 1024
+
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+class BlockCache:
+    """Blocos de BLOCK_SIZE bytes em disco, um arquivo por bloco, com limite de tamanho
+
+    Cada stream (chave) tem uma pasta com os blocos e um meta.json (tamanho e
+    tipo). Ler um bloco atualiza o mtime, que define quem sai primeiro.
+    """
+
+    def __init__(self, folder, max_bytes=MAX_CACHE_BYTES):
+        self.folder = folder
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.total_bytes = sum(path.stat().st_size for path in self.folder.glob("*/*.blk"))
+
+    def block_path(self, key, index):
+        return self.folder / key / f"{index}.blk"
+
+    def has(self, key, index):
+        return self.block_path(key, index).exists()
+
+    def read(self, key, index):
+        path = self.block_path(key, index)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+        except FileNotFoundError:
+            return None
+
+    def write(self, key, index, data):
+        path = self.block_path(key, index)
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            temp_path.write_bytes(data)
+        except FileNotFoundError:
+            # A pasta sumiu numa limpeza do cache entre o mkdir e a escrita
+            path.parent.mkdir(exist_ok=True)
+            temp_path.write_bytes(data)
+        # Atômico: um leitor nunca vê um bloco pela metade
+        os.replace(temp_path, path)
+        with self.lock:
+            self.total_bytes += len(data)
+            over_limit = self.total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def evict(self):
+        with self.lock:
+            blocks = []
+            for path in self.folder.glob("*/*.blk"):
+                try:
+                    stat = path.stat()
+                    blocks.append((stat.st_mtime, stat.st_size, path))
+                except FileNotFoundError:
+                    pass
+            blocks.sort()
+            self.total_bytes = sum(size for _, size, _ in blocks)
+            target = self.max_bytes * EVICT_TO_FRACTION
+            removed = 0
+            emptied = set()
+            for _, size, path in blocks:
+                if self.total_bytes <= target:
+                    break
+                path.unlink(missing_ok=True)
+                self.total_bytes -= size
+                removed += 1
+                emptied.add(path.parent)
+            for folder in emptied:
+                self.remove_if_empty(folder)
+        logger.debug(f"🧹 Cache de streams: {removed} blocos removidos")
+
+    def remove_if_empty(self, folder):
+        """Sem blocos, a pasta da chave sai junto com o meta.json (o HLS tem uma por segmento)"""
+        if any(folder.glob("*.blk")):
+            return
+        (folder / "meta.json").unlink(missing_ok=True)
+        try:
+            folder.rmdir()
+        except OSError:
+            pass  # Um bloco sendo escrito agora (.tmp) mantém a pasta
+
+    def read_meta(self, key):
+        try:
+            return json.loads((self.folder / key / "meta.json").read_text())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def write_meta(self, key, meta):
+        folder = self.folder / key
+        folder.mkdir(exist_ok=True)
+        (folder / "meta.json").write_text(json.dumps(meta))
+
+class CachedStream:
+    """Um arquivo remoto servido por blocos, com download à frente do player
+
+    Leitores (conexões do player) pedem blocos; os que faltam são baixados por
+    uma única thread por stream, em pedidos Range contínuos, até
+    READ_AHEAD_BLOCKS à frente do último bloco pedido. Um seek para longe do
+    download em andamento o reinicia no ponto novo.
+    """
+
+    def __init__(self, key, url, cache, session, headers=None):
+        self.key = key
+        self.url = url
+        self.cache = cache
+        self.session = session
+        # Cabeçalhos exigidos pela origem (ex.: Referer), em todo pedido
+        self.headers = headers or {}
+        self.size = None
+        self.content_type = None
+        self.supports_ranges = True
+        # Blocos que sabemos estar no disco (evita um stat por bloco)
+        self.present = set()
+        # Resposta do pedido que descobriu o tamanho: vira o primeiro download
+        self.opened = None
+        self.condition = threading.Condition()
+        self.wanted = 0
+        self.horizon = 0
+        self.fill_next = None
+        self.filling = False
+        self.restart = False
+        self.error = None
+
+    @property
+    def block_count(self):
+        return (self.size + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+    def block_length(self, index):
+        return min(BLOCK_SIZE, self.size - index * BLOCK_SIZE)
+
+    def probe(self, start):
+        """Tamanho e tipo, do meta.json ou do primeiro pedido ao servidor de origem
+
+        Sem meta.json, já pede a primeira leva de blocos a partir de start; a
+        resposta fica aberta e o download à frente continua dela, sem um
+        pedido extra só para descobrir o tamanho.
+        """
+        with self.condition:
+            if self.size is not None:
+                return
+            meta = self.cache.read_meta(self.key)
+            if meta:
+                self.size, self.content_type = meta["size"], meta["content_type"]
+                return
+
+            index = start // BLOCK_SIZE
+            first_byte = index * BLOCK_SIZE
+            last_byte = first_byte + READ_AHEAD_BLOCKS * BLOCK_SIZE - 1
+            response = self.session.get(self.url, headers=self.range_headers(first_byte, last_byte),
+                                        stream=True, timeout=UPSTREAM_TIMEOUT)
+            if response.status_code >= 400:
+                response.close()
+                response.raise_for_status()
+            self.content_type = response.headers.get("Content-Type", "video/mp4")
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code == 206 and "/" in content_range:
+                self.size = int(content_range.rsplit("/", 1)[1])
+                self.cache.write_meta(self.key, {"size": self.size, "content_type": self.content_type})
+                last_block = min(self.block_count, index + READ_AHEAD_BLOCKS) - 1
+                self.opened = (index, last_block, response)
+            else:
+                # Sem Range no servidor de origem: só repassa, sem cache
+                response.close()
+                self.supports_ranges = False
+                self.size = int(response.headers.get("Content-Length", 0))
+
+    def range_headers(self, first_byte, last_byte):
+        return {**self.headers, "Range": f"bytes={first_byte}-{last_byte}"}
+
+    def is_cached(self, index):
+        if index in self.present:
+            return True
+        if self.cache.has(self.key, index):
+            self.present.add(index)
+            return True
+        return False
+
+    def block(self, index):
+        """Conteúdo do bloco, esperando o download se preciso"""
+        data = self.cache.read(self.key, index)
+        with self.condition:
+            if data is None:
+                # Pode ter sido removido pelo limite do cache
+                self.present.discard(index)
+            self.want(index)
+            while data is None:
+                if self.error:
+                    raise self.error
+                if not self.condition.wait(BLOCK_WAIT_SECONDS):
+                    raise TimeoutError(f"bloco {index} não chegou do servidor de origem")
+                data = self.cache.read(self.key, index)
+        return data
+
+    def want(self, index):
+        # Chamado com self.condition travado
+        self.error = None
+        far_from_download = (self.fill_next is None or index < self.fill_next
+                             or index > self.fill_next + RESTART_DISTANCE_BLOCKS)
+        if self.filling and far_from_download and not self.is_cached(index):
+            self.restart = True
+        self.wanted = index
+        self.horizon = min(self.block_count, index + 1 + READ_AHEAD_BLOCKS)
+        if not self.filling:
+            self.filling = True
+            threading.Thread(target=self.fill, name="stream-read-ahead", daemon=True).start()
+
+    def next_missing(self):
+        for index in range(self.wanted, self.horizon):
+            if not self.is_cached(index):
+                return index
+        return None
+
+    def fill(self):
+        while True:
+            with self.condition:
+                start = self.next_missing()
+                opened, self.opened = self.opened, None
+                if start is None:
+                    self.filling = False
+                    self.fill_next = None
+                    if opened:
+                        opened[2].close()
+                    return
+                self.fill_next = start
+                self.restart = False
+                horizon = self.horizon
+
+            if opened and opened[0] == start:
+                end, response = opened[1], opened[2]
+            else:
+                if opened:
+                    opened[2].close()
+                end, response = start, None
+                while end + 1 < horizon and not self.is_cached(end + 1):
+                    end += 1
+
+            try:
+                for index, data in self.download(start, end, response):
+                    self.cache.write(self.key, index, data)
+                    with self.condition:
+                        self.present.add(index)
+                        self.fill_next = index + 1
+                        self.condition.notify_all()
+                        if self.restart:
+                            break
+            except Exception as e:
+                logger.warning(f"⚠️ Falha ao baixar blocos {start}-{end}: {e}")
+                with self.condition:
+                    self.error = e
+                    self.filling = False
+                    self.fill_next = None
+                    self.condition.notify_all()
+                return
+
+    def download(self, first, last, response=None):
+        """Baixa os blocos first..last em um só pedido Range, entregando um a um"""
+        if response is None:
+            first_byte = first * BLOCK_SIZE
+            last_byte = first_byte + sum(self.block_length(i) for i in range(first, last + 1)) - 1
+            response = self.session.get(self.url, headers=self.range_headers(first_byte, last_byte),
+                                        stream=True, timeout=UPSTREAM_TIMEOUT)
+        with response:
+            if response.status_code != 206:
+                raise RuntimeError(f"resposta {response.status_code} a um pedido Range")
+            index, buffer = first, bytearray()
+            received, first_chunk_at = 0, None
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if first_chunk_at is None:
+                    first_chunk_at = time.perf_counter()
+                received += len(chunk)
+                buffer += chunk
+                while index <= last and len(buffer) >= self.block_length(index):
+                    length = self.block_length(index)
+                    yield index, bytes(buffer[:length])
+                    del buffer[:length]
+                    index += 1
+            if index <= last:
+                raise RuntimeError("conexão encerrada antes do fim do intervalo")
+            self.record_throughput(received, first_chunk_at)
+
+    def record_throughput(self, received, first_chunk_at):
+        """Vazão do download à frente, para o player saber se pode subir a qualidade"""
+        if first_chunk_at is None or received < THROUGHPUT_SAMPLE_BYTES:
+            return
+        elapsed = time.perf_counter() - first_chunk_at
+        if elapsed > 0:
+            # Aqui dentro: quality_probe importa hls, que importa este módulo
+            from modules.streaming.quality_probe import get_host_throughput, host_of
+            get_host_throughput().record(host_of(self.url), received / elapsed)
+
+class RangeCacheRoute:
+    """Rota /range/<chave>: serve pedidos Range do player a partir do BlockCache"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.session = requests.Session()
+        self.streams = {}
+        self.lock = threading.Lock()
+
+    def local_url(self, url, headers=None):
+        key = hashlib.sha1(url.encode()).hexdigest()[:20]
+        with self.lock:
+            if key not in self.streams:
+                self.streams[key] = CachedStream(key, url, self.cache, self.session, headers)
+            elif headers:
+                self.streams[key].headers = headers
+        return get_stream_server().url_for("range", key)
+
+    def handle(self, request, method, path):
+        stream = self.streams.get(path)
+        if stream is None:
+            request.send_error(404)
+            return
+
+        stream.probe(self.range_start(request.headers.get("Range")))
+        if not stream.supports_ranges:
+            return self.passthrough(request, method, stream)
+
+        byte_range = self.parse_range(request.headers.get("Range"), stream.size)
+        if byte_range is None:
+            request.send_response(416)
+            request.send_header("Content-Range", f"bytes */{stream.size}")
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+
+        start, end = byte_range
+        if request.headers.get("Range"):
+            request.send_response(206)
+            request.send_header("Content-Range", f"bytes {start}-{end}/{stream.size}")
+        else:
+            request.send_response(200)
+        request.send_header("Content-Type", stream.content_type)
+        request.send_header("Accept-Ranges", "bytes")
+        request.send_header("Content-Length", str(end - start + 1))
+        request.end_headers()
+        if method == "HEAD":
+            return
+
+        position = start
+        while position <= end:
+            index = position // BLOCK_SIZE
+            data = stream.block(index)
+            offset = position - index * BLOCK_SIZE
+            chunk = data[offset:offset + end - position + 1]
+            request.wfile.write(chunk)
+            position += len(chunk)
+
+    def range_start(self, header):
+        """Primeiro byte pedido, antes de saber o tamanho (bytes=-N conta como 0)"""
+        match = RANGE_PATTERN.match((header or "").strip())
+        return int(match.group(1)) if match and match.group(1) else 0
+
+    def parse_range(self, header, size):
+        """(início, fim) inclusivos, ou None se o intervalo for inválido"""
+        if not header:
+            return 0, size - 1
+        match = RANGE_PATTERN.match(header.strip())
+        if not match or not any(match.groups()):
+            return None
+        first, last = match.groups()
+        if not first:
+            # bytes=-N: os últimos N bytes
+            start, end = max(0, size - int(last)), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        if start >= size or start > end:
+            return None
+        return start, end
+
+    def passthrough(self, request, method, stream):
+        response = stream.session.get(stream.url, headers=stream.headers, stream=True, timeout=UPSTREAM_TIMEOUT)
+        with response:
+            request.send_response(response.status_code)
+            request.send_header("Content-Type", stream.content_type)
+            request.send_header("Content-Length", response.headers.get("Content-Length", "0"))
+            request.end_headers()
+            if method == "HEAD":
+                return
+            for chunk in response.iter_content(CHUNK_SIZE):
+                request.wfile.write(chunk)
+
+_range_route = None
+_range_route_lock = threading.Lock()
+
+def get_range_route():
+    """Rota de cache por Range, registrada no servidor local no primeiro uso"""
+    global _range_route
+    with _range_route_lock:
+        if _range_route is None:
+            route = RangeCacheRoute(BlockCache(get_app_data_path() / "cache" / "streams"))
+            get_stream_server().add_route("range", route)
+            _range_route = route
+        return _range_route
@@ -0,0 +1,86 @@
+import time
+
+# Orçamento de travamentos: estourado com STALL_BUDGET_COUNT travamentos ou
+# STALL_BUDGET_SECONDS travados dentro da janela, a qualidade desce um nível
+STALL_BUDGET_COUNT = 3
+STALL_BUDGET_SECONDS = 6.0
+STALL_WINDOW_SECONDS = 90.0
+# Buffer logo depois de um seek é espera do seek, não travamento
+SEEK_GRACE_SECONDS = 3.0
+
+class RebufferMonitor:
+    """Conta travamentos (rebuffers) do stream em reprodução
+
+    O player avisa quando o vídeo começou a tocar, quando travou e voltou e
+    quando houve seek; o buffer inicial e o que vem logo depois de um seek
+    não contam. Guarda os travamentos recentes, para o orçamento, e os totais
+    da sessão.
+    """
+
+    def __init__(self, budget_count=STALL_BUDGET_COUNT, budget_seconds=STALL_BUDGET_SECONDS,
+                 window=STALL_WINDOW_SECONDS):
+        self.budget_count = budget_count
+        self.budget_seconds = budget_seconds
+        self.window = window
+        self.stall_count = 0
+        self.stalled_seconds = 0.0
+        self.reset()
+
+    def reset(self, started=False):
+        """Novo stream; started quando ele já entra tocando (troca por player pré-carregado)"""
+        self.started = started
+        self.stall_began = None
+        self.seek_at = None
+        # (início, duração) dos travamentos dentro da janela
+        self.recent = []
+        self.stable_since = time.monotonic()
+
+    def playing(self):
+        if not self.started:
+            self.started = True
+            self.stable_since = time.monotonic()
+
+    def seeked(self):
+        self.seek_at = time.monotonic()
+
+    @property
+    def stalled(self):
+        return self.stall_began is not None
+
+    def stall_started(self):
+        """Devolve True se o travamento conta"""
+        now = time.monotonic()
+        if not self.started or self.stall_began is not None:
+            return False
+        if self.seek_at is not None and now - self.seek_at < SEEK_GRACE_SECONDS:
+            return False
+        self.stall_began = now
+        self.stall_count += 1
+        return True
+
+    def stall_ended(self):
+        """Duração do travamento que acabou, em segundos (None se não havia)"""
+        if self.stall_began is None:
+            return None
+        now = time.monotonic()
+        duration = now - self.stall_began
+        self.recent.append((self.stall_began, duration))
+        self.stalled_seconds += duration
+        self.stall_began = None
+        self.stable_since = now
+        return duration
+
+    def over_budget(self):
+        now = time.monotonic()
+        self.recent = [(began, duration) for began, duration in self.recent if now - began <= self.window]
+        count = len(self.recent)
+        seconds = sum(duration for _, duration in self.recent)
+        if self.stall_began is not None:
+            count += 1
+            seconds += now - self.stall_began
+        return count >= self.budget_count or seconds >= self.budget_seconds
+
+    def stable_for(self, seconds):
+        """Tocando há pelo menos seconds sem travar"""
+        return (self.started and self.stall_began is None
+                and time.monotonic() - self.stable_since >= seconds)
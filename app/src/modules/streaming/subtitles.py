@@ -0,0 +1,48 @@
+import bisect
+import html
+import re
+import requests
+
+SUBTITLE_TIMEOUT = (5, 10)
+# Falas que cobrem a mesma posição (ex.: duas pessoas falando) mostradas juntas, no máximo
+MAX_OVERLAPPING_CUES = 3
+# "00:01:02.500 --> 00:01:04.000" (WebVTT) ou "00:01:02,500 --> 00:01:04,000" (SRT); a hora é opcional
+CUE_TIMING = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{3})\s*-->\s*(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{3})")
+CUE_TAG = re.compile(r"<[^>]+>")
+
+class SubtitleTrack:
+    """Falas de uma legenda externa (início, fim e texto, em ms), buscadas pela posição do vídeo"""
+
+    def __init__(self, cues):
+        self.cues = sorted(cues)
+        self.starts = [cue[0] for cue in self.cues]
+
+    def text_at(self, position):
+        index = bisect.bisect_right(self.starts, position)
+        nearby = self.cues[max(0, index - MAX_OVERLAPPING_CUES):index]
+        return "\n".join(text for start, end, text in nearby if position < end)
+
+def to_ms(hours, minutes, seconds, millis):
+    return ((int(hours or 0) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(millis)
+
+def parse_subtitles(text):
+    """Falas de um arquivo WebVTT ou SRT; blocos sem tempo (cabeçalho, NOTE, STYLE) ficam de fora"""
+    cues = []
+    for block in re.split(r"\n\s*\n", text.replace("\r\n", "\n").strip()):
+        lines = block.split("\n")
+        for number, line in enumerate(lines):
+            timing = CUE_TIMING.search(line)
+            if timing:
+                start, end = to_ms(*timing.groups()[:4]), to_ms(*timing.groups()[4:])
+                cue_text = html.unescape(CUE_TAG.sub("", "\n".join(lines[number + 1:]))).strip()
+                if cue_text and end > start:
+                    cues.append((start, end, cue_text))
+                break
+    return SubtitleTrack(cues)
+
+def load_subtitles(url, headers=None):
+    """Baixa e interpreta a legenda (roda fora da thread da interface)"""
+    response = requests.get(url, headers=headers or {}, timeout=SUBTITLE_TIMEOUT)
+    response.raise_for_status()
+    # WebVTT é sempre UTF-8; o requests suporia Latin-1 para text/* sem charset
+    return parse_subtitles(response.content.decode("utf-8-sig", errors="replace"))
@@ -0,0 +1,216 @@
+import threading
+from loguru import logger
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
+
+# Classes de prioridade: cada uma tem seu próprio pool, com limite de threads,
+# para que downloads ou prefetch nunca ocupem as threads das ações do usuário
+PRIORITY_INTERACTIVE = "interactive"        # Respostas a cliques (detalhes, busca, links de streaming)
+PRIORITY_VISIBLE_IMAGES = "visible_images"  # Posters que estão na tela
+PRIORITY_PREFETCH = "prefetch"              # Dados que talvez sejam usados depois
+PRIORITY_DOWNLOADS = "downloads"            # Transferências longas (episódios)
+PRIORITY_SERVICES = "services"              # Tarefas de vida longa (processo e monitor da API)
+
+EXECUTOR_LIMITS = {
+    PRIORITY_INTERACTIVE: 4,
+    PRIORITY_VISIBLE_IMAGES: 3,
+    PRIORITY_PREFETCH: 2,
+    PRIORITY_DOWNLOADS: 1,
+    PRIORITY_SERVICES: 2,
+}
+
+class TaskCancelled(Exception):
+    """Lançada dentro de uma tarefa quando o seu token foi cancelado"""
+
+class CancellationToken:
+    """Token de cancelamento compartilhado entre a interface e a tarefa
+
+    Pode ser amarrado a um widget: quando o widget é destruído, o token é
+    cancelado e os resultados pendentes são descartados.
+    """
+
+    def __init__(self, owner=None):
+        self.event = threading.Event()
+        if owner is not None:
+            self.bind_to(owner)
+
+    def bind_to(self, owner):
+        owner.destroyed.connect(lambda *args: self.cancel())
+        return self
+
+    def cancel(self):
+        self.event.set()
+
+    def is_cancelled(self):
+        return self.event.is_set()
+
+    def raise_if_cancelled(self):
+        if self.event.is_set():
+            raise TaskCancelled()
+
+class TaskFuture(QObject):
+    """Resultado de uma tarefa, entregue na thread da interface por sinais"""
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+    progress = Signal(object)
+
+    def __init__(self, token, parent=None):
+        super().__init__(parent)
+        self.token = token
+        self.done = False
+        # Resultado guardado para quem conectar depois que a tarefa terminou
+        self.lock = threading.Lock()
+        self.outcome = None
+
+    def then(self, on_finished, on_failed=None, on_progress=None):
+        """Conecta os callbacks de sucesso, falha e progresso
+
+        Um resultado que ainda estava na fila do event loop quando o token foi
+        cancelado é descartado aqui, então os callbacks podem tocar em widgets.
+        Se a tarefa já terminou (uma tarefa rápida pode terminar antes do
+        then), o resultado é entregue na próxima volta do event loop.
+        """
+        with self.lock:
+            self.finished.connect(self.guarded(on_finished))
+            if on_failed:
+                self.failed.connect(self.guarded(on_failed))
+            if on_progress:
+                self.progress.connect(self.guarded(on_progress))
+            outcome = self.outcome
+
+        if outcome is not None:
+            kind, value = outcome
+            callback = on_finished if kind == "finished" else on_failed
+            if callback:
+                QTimer.singleShot(0, lambda: self.guarded(callback)(value))
+        return self
+
+    def resolve(self, kind, value):
+        """Guarda o resultado e emite finished ou failed (chamado na thread da tarefa)"""
+        with self.lock:
+            self.outcome = (kind, value)
+            signal = self.finished if kind == "finished" else self.failed
+            signal.emit(value)
+
+    def guarded(self, callback):
+        def call(*args):
+            if not self.token.is_cancelled():
+                callback(*args)
+        return call
+
+    def cancel(self):
+        self.token.cancel()
+
+    def is_cancelled(self):
+        return self.token.is_cancelled()
+
+    def report_progress(self, value):
+        """Pode ser chamado de dentro da tarefa (qualquer thread)"""
+        if not self.token.is_cancelled():
+            self.progress.emit(value)
+
+class TaskRunnable(QRunnable):
+    def __init__(self, future, function, args, kwargs):
+        super().__init__()
+        self.future = future
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.setAutoDelete(True)
+
+    def run(self):
+        future = self.future
+        if future.token.is_cancelled():
+            future.cancelled.emit()
+            return
+
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except TaskCancelled:
+            future.cancelled.emit()
+            return
+        except Exception as e:
+            if future.token.is_cancelled():
+                future.cancelled.emit()
+            else:
+                logger.error(f"❌ Erro na tarefa {getattr(self.function, '__name__', self.function)}: {e}")
+                future.resolve("failed", str(e))
+            return
+
+        # Resultado que chega depois do cancelamento é descartado
+        if future.token.is_cancelled():
+            future.cancelled.emit()
+        else:
+            future.resolve("finished", result)
+
+class TaskManager(QObject):
+    """Executores limitados por classe de prioridade"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pools = {}
+        for priority, max_threads in EXECUTOR_LIMITS.items():
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(max_threads)
+            self.pools[priority] = pool
+        # Mantém os futures vivos até o resultado ser entregue
+        self.active = set()
+        self.shutting_down = False
+
+    def submit(self, function, *args, priority=PRIORITY_INTERACTIVE, owner=None, token=None,
+               with_task=False, **kwargs):
+        """Agenda function(*args, **kwargs) no executor da prioridade
+
+        owner: widget dono da tarefa; destruí-lo cancela o token.
+        with_task: passa o próprio TaskFuture como primeiro argumento, para
+        que a tarefa consulte o token ou reporte progresso.
+        """
+        if token is None:
+            token = CancellationToken()
+        if owner is not None:
+            token.bind_to(owner)
+
+        future = TaskFuture(token)
+        if future.thread() is not self.thread():
+            # Agendada de outra thread: os sinais precisam de um event loop
+            future.moveToThread(self.thread())
+        if self.shutting_down:
+            token.cancel()
+
+        if with_task:
+            args = (future,) + args
+
+        # Limpeza enfileirada: roda depois dos callbacks do usuário
+        for signal in (future.finished, future.failed, future.cancelled):
+            signal.connect(lambda *result, future=future: self.release(future), Qt.QueuedConnection)
+        self.active.add(future)
+
+        self.pools[priority].start(TaskRunnable(future, function, args, kwargs))
+        return future
+
+    def release(self, future):
+        future.done = True
+        self.active.discard(future)
+
+    def shutdown(self, timeout_ms=3000):
+        """Cancela tudo e espera as threads terminarem (ao fechar o app)"""
+        self.shutting_down = True
+        for future in list(self.active):
+            future.cancel()
+        for pool in self.pools.values():
+            pool.clear()
+        for priority, pool in self.pools.items():
+            if not pool.waitForDone(timeout_ms if priority != PRIORITY_SERVICES else 0):
+                logger.warning(f"⚠️ Tarefas de {priority} ainda rodando ao encerrar")
+
+_task_manager = None
+
+def get_task_manager():
+    global _task_manager
+    if _task_manager is None:
+        _task_manager = TaskManager()
+    return _task_manager
+
+def run_task(function, *args, **kwargs):
+    """Atalho para get_task_manager().submit(...)"""
+    return get_task_manager().submit(function, *args, **kwargs)
@@ -1,135 +1,177 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QScrollArea, QWidget, QFrame,
-                               QGridLayout, QSizePolicy)
+                               QSizePolicy)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap
-from PySide6.QtWebEngineWidgets import QWebEngineView
 
-import json
 from loguru import logger
 import re
-import requests
+import threading
 
-from modules.anime.anime_data import get_anime_info, get_anime_episodes, get_anime_by_id, get_anime_with_fallback
-from modules.anime.animefire_downloader import AnimeFireDownloader
+from modules.anime.anime_data import get_anime_info, get_anime_episodes, get_anime_by_id, get_anime_by_name
+from modules.ui.episode_list import EpisodeBrowser
+from modules.tasks.task_manager import run_task, CancellationToken, PRIORITY_INTERACTIVE
+from styles.theme import set_style_state
 
-def get_anime_structure(anime):
-    anime_info = get_anime_info(anime['id'])
-    
-    if not anime_info:
-        logger.error(f"❌ Não foi possível obter informações do anime {anime['id']}")
-        return None
-        
+def get_card_structure(anime):
+    """Estrutura inicial com os dados que o card já possui (sem rede)"""
+    anime_name = anime.get("name", "")
+    return {
+        "name": anime_name,
+        "anilistId": 0,
+        "status": "...",
+        "episodes": anime.get("episodes", "?"),
+        "poster": anime.get("poster", ""),
+        "id": anime.get("id", ""),
+        "type": anime.get("type", "N/A"),
+        "description": "Carregando descrição...",
+        "genres": [],
+        "studio": None,
+        "duration": None,
+        "year": "...",
+        "original_name": anime_name
+    }
+
+def parse_anime_info(anime_info):
+    """Campos vindos da API do aniwatch (/anime/{id})"""
     more_info = anime_info["data"]["anime"]["moreInfo"]
     anime_data = anime_info["data"]["anime"]["info"]
-    
-    # Tenta obter dados do AniList com fallback
-    anilist_id = anime_data.get("anilistId", 0)
     anime_name = anime_data.get("name", "")
-    
-    anilist_data = get_anime_with_fallback(anilist_id, anime_name)
-    
-    # Se conseguiu dados do AniList, usa informações mais precisas
-    if anilist_data and anilist_data.get('data', {}).get('Media'):
-        media = anilist_data['data']['Media']
-        title_data = media.get('title', {})
-        
-        return {
-            "name": title_data.get('romaji') or title_data.get('english') or anime_name,
-            "anilistId": media.get('id', anilist_id),
-            "status": more_info.get("status", "N/A"),
-            "episodes": anime_data["stats"]["episodes"]["sub"] if "episodes" in anime_data["stats"] else "?",
-            "poster": anime_data.get("poster", ""),
-            "id": anime_data.get("id", ""),
-            "type": anime_data["stats"].get("type", "N/A"),
-            "description": anime_data.get("description", "Descrição não disponível."),
-            "genres": more_info.get("genres", []),
-            "studio": more_info.get("studios", "N/A"),
-            "duration": more_info.get("duration", "N/A"),
-            "year": more_info.get("aired", "N/A"),
-            "original_name": anime_name  # Guarda o nome original para fallback
-        }
-    else:
-        # Fallback para dados básicos
-        logger.warning(f"⚠️ Usando dados básicos para {anime_name} (AniList não disponível)")
-        return {
-            "name": anime_name,
-            "anilistId": anilist_id,
-            "status": more_info.get("status", "N/A"),
-            "episodes": anime_data["stats"]["episodes"]["sub"] if "episodes" in anime_data["stats"] else "?",
-            "poster": anime_data.get("poster", ""),
-            "id": anime_data.get("id", ""),
-            "type": anime_data["stats"].get("type", "N/A"),
-            "description": anime_data.get("description", "Descrição não disponível."),
-            "genres": more_info.get("genres", []),
-            "studio": more_info.get("studios", "N/A"),
-            "duration": more_info.get("duration", "N/A"),
-            "year": more_info.get("aired", "N/A"),
-            "original_name": anime_name
-        }
 
-class EpisodeButton(QPushButton):
-    def __init__(self, episode_data, parent=None):
-        super().__init__(parent)
-        self.episode_data = episode_data
-        self.setup_ui()
-        
-    def setup_ui(self):
-        episode_number = self.episode_data.get('number', 0)
-        episode_title = self.episode_data.get('title', f'Episódio {episode_number}')
-        is_filler = self.episode_data.get('isFiller', False)
-        
-        # Texto do botão
-        filler_text = " (Filler)" if is_filler else ""
-        self.setText(f"EP {episode_number}\n{episode_title}{filler_text}")
-        
-        self.setFixedSize(180, 80)
-        self.setStyleSheet("""
-            EpisodeButton {
-                background: #2a2a2a;
-                color: white;
-                border: 2px solid #3a3a3a;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 11px;
-                text-align: center;
-            }
-            EpisodeButton:hover {
-                background: #333333;
-                border: 2px solid #ff7b00;
-            }
-            EpisodeButton:pressed {
-                background: #ff7b00;
-            }
-        """)
-        
-        # Tooltip com informações detalhadas
-        self.setToolTip(f"Episódio {episode_number}: {episode_title}")
+    return {
+        "name": anime_name,
+        "anilistId": anime_data.get("anilistId", 0),
+        "status": more_info.get("status", "N/A"),
+        "episodes": anime_data["stats"]["episodes"]["sub"] if "episodes" in anime_data["stats"] else "?",
+        "poster": anime_data.get("poster", ""),
+        "id": anime_data.get("id", ""),
+        "type": anime_data["stats"].get("type", "N/A"),
+        "description": anime_data.get("description", "Descrição não disponível."),
+        "genres": more_info.get("genres", []),
+        "studio": more_info.get("studios", "N/A"),
+        "duration": more_info.get("duration", "N/A"),
+        "year": more_info.get("aired", "N/A"),
+        "original_name": anime_name  # Guarda o nome original para fallback
+    }
+
+def get_anilist_media(anilist_data):
+    if anilist_data and anilist_data.get('data', {}).get('Media'):
+        return anilist_data['data']['Media']
+    return None
 
 class AnimeDetailsDialog(QDialog):
     def __init__(self, anime, image_loader_callback, parent=None):
         super().__init__(parent)
-        self.anime = get_anime_structure(anime)
+        # Abre na hora com os dados do card; o resto chega em paralelo
+        self.anime = get_card_structure(anime)
         self.image_loader_callback = image_loader_callback
         self.episodes_data = None
-        self.downloader = AnimeFireDownloader()
+        self.anilist_media = None
+        self.anilist_by_id_requested = False
+        # Cancelado ao fechar: respostas atrasadas não tocam em widgets destruídos
+        self.fetch_token = CancellationToken()
+        # Cópia de self.anime lida pelas threads que resolvem links; a interface
+        # troca a cópia inteira quando os dados mudam, nunca a altera
+        self.link_anime = dict(self.anime)
+        self._downloader = None
+        self.downloader_lock = threading.Lock()
         
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setup_ui()
         
-        # Carrega os episódios em background
-        self.load_episodes()
-           
+        self.start_fetches()
+
+    @property
+    def downloader(self):
+        # Carregado só quando um episódio é aberto (traz o BeautifulSoup junto);
+        # os dois idiomas pedem ao mesmo tempo, de threads diferentes
+        with self.downloader_lock:
+            if self._downloader is None:
+                from modules.anime.animefire_downloader import AnimeFireDownloader
+                self._downloader = AnimeFireDownloader()
+            return self._downloader
+
+    def start_fetches(self):
+        """Dispara informações, episódios e AniList ao mesmo tempo"""
+        anime_id = self.anime.get('id')
+        self.run_fetch(get_anime_info, (anime_id,), self.on_info_loaded, self.on_info_failed)
+        self.run_fetch(get_anime_episodes, (anime_id,), self.on_episodes_loaded, self.on_episodes_failed)
+        # O card não tem o ID do AniList: busca pelo nome e confere quando a info chegar
+        if self.anime.get('name'):
+            self.run_fetch(get_anime_by_name, (self.anime['name'],), self.on_anilist_loaded, self.on_anilist_failed)
+
+    def run_fetch(self, function, args, on_finished, on_failed):
+        run_task(function, *args, priority=PRIORITY_INTERACTIVE, token=self.fetch_token).then(on_finished, on_failed)
+
+    def done(self, result):
+        self.fetch_token.cancel()
+        super().done(result)
+
+    def on_info_loaded(self, anime_info):
+        if not anime_info:
+            logger.error(f"❌ Não foi possível obter informações do anime {self.anime.get('id')}")
+            self.on_info_failed("sem dados")
+            return
+
+        try:
+            info = parse_anime_info(anime_info)
+        except (KeyError, TypeError) as e:
+            self.on_info_failed(str(e))
+            return
+
+        # O título do AniList (se já chegou e é o mesmo anime) tem prioridade
+        if self.anilist_media and info["anilistId"] in (0, self.anilist_media.get('id')):
+            info.pop("name")
+        if not info.get("poster"):
+            info.pop("poster")
+        self.anime.update(info)
+        self.link_anime = dict(self.anime)
+        self.request_anilist_by_id()
+        self.refresh_info()
+
+    def on_info_failed(self, error):
+        logger.warning(f"⚠️ Informações detalhadas indisponíveis: {error}")
+        self.anime.update({"description": "Descrição não disponível.", "status": "N/A", "year": "N/A"})
+        self.refresh_info()
+
+    def on_anilist_loaded(self, anilist_data):
+        media = get_anilist_media(anilist_data)
+        if not media:
+            self.on_anilist_failed("sem dados")
+            return
+
+        anilist_id = self.anime.get('anilistId')
+        if anilist_id and media.get('id') != anilist_id:
+            # A busca por nome trouxe outro anime; vale o ID da info
+            self.request_anilist_by_id()
+            return
+
+        self.anilist_media = media
+        title_data = media.get('title', {})
+        self.anime["name"] = title_data.get('romaji') or title_data.get('english') or self.anime["original_name"]
+        self.anime["anilistId"] = media.get('id', anilist_id)
+        self.link_anime = dict(self.anime)
+        self.refresh_info()
+
+    def on_anilist_failed(self, error):
+        logger.warning(f"⚠️ Usando dados básicos para {self.anime.get('original_name')} (AniList não disponível)")
+        self.request_anilist_by_id()
+
+    def request_anilist_by_id(self):
+        """Busca no AniList pelo ID da info quando a busca por nome não confere"""
+        anilist_id = self.anime.get('anilistId')
+        if not anilist_id or self.anilist_by_id_requested:
+            return
+        if self.anilist_media and self.anilist_media.get('id') == anilist_id:
+            return
+
+        self.anilist_by_id_requested = True
+        self.run_fetch(get_anime_by_id, (anilist_id,), self.on_anilist_loaded, self.on_anilist_failed)
+
     def setup_ui(self):
         self.setWindowTitle(f"Detalhes - {self.anime.get('name', 'Anime')}")
         self.setFixedSize(900, 700)  # Aumentei o tamanho para caber os episódios
-        self.setStyleSheet("""
-            QDialog {
-                background: #1e1e1e;
-                border-radius: 15px;
-                border: 2px solid #ff7b00;
-            }
-        """)
+        self.setObjectName("anime_details")
         
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -139,30 +181,6 @@ class AnimeDetailsDialog(QDialog):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #2a2a2a;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #ff7b00;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #ff9500;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
         
         # Widget de conteúdo que vai dentro da scroll area
         self.content_widget = QWidget()
@@ -199,70 +217,44 @@ class AnimeDetailsDialog(QDialog):
     def create_episodes_section(self):
         """Cria a seção de episódios (inicialmente vazia)"""
         section = QFrame()
-        section.setStyleSheet("""
-            QFrame {
-                background: #2a2a2a;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        section.setProperty("role", "panel")
         
         layout = QVBoxLayout()
         
         # Título da seção
         title_label = QLabel("📺 Episódios")
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #ff7b00;
-                font-size: 18px;
-                font-weight: bold;
-                margin-bottom: 15px;
-            }
-        """)
-        
-        # Container para os botões de episódios
-        self.episodes_container = QWidget()
-        self.episodes_grid = QGridLayout()
-        self.episodes_grid.setSpacing(10)
-        self.episodes_grid.setContentsMargins(0, 0, 0, 0)
-        
-        self.episodes_container.setLayout(self.episodes_grid)
+        title_label.setProperty("role", "panel_title")
+        
+        # Lista virtualizada de episódios (custo constante, mesmo com 1000+ episódios)
+        self.episode_browser = EpisodeBrowser()
+        self.episode_browser.episode_selected.connect(self.play_episode)
+        self.episode_browser.hide()
         
         # Label de carregamento
         self.episodes_loading_label = QLabel("Carregando episódios...")
-        self.episodes_loading_label.setStyleSheet("""
-            QLabel {
-                color: #888;
-                font-size: 14px;
-                text-align: center;
-                padding: 20px;
-            }
-        """)
+        self.episodes_loading_label.setObjectName("episodes_status")
         self.episodes_loading_label.setAlignment(Qt.AlignCenter)
         
         layout.addWidget(title_label)
         layout.addWidget(self.episodes_loading_label)
-        layout.addWidget(self.episodes_container)
+        layout.addWidget(self.episode_browser)
         
         section.setLayout(layout)
         return section
     
-    def load_episodes(self):
-        """Carrega os episódios do anime"""
-        try:
-            anime_episodes = get_anime_episodes(self.anime.get('id'))
-            if anime_episodes and "data" in anime_episodes:
-                self.episodes_data = anime_episodes["data"]
-                logger.info(f"✅ Episódios carregados: {len(self.episodes_data.get('episodes', []))} episódios")
-                
-                # Atualiza a UI com os episódios
-                self.display_episodes()
-            else:
-                self.show_episodes_error("Não foi possível carregar os episódios.")
-                
-        except Exception as e:
-            logger.error(f"❌ Erro ao carregar episódios: {e}")
-            self.show_episodes_error("Erro ao carregar episódios.")
+    def on_episodes_loaded(self, anime_episodes):
+        if anime_episodes and "data" in anime_episodes:
+            self.episodes_data = anime_episodes["data"]
+            logger.info(f"✅ Episódios carregados: {len(self.episodes_data.get('episodes', []))} episódios")
+            
+            # Atualiza a UI com os episódios
+            self.display_episodes()
+        else:
+            self.show_episodes_error("Não foi possível carregar os episódios.")
+
+    def on_episodes_failed(self, error):
+        logger.error(f"❌ Erro ao carregar episódios: {error}")
+        self.show_episodes_error("Erro ao carregar episódios.")
     
     def display_episodes(self):
         """Exibe os episódios na interface"""
@@ -285,36 +277,13 @@ class AnimeDetailsDialog(QDialog):
         if isinstance(title_label, QLabel):
             title_label.setText(episodes_title)
         
-        # Limpa o grid anterior
-        for i in reversed(range(self.episodes_grid.count())): 
-            self.episodes_grid.itemAt(i).widget().setParent(None)
-        
-        # Adiciona os botões de episódios
-        row, col = 0, 0
-        max_cols = 4  # 4 botões por linha
-        
-        for episode in episodes:
-            episode_btn = EpisodeButton(episode)
-            episode_btn.clicked.connect(lambda checked, ep=episode: self.play_episode(ep))
-            
-            self.episodes_grid.addWidget(episode_btn, row, col)
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        self.episode_browser.set_episodes(episodes)
+        self.episode_browser.show()
     
     def show_episodes_error(self, message):
         """Mostra mensagem de erro na seção de episódios"""
         self.episodes_loading_label.setText(message)
-        self.episodes_loading_label.setStyleSheet("""
-            QLabel {
-                color: #ff4444;
-                font-size: 14px;
-                text-align: center;
-                padding: 20px;
-            }
-        """)
+        set_style_state(self.episodes_loading_label, "state", "error")
     
     def play_episode(self, episode_data):
         """Abre a seleção de servidor para um episódio"""     
@@ -328,13 +297,7 @@ class AnimeDetailsDialog(QDialog):
         # Poster grande
         poster_label = QLabel()
         poster_label.setFixedSize(200, 280)
-        poster_label.setStyleSheet("""
-            QLabel {
-                background: #2a2a2a;
-                border-radius: 10px;
-                border: 2px solid #444;
-            }
-        """)
+        poster_label.setObjectName("details_poster")
         poster_label.setAlignment(Qt.AlignCenter)
         poster_label.setText("Carregando...")
         
@@ -350,30 +313,16 @@ class AnimeDetailsDialog(QDialog):
         info_layout = QVBoxLayout()
         info_layout.setSpacing(10)
         
-        title_label = QLabel(self.anime.get('name', 'Título não disponível'))
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #ff7b00;
-                font-size: 24px;
-                font-weight: bold;
-            }
-        """)
-        title_label.setWordWrap(True)
+        self.title_label = QLabel(self.anime.get('name', 'Título não disponível'))
+        self.title_label.setObjectName("details_title")
+        self.title_label.setWordWrap(True)
         
         # Metadados
-        metadata_text = f"""
-        <p style="color: white; font-size: 14px;">
-            <b>Tipo:</b> {self.anime.get('type', 'N/A')}<br>
-            <b>Episódios:</b> {self.anime.get('episodes', '?')}<br>
-            <b>Status:</b> {self.anime.get('status', 'N/A')}<br>
-            <b>Lançamento:</b> {self.anime.get('year', 'N/A')}
-        </p>
-        """
-        metadata_label = QLabel(metadata_text)
-        metadata_label.setStyleSheet("background: transparent;")
+        self.metadata_label = QLabel(self.get_metadata_text())
+        self.metadata_label.setObjectName("details_metadata")
         
-        info_layout.addWidget(title_label)
-        info_layout.addWidget(metadata_label)
+        info_layout.addWidget(self.title_label)
+        info_layout.addWidget(self.metadata_label)
         info_layout.addStretch()
         info_widget.setLayout(info_layout)
         
@@ -384,88 +333,82 @@ class AnimeDetailsDialog(QDialog):
         widget.setLayout(layout)
         return widget
     
+    def get_metadata_text(self):
+        return f"""
+        <p style="color: white; font-size: 14px;">
+            <b>Tipo:</b> {self.anime.get('type', 'N/A')}<br>
+            <b>Episódios:</b> {self.anime.get('episodes', '?')}<br>
+            <b>Status:</b> {self.anime.get('status', 'N/A')}<br>
+            <b>Lançamento:</b> {self.anime.get('year', 'N/A')}
+        </p>
+        """
+    
+    def refresh_info(self):
+        """Atualiza os campos do diálogo conforme as respostas chegam"""
+        self.setWindowTitle(f"Detalhes - {self.anime.get('name', 'Anime')}")
+        self.title_label.setText(self.anime.get('name', 'Título não disponível'))
+        self.metadata_label.setText(self.get_metadata_text())
+        self.description_label.setText(self.anime.get('description', 'Descrição não disponível.'))
+        self.fill_details_section()
+    
     def create_description(self):
         widget = QFrame()
-        widget.setStyleSheet("""
-            QFrame {
-                background: #2a2a2a;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        widget.setProperty("role", "panel")
         
         layout = QVBoxLayout()
         
         desc_label = QLabel("Descrição")
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: #ff7b00;
-                font-size: 16px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-        """)
+        desc_label.setObjectName("description_title")
+        desc_label.setProperty("role", "panel_title")
         
         description_text = self.anime.get('description', 'Descrição não disponível.')
-        content_label = QLabel(description_text)
-        content_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 14px;
-                line-height: 1.4;
-            }
-        """)
-        content_label.setWordWrap(True)
-        content_label.setTextFormat(Qt.RichText)
+        self.description_label = QLabel(description_text)
+        self.description_label.setObjectName("description_text")
+        self.description_label.setWordWrap(True)
+        self.description_label.setTextFormat(Qt.RichText)
         
         layout.addWidget(desc_label)
-        layout.addWidget(content_label)
+        layout.addWidget(self.description_label)
         widget.setLayout(layout)
         return widget
     
     def create_details_section(self):
         widget = QWidget()
-        layout = QVBoxLayout()
+        self.details_layout = QVBoxLayout()
+        widget.setLayout(self.details_layout)
+        self.fill_details_section()
+        return widget
+    
+    def fill_details_section(self):
+        for i in reversed(range(self.details_layout.count())):
+            row = self.details_layout.itemAt(i).widget()
+            if row:
+                row.setParent(None)
         
         # Gêneros
         if self.anime.get('genres'):
             genres_widget = self.create_info_row("Gêneros", ", ".join(self.anime['genres']))
-            layout.addWidget(genres_widget)
+            self.details_layout.addWidget(genres_widget)
         
         # Estúdio
         if self.anime.get('studio'):
             studio_widget = self.create_info_row("Estúdio", self.anime['studio'])
-            layout.addWidget(studio_widget)
+            self.details_layout.addWidget(studio_widget)
         
         # Duração
         if self.anime.get('duration'):
             duration_widget = self.create_info_row("Duração", self.anime['duration'])
-            layout.addWidget(duration_widget)
-        
-        widget.setLayout(layout)
-        return widget
+            self.details_layout.addWidget(duration_widget)
     
     def create_info_row(self, title, content):
         widget = QWidget()
         layout = QHBoxLayout()
         
         title_label = QLabel(f"{title}:")
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #ff7b00;
-                font-size: 14px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-        """)
+        title_label.setProperty("role", "info_title")
         
         content_label = QLabel(content)
-        content_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-            }
-        """)
+        content_label.setProperty("role", "info_value")
         content_label.setWordWrap(True)
         
         layout.addWidget(title_label)
@@ -480,20 +423,7 @@ class AnimeDetailsDialog(QDialog):
         
         # Botão Fechar
         close_btn = QPushButton("✕ Fechar")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background: #3a3a3a;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 12px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #ff7b00;
-            }
-        """)
+        close_btn.setObjectName("close_button")
         close_btn.clicked.connect(self.close)
         
         layout.addStretch()
@@ -503,58 +433,60 @@ class AnimeDetailsDialog(QDialog):
         return widget
     
     def open_video_player(self, episode_data):
-        """Abre o player de vídeo com streaming"""
+        """Abre o player na hora; os links de streaming são resolvidos em background"""
+        logger.info("🎬 Iniciando abertura do player de vídeo...")
+        
+        video_data = {
+            'episode_data': episode_data,
+            'anime': self.anime
+        }
+        
         try:
-            logger.info("🎬 Iniciando abertura do player de vídeo...")
-            
-            # Obtém o link do episódio
-            episode_link = self.get_anime_episode_link(episode_data, dub=True)
-            logger.info(f"🔗 Link do episódio gerado: {episode_link}")
-            
-            # Obtém links de streaming
-            logger.info("🔄 Obtendo links de streaming...")
-            streaming_info = self.downloader.obter_links_streaming_episodio(episode_link)
-            
-            logger.info(f"📋 Resultado da busca por streaming: {streaming_info['success']}")
-            
-            if streaming_info['success'] and streaming_info['streaming_links']:
-                logger.info(f"✅ Links disponíveis: {list(streaming_info['streaming_links'].keys())}")
-                
-                # Prepara os dados para o player
-                video_data = {
-                    'streaming_links': streaming_info['streaming_links'],
-                    'episode_data': episode_data,
-                    'episode_url': episode_link
-                }
-                
-                # Importa e abre o player
-                logger.info("🚀 Abrindo player de vídeo...")
-                from modules.ui.video_player import VideoPlayerDialog
-                player_dialog = VideoPlayerDialog(video_data, self)
-                player_dialog.exec()
-                
-                logger.info("🎉 Player fechado")
-                
-            else:
-                error_msg = streaming_info.get('error', 'Erro desconhecido')
-                logger.error(f"❌ Falha ao obter links de streaming: {error_msg}")
-                self.show_error_message(
-                    "Erro", 
-                    f"Não foi possível encontrar links de streaming para este episódio.\n\nErro: {error_msg}"
-                )
-                
+            from modules.ui.video_player import VideoPlayerDialog
+            player_dialog = VideoPlayerDialog(video_data, self, resolver=self.resolve_streaming_links,
+                                              next_episode=self.get_next_episode)
+            player_dialog.exec()
+            logger.info("🎉 Player fechado")
         except Exception as e:
             logger.error(f"💥 Erro inesperado ao abrir player: {e}")
             import traceback
             logger.error(f"📝 Stack trace: {traceback.format_exc()}")
             self.show_error_message("Erro", f"Não foi possível abrir o player: {str(e)}")
     
-    def get_anime_episode_link(self, episode_data, dub=False):
-        """Obtém o link do episódio para download - VERSÃO MELHORADA"""
+    def resolve_streaming_links(self, episode_data, language, report_progress, cancel_event, on_late_source=None):
+        """Fontes de streaming de um episódio em um idioma ('dublado'/'legendado')
+        
+        Roda fora da thread da interface (não toca em widgets); o player chama
+        para os dois idiomas ao mesmo tempo e para o próximo episódio antes de
+        ele ser pedido. Devolve as fontes válidas, a de início mais rápido primeiro.
+        """
+        from modules.streaming.providers import race_providers, AnimeFireProvider, AniwatchProvider
+        # Lida uma vez só: os provedores usam os dados do anime deste momento
+        anime = self.link_anime
+        providers = [AnimeFireProvider(lambda episode, dub: self.get_anime_episode_link(episode, anime, dub),
+                                       self.downloader),
+                     AniwatchProvider()]
+        report_progress("Consultando provedores...")
+        return race_providers(providers, episode_data, language, report_progress, cancel_event, on_late_source)
+    
+    def get_next_episode(self, episode_data):
+        """Episódio seguinte na lista carregada, ou None"""
+        number = episode_data.get('number')
+        if number is None or not self.episodes_data:
+            return None
+        later = [episode for episode in self.episodes_data.get('episodes', [])
+                 if (episode.get('number') or 0) > number]
+        return min(later, key=lambda episode: episode['number']) if later else None
+    
+    def get_anime_episode_link(self, episode_data, anime, dub=False):
+        """Obtém o link do episódio para download - VERSÃO MELHORADA
+        
+        anime: cópia dos dados do anime (roda fora da thread da interface).
+        """
         
         episode_number = episode_data.get('number', 0)
-        anilist_id = self.anime.get('anilistId', 0)
-        anime_name = self.anime.get('original_name') or self.anime.get('name', '')
+        anilist_id = anime.get('anilistId', 0)
+        anime_name = anime.get('original_name') or anime.get('name', '')
         
         logger.info(f"🔍 Obtendo link para: {anime_name}, Episódio: {episode_number}, Dublado: {dub}")
         
@@ -653,37 +585,6 @@ class AnimeDetailsDialog(QDialog):
         logger.info(f"   Idioma: {language}")
         logger.info(f"   Servidor: {server_name} (ID: {server_id})")
 
-    def launch_video_player(self, video_url, episode_data, subtitles, intro, outro, headers, streaming_links=None):
-        """Abre o player de vídeo com todos os dados"""
-        
-        if not video_url:
-            self.show_error_message("Erro", "URL do vídeo não disponível.")
-            return
-        
-        # Prepara os dados para o player
-        video_data = {
-            'video_url': video_url,
-            'episode_data': episode_data,
-            'subtitles': subtitles,
-            'intro': intro,
-            'outro': outro,
-            'headers': headers,
-            'sources': streaming_links["data"].get("sources", []) if streaming_links and "data" in streaming_links else []
-        }
-        
-        try:
-            # Importa e cria o player
-            from modules.ui.video_player import VideoPlayerDialog
-            
-            player_dialog = VideoPlayerDialog(video_data, self)
-            player_dialog.exec()
-            
-            logger.info("✅ Player fechado")
-            
-        except Exception as e:
-            logger.error(f"❌ Erro ao abrir player: {e}")
-            self.show_error_message("Erro", f"Não foi possível abrir o player: {str(e)}")
-
     def show_error_message(self, title, message):
         """Mostra uma mensagem de erro"""
         from PySide6.QtWidgets import QMessageBox
@@ -0,0 +1,321 @@
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import (Qt, QAbstractListModel, QModelIndex, QPersistentModelIndex, QSize, QRect,
+                            QRectF, QEvent, QVariantAnimation, QEasingCurve, Signal)
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QPainterPath, QPixmap, QPixmapCache
+
+CARD_WIDTH = 200
+CARD_HEIGHT = 300
+CARD_SPACING = 10
+# Zoom do hover: quantos pixels o card cresce em cada lado (apenas na pintura)
+CARD_HOVER_GROW = 5
+CARD_HOVER_DURATION = 200
+# Cada card em cache ocupa ~240 KB (200x300, mais em telas HiDPI); o limite
+# padrão do QPixmapCache (10 MB) não comporta nem uma tela de cards
+CARD_PIXMAP_CACHE_KB = 64 * 1024
+
+ANIME_ROLE = Qt.UserRole + 1
+POSTER_FAILED_ROLE = Qt.UserRole + 2
+
+def blend_color(start, end, progress):
+    """Interpola duas cores (progress de 0.0 a 1.0)"""
+    start, end = QColor(start), QColor(end)
+    return QColor(
+        round(start.red() + (end.red() - start.red()) * progress),
+        round(start.green() + (end.green() - start.green()) * progress),
+        round(start.blue() + (end.blue() - start.blue()) * progress)
+    )
+
+class AnimeListModel(QAbstractListModel):
+    """Modelo de animes que pede os posters apenas quando o item é pintado"""
+
+    def __init__(self, poster_loader=None, parent=None):
+        super().__init__(parent)
+        self.poster_loader = poster_loader
+        self.animes = []
+        self.posters = {}
+        self.failed_posters = set()
+        self.requested_posters = set()
+        self.rows_by_id = {}
+        self.loading_sync = False
+
+    def set_animes(self, animes):
+        """Substitui a lista de animes exibida"""
+        self.beginResetModel()
+        self.animes = list(animes)
+        self.rows_by_id = {}
+        for row, anime in enumerate(self.animes):
+            anime_id = str(anime.get('id', '')).strip()
+            self.rows_by_id.setdefault(anime_id, []).append(row)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.animes)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.animes):
+            return None
+
+        anime = self.animes[index.row()]
+
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return anime.get('name', 'Título não disponível')
+        if role == Qt.DecorationRole:
+            return self.get_poster(anime)
+        if role == POSTER_FAILED_ROLE:
+            return str(anime.get('id', '')).strip() in self.failed_posters
+        if role == ANIME_ROLE:
+            return anime
+        return None
+
+    def get_poster(self, anime):
+        """Retorna o poster em memória ou agenda o carregamento"""
+        anime_id = str(anime.get('id', '')).strip()
+        pixmap = self.posters.get(anime_id)
+
+        if pixmap is None and anime_id not in self.requested_posters and anime.get('poster') and self.poster_loader:
+            self.requested_posters.add(anime_id)
+            # O loader pode responder na hora (cache de memória/disco)
+            self.loading_sync = True
+            try:
+                self.poster_loader(anime_id, anime['poster'], self.on_poster_loaded, self.on_poster_failed)
+            finally:
+                self.loading_sync = False
+            pixmap = self.posters.get(anime_id)
+
+        return pixmap
+
+    def on_poster_loaded(self, anime_id, pixmap):
+        self.posters[anime_id] = pixmap
+        self.failed_posters.discard(anime_id)
+        if not self.loading_sync:
+            self.notify_rows(anime_id)
+
+    def on_poster_failed(self, anime_id, error):
+        self.failed_posters.add(anime_id)
+        if not self.loading_sync:
+            self.notify_rows(anime_id)
+
+    def notify_rows(self, anime_id):
+        for row in self.rows_by_id.get(anime_id, []):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+class AnimeCardDelegate(QStyledItemDelegate):
+    """Pinta o card do anime (poster, título e informações) sem criar widgets"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(14)
+        self.title_font.setBold(True)
+        self.info_font = QFont()
+        self.info_font.setPixelSize(12)
+        self.placeholder_font = QFont()
+        self.placeholder_font.setPixelSize(12)
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        anime = index.data(ANIME_ROLE) or {}
+        progress = self.hover_progress(option, index)
+        rect = option.rect
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        if progress > 0:
+            # Zoom aplicado só na pintura: a geometria do item não muda
+            center = QRectF(rect).center()
+            painter.translate(center)
+            painter.scale(
+                (rect.width() + 2 * CARD_HOVER_GROW * progress) / rect.width(),
+                (rect.height() + 2 * CARD_HOVER_GROW * progress) / rect.height()
+            )
+            painter.translate(-center)
+
+        # Fundo do card
+        painter.setPen(QPen(blend_color("#3a3a3a", "#ff7b00", progress), 2))
+        painter.setBrush(blend_color("#2a2a2a", "#333333", progress))
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 10, 10)
+
+        # Poster, título e informações vêm de um pixmap em cache: os quadros
+        # do hover só redesenham o fundo e escalam a imagem pronta
+        painter.drawPixmap(rect.topLeft(), self.content_pixmap(index, anime, painter.device().devicePixelRatioF()))
+
+        painter.restore()
+
+    def content_pixmap(self, index, anime, pixel_ratio):
+        pixmap = index.data(Qt.DecorationRole)
+        has_poster = pixmap is not None and not pixmap.isNull()
+        poster_state = "ok" if has_poster else ("failed" if index.data(POSTER_FAILED_ROLE) else "loading")
+        key = f"anime_card:{anime.get('id', index.row())}:{anime.get('name', '')}:{poster_state}:{pixel_ratio}"
+
+        content = QPixmapCache.find(key)
+        if content is not None and not content.isNull():
+            return content
+
+        content = QPixmap(round(CARD_WIDTH * pixel_ratio), round(CARD_HEIGHT * pixel_ratio))
+        content.setDevicePixelRatio(pixel_ratio)
+        content.fill(Qt.transparent)
+
+        painter = QPainter(content)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Poster
+        poster_rect = QRect(10, 10, 180, 220)
+        self.paint_poster(painter, poster_rect, pixmap if has_poster else None, poster_state == "failed")
+
+        # Título
+        painter.setPen(QColor("white"))
+        painter.setFont(self.title_font)
+        title_rect = QRect(10, poster_rect.bottom() + 7, 180, 36)
+        painter.drawText(title_rect, Qt.AlignCenter | Qt.TextWordWrap, anime.get('name', 'Título não disponível'))
+
+        # Informações adicionais
+        info_text = f"{anime.get('type', 'N/A')} • {anime.get('episodes', '?')} episódios"
+        painter.setPen(QColor("#ff7b00"))
+        painter.setFont(self.info_font)
+        info_rect = QRect(10, title_rect.bottom() + 2, 180, 18)
+        painter.drawText(info_rect, Qt.AlignCenter, info_text)
+        painter.end()
+
+        QPixmapCache.insert(key, content)
+        return content
+
+    def hover_progress(self, option, index):
+        view = self.parent()
+        if isinstance(view, AnimeGridView):
+            return view.hover_progress.get(index.row(), 0.0)
+        return 1.0 if option.state & QStyle.State_MouseOver else 0.0
+
+    def paint_poster(self, painter, poster_rect, pixmap, failed):
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(poster_rect), 8, 8)
+        painter.fillPath(path, QColor("#1a1a1a"))
+
+        if pixmap is not None:
+            # Recorte central, igual ao QLabel alinhado ao centro
+            source = QRect(0, 0, poster_rect.width(), poster_rect.height())
+            source.moveCenter(pixmap.rect().center())
+            painter.save()
+            painter.setClipPath(path)
+            painter.drawPixmap(poster_rect, pixmap, source)
+            painter.restore()
+        else:
+            painter.setPen(QColor("#666" if failed else "#cccccc"))
+            painter.setFont(self.placeholder_font)
+            painter.drawText(poster_rect, Qt.AlignCenter, "🎬\nSem imagem" if failed else "Carregando...")
+
+        painter.setPen(QPen(QColor("#444"), 1))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawPath(path)
+
+class AnimeGridView(QListView):
+    """Grade virtualizada de animes: só os itens visíveis são pintados"""
+    anime_clicked = Signal(dict)
+
+    def __init__(self, poster_loader, wrapping=False, parent=None):
+        super().__init__(parent)
+        if QPixmapCache.cacheLimit() < CARD_PIXMAP_CACHE_KB:
+            QPixmapCache.setCacheLimit(CARD_PIXMAP_CACHE_KB)
+        self.hovered_index = QPersistentModelIndex()
+        self.hover_progress = {}
+        self.hover_animations = {}
+        self.anime_model = AnimeListModel(poster_loader, self)
+        self.setModel(self.anime_model)
+        self.setItemDelegate(AnimeCardDelegate(self))
+
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(wrapping)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(CARD_SPACING)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        if not wrapping:
+            # Linha única com scroll horizontal
+            self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+            self.setFixedHeight(CARD_HEIGHT + 2 * CARD_SPACING + 20)
+        else:
+            self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+
+        self.clicked.connect(self.on_item_clicked)
+
+    def set_animes(self, animes):
+        self.reset_hover()
+        self.anime_model.set_animes(animes)
+
+    def reset_hover(self):
+        for animation in self.hover_animations.values():
+            animation.stop()
+            animation.deleteLater()
+        self.hover_animations = {}
+        self.hover_progress = {}
+        self.hovered_index = QPersistentModelIndex()
+
+    def mouseMoveEvent(self, event):
+        self.set_hovered_index(self.indexAt(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def viewportEvent(self, event):
+        if event.type() == QEvent.Leave:
+            self.set_hovered_index(QModelIndex())
+        return super().viewportEvent(event)
+
+    def set_hovered_index(self, index):
+        if QPersistentModelIndex(index) == self.hovered_index:
+            return
+
+        if self.hovered_index.isValid():
+            self.animate_hover(self.hovered_index.row(), 0.0)
+        self.hovered_index = QPersistentModelIndex(index)
+        if index.isValid():
+            self.animate_hover(index.row(), 1.0)
+
+    def animate_hover(self, row, target):
+        animation = self.hover_animations.get(row)
+        if animation is None:
+            animation = QVariantAnimation(self)
+            animation.setDuration(CARD_HOVER_DURATION)
+            animation.setEasingCurve(QEasingCurve.OutCubic)
+            animation.valueChanged.connect(lambda value, row=row: self.on_hover_frame(row, value))
+            animation.finished.connect(lambda row=row: self.on_hover_finished(row))
+            self.hover_animations[row] = animation
+
+        animation.stop()
+        animation.setStartValue(float(self.hover_progress.get(row, 0.0)))
+        animation.setEndValue(float(target))
+        animation.start()
+
+    def on_hover_frame(self, row, value):
+        self.hover_progress[row] = value
+        # Repinta só a área do card (mais a margem do zoom)
+        rect = self.visualRect(self.anime_model.index(row))
+        self.viewport().update(rect.adjusted(-CARD_HOVER_GROW, -CARD_HOVER_GROW, CARD_HOVER_GROW, CARD_HOVER_GROW))
+
+    def on_hover_finished(self, row):
+        if self.hover_progress.get(row, 0.0) > 0:
+            return
+        self.hover_progress.pop(row, None)
+        animation = self.hover_animations.pop(row, None)
+        if animation:
+            animation.deleteLater()
+
+    def on_item_clicked(self, index):
+        anime = index.data(ANIME_ROLE)
+        if anime:
+            self.anime_clicked.emit(anime)
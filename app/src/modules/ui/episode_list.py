@@ -0,0 +1,245 @@
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView, QComboBox,
+                               QLineEdit, QSpinBox, QPushButton, QLabel, QStyledItemDelegate,
+                               QStyle, QAbstractItemView)
+from PySide6.QtCore import (Qt, QAbstractListModel, QSortFilterProxyModel, QModelIndex,
+                            QSize, QRect, QRectF, Signal)
+from PySide6.QtGui import QPainter, QColor, QPen, QFont, QFontMetrics
+
+EPISODE_ROLE = Qt.UserRole + 1
+EPISODE_CHUNK_SIZE = 100
+EPISODE_TILE_WIDTH = 180
+EPISODE_TILE_HEIGHT = 80
+
+class EpisodeListModel(QAbstractListModel):
+    """Modelo com todos os episódios do anime"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.episodes = []
+        self.rows_by_number = {}
+
+    def set_episodes(self, episodes):
+        self.beginResetModel()
+        self.episodes = list(episodes)
+        self.rows_by_number = {}
+        for row, episode in enumerate(self.episodes):
+            self.rows_by_number.setdefault(episode.get('number', row + 1), row)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.episodes)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.episodes):
+            return None
+
+        episode = self.episodes[index.row()]
+        episode_number = episode.get('number', index.row() + 1)
+        episode_title = episode.get('title') or f'Episódio {episode_number}'
+
+        if role == Qt.DisplayRole:
+            return episode_title
+        if role == Qt.ToolTipRole:
+            return f"Episódio {episode_number}: {episode_title}"
+        if role == EPISODE_ROLE:
+            return episode
+        return None
+
+class EpisodeFilterProxy(QSortFilterProxyModel):
+    """Filtra os episódios por faixa (1–100, 101–200, …) ou por texto"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.range_start = None
+        self.range_end = None
+        self.search_text = ""
+
+    def set_range(self, start, end):
+        self.range_start = start
+        self.range_end = end
+        self.invalidateFilter()
+
+    def set_search_text(self, text):
+        self.search_text = text.strip().casefold()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        episode = self.sourceModel().episodes[source_row]
+        number = episode.get('number', source_row + 1)
+
+        # Com texto de busca, procura em todos os episódios
+        if self.search_text:
+            title = (episode.get('title') or "").casefold()
+            return self.search_text in title or self.search_text == str(number)
+
+        if self.range_start is None:
+            return True
+        return self.range_start <= source_row + 1 <= self.range_end
+
+class EpisodeDelegate(QStyledItemDelegate):
+    """Pinta o botão do episódio sem criar widgets"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.number_font = QFont()
+        self.number_font.setPixelSize(12)
+        self.number_font.setBold(True)
+        self.title_font = QFont()
+        self.title_font.setPixelSize(11)
+
+    def sizeHint(self, option, index):
+        return QSize(EPISODE_TILE_WIDTH, EPISODE_TILE_HEIGHT)
+
+    def paint(self, painter, option, index):
+        episode = index.data(EPISODE_ROLE) or {}
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        selected = bool(option.state & QStyle.State_Selected)
+        rect = option.rect
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        if selected:
+            background = "#ff7b00"
+        elif hovered:
+            background = "#333333"
+        else:
+            background = "#2a2a2a"
+        painter.setPen(QPen(QColor("#ff7b00" if hovered or selected else "#3a3a3a"), 2))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 8, 8)
+
+        text_rect = rect.adjusted(10, 8, -10, -8)
+        number = episode.get('number', index.row() + 1)
+        painter.setPen(QColor("white"))
+        painter.setFont(self.number_font)
+        painter.drawText(QRect(text_rect.x(), text_rect.y(), text_rect.width(), 18), Qt.AlignCenter, f"EP {number}")
+
+        filler_text = " (Filler)" if episode.get('isFiller', False) else ""
+        title = f"{index.data(Qt.DisplayRole)}{filler_text}"
+        painter.setFont(self.title_font)
+        title_rect = QRect(text_rect.x(), text_rect.y() + 20, text_rect.width(), text_rect.height() - 20)
+        metrics = QFontMetrics(self.title_font)
+        title = metrics.elidedText(title, Qt.ElideRight, title_rect.width() * 2)
+        painter.drawText(title_rect, Qt.AlignHCenter | Qt.AlignTop | Qt.TextWordWrap, title)
+
+        painter.restore()
+
+class EpisodeBrowser(QWidget):
+    """Lista virtualizada de episódios com faixas, salto por número e filtro"""
+    episode_selected = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.model = EpisodeListModel(self)
+        self.proxy = EpisodeFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(10)
+
+        # Barra de navegação
+        toolbar = QHBoxLayout()
+        toolbar.setSpacing(8)
+
+        self.range_combo = QComboBox()
+        self.range_combo.currentIndexChanged.connect(self.on_range_changed)
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filtrar por título ou número...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.textChanged.connect(self.proxy.set_search_text)
+
+        jump_label = QLabel("Ir para EP")
+
+        self.jump_input = QSpinBox()
+        self.jump_input.setMinimum(1)
+        self.jump_input.editingFinished.connect(self.jump_to_input)
+
+        self.jump_btn = QPushButton("Ir")
+        self.jump_btn.setObjectName("jump_button")
+        self.jump_btn.clicked.connect(self.jump_to_input)
+
+        toolbar.addWidget(self.range_combo)
+        toolbar.addWidget(self.filter_input, 1)
+        toolbar.addWidget(jump_label)
+        toolbar.addWidget(self.jump_input)
+        toolbar.addWidget(self.jump_btn)
+
+        # Lista virtualizada
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setItemDelegate(EpisodeDelegate(self.list_view))
+        self.list_view.setFlow(QListView.LeftToRight)
+        self.list_view.setWrapping(True)
+        self.list_view.setResizeMode(QListView.Adjust)
+        self.list_view.setMovement(QListView.Static)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(5)
+        self.list_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setMouseTracking(True)
+        self.list_view.viewport().setAttribute(Qt.WA_Hover)
+        self.list_view.setFixedHeight(4 * (EPISODE_TILE_HEIGHT + 10) + 10)
+        self.list_view.clicked.connect(self.on_item_clicked)
+
+        layout.addLayout(toolbar)
+        layout.addWidget(self.list_view)
+        self.setLayout(layout)
+
+    def set_episodes(self, episodes):
+        self.model.set_episodes(episodes)
+
+        total = len(episodes)
+        self.jump_input.setMaximum(max(1, max(self.model.rows_by_number.keys(), default=1)))
+
+        # Faixas só fazem sentido para séries longas
+        self.range_combo.blockSignals(True)
+        self.range_combo.clear()
+        for start in range(1, total + 1, EPISODE_CHUNK_SIZE):
+            end = min(start + EPISODE_CHUNK_SIZE - 1, total)
+            self.range_combo.addItem(f"{start}–{end}", (start, end))
+        self.range_combo.blockSignals(False)
+        self.range_combo.setVisible(total > EPISODE_CHUNK_SIZE)
+
+        if total > EPISODE_CHUNK_SIZE:
+            self.range_combo.setCurrentIndex(0)
+            self.on_range_changed(0)
+        else:
+            self.proxy.set_range(None, None)
+
+    def on_range_changed(self, combo_index):
+        episode_range = self.range_combo.itemData(combo_index)
+        if episode_range:
+            self.proxy.set_range(*episode_range)
+            self.list_view.scrollToTop()
+
+    def jump_to_input(self):
+        self.jump_to_episode(self.jump_input.value())
+
+    def jump_to_episode(self, number):
+        """Mostra a faixa do episódio e rola até ele"""
+        source_row = self.model.rows_by_number.get(number)
+        if source_row is None:
+            return
+
+        self.filter_input.clear()
+        if self.range_combo.count() > 1:
+            self.range_combo.setCurrentIndex(source_row // EPISODE_CHUNK_SIZE)
+
+        proxy_index = self.proxy.mapFromSource(self.model.index(source_row))
+        if proxy_index.isValid():
+            self.list_view.setCurrentIndex(proxy_index)
+            self.list_view.scrollTo(proxy_index, QAbstractItemView.PositionAtCenter)
+
+    def on_item_clicked(self, index):
+        episode = index.data(EPISODE_ROLE)
+        if episode:
+            self.episode_selected.emit(episode)
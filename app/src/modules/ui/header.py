@@ -9,13 +9,7 @@ class HeaderWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.setFixedHeight(60)
-        self.setStyleSheet("""
-            QWidget {
-                background: #2a2a2a;
-                border-radius: 10px;
-                padding: 15px;
-            }
-        """)
+        self.setObjectName("header")
         
         self.init_ui()
     
@@ -25,13 +19,7 @@ class HeaderWidget(QWidget):
 
         # Logo
         logo = QLabel("🎬 AniPlay")
-        logo.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #ff7b00;
-            }
-        """)
+        logo.setObjectName("logo")
 
         # Área do usuário
         user_widget = QWidget()
@@ -39,7 +27,7 @@ class HeaderWidget(QWidget):
         user_layout.setSpacing(10)
 
         self.welcome_label = QLabel("Olá, <span style='color: #ff7b00; font-weight: bold;'>Usuário</span>!")
-        self.welcome_label.setStyleSheet("color: #ccc;")
+        self.welcome_label.setObjectName("welcome_label")
         self.welcome_label.hide()
 
         self.login_btn = QPushButton("Entrar")
@@ -47,46 +35,10 @@ class HeaderWidget(QWidget):
         self.logout_btn = QPushButton("Sair")
         self.logout_btn.hide()
 
-        button_style = """
-            QPushButton {
-                padding: 8px 16px;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-        """
-
-        self.login_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: transparent;
-                color: #ff7b00;
-                border: 1px solid #ff7b00;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """)
-
-        self.register_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: #ff7b00;
-                color: white;
-            }
-            QPushButton:hover {
-                background: #ff9500;
-            }
-        """)
-
-        self.logout_btn.setStyleSheet(button_style + """
-            QPushButton {
-                background: transparent;
-                color: #ff7b00;
-                border: 1px solid #ff7b00;
-            }
-            QPushButton:hover {
-                background: #3a3a3a;
-            }
-        """)
+        # Estilos definidos no tema da aplicação
+        self.login_btn.setProperty("variant", "outline")
+        self.register_btn.setProperty("variant", "primary")
+        self.logout_btn.setProperty("variant", "outline")
 
         user_layout.addWidget(self.welcome_label)
         user_layout.addWidget(self.login_btn)
@@ -1,41 +1,133 @@
 from loguru import logger
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QObject, QTimer, QElapsedTimer, QEvent, Signal
 from modules.anime.anime import convert_anime_data
 from modules.anime.anime_data import get_animes_home_page
-import json
-
-class Home():
-    def __init__(self, home_layout, create_anime_section):
-        home_animes_data = get_animes_home_page()
-        spotlight_animes = home_animes_data["data"]["spotlightAnimes"]
-        trending_animes = home_animes_data["data"]["trendingAnimes"]
-        latest_episode_animes = home_animes_data["data"]["latestEpisodeAnimes"]
-        top_uncoming_animes = home_animes_data["data"]["topUpcomingAnimes"]
-        top_airing_animes = home_animes_data["data"]["topAiringAnimes"]
-        popular_animes = home_animes_data["data"]["mostPopularAnimes"]
-        favorite_animes = home_animes_data["data"]["mostFavoriteAnimes"]
-        latest_completed_animes = home_animes_data["data"]["latestCompletedAnimes"]
-        
+from modules.tasks.task_manager import run_task, PRIORITY_INTERACTIVE
+from modules.ui.anime_grid import CARD_HEIGHT, CARD_SPACING
+
+# (chave na resposta da API, título da seção), na ordem de exibição
+HOME_SECTIONS = [
+    ("spotlightAnimes", "Animes em Destaque"),
+    ("trendingAnimes", "Animes em Alta"),
+    ("latestEpisodeAnimes", "Último Episódio de Animes"),
+    ("topUpcomingAnimes", "Animes Mais aguardados"),
+    ("topAiringAnimes", "Animes Mais Populares em Exibição"),
+    ("mostPopularAnimes", "Animes Mais populares"),
+    ("mostFavoriteAnimes", "Animes Mais Favoritados"),
+    ("latestCompletedAnimes", "Animes Concluídos Mais Recentes"),
+]
+
+# Tempo máximo de construção por fatia antes de devolver o controle ao event loop
+FRAME_BUDGET_MS = 8
+# Seções abaixo da tela são construídas quando chegam a esta distância do viewport
+PRELOAD_MARGIN = 400
+# Altura estimada de uma seção (título + linha de cards) até a primeira ficar pronta
+SECTION_ESTIMATED_HEIGHT = CARD_HEIGHT + 2 * CARD_SPACING + 20 + 80
+
+class Home(QObject):
+    """Monta a página inicial aos poucos, começando pelas seções visíveis"""
+    loaded = Signal()
+    load_failed = Signal(str)
+
+    def __init__(self, home_layout, create_anime_section, scroll_area):
+        super().__init__(scroll_area)
+        self.home_layout = home_layout
+        self.create_anime_section = create_anime_section
+        self.scroll_area = scroll_area
+        self.pending = []
+
+        self.slice_timer = QTimer(self)
+        self.slice_timer.setSingleShot(True)
+        self.slice_timer.timeout.connect(self.build_next_slice)
+
+        # Os dados chegam em background; a tela de "Carregando" continua animando
+        self.fetch = run_task(get_animes_home_page, priority=PRIORITY_INTERACTIVE, owner=self)
+        self.fetch.then(self.on_data_loaded, self.load_failed.emit)
+
+    def on_data_loaded(self, home_animes_data):
+        if not home_animes_data:
+            self.load_failed.emit("Resposta vazia da API")
+            return
         logger.info("✅ Dados dos animes obtidos com sucesso")
+        home_layout = self.home_layout
 
         for i in reversed(range(home_layout.count())):
             widget = home_layout.itemAt(i).widget()
             if widget:
                 widget.setParent(None)
 
-        spotlight_section = create_anime_section("Animes em Destaque", convert_anime_data(spotlight_animes))
-        trending_section = create_anime_section("Animes em Alta", convert_anime_data(trending_animes))
-        latest_episode_section = create_anime_section("Último Episódio de Animes", convert_anime_data(latest_episode_animes))
-        top_uncoming_section = create_anime_section("Animes Mais aguardados", convert_anime_data(top_uncoming_animes))
-        top_airing_section = create_anime_section("Animes Mais Populares em Exibição", convert_anime_data(top_airing_animes))
-        popular_section = create_anime_section("Animes Mais populares", convert_anime_data(popular_animes))
-        favorite_section = create_anime_section("Animes Mais Favoritados", convert_anime_data(favorite_animes))
-        latest_completed_section = create_anime_section("Animes Concluídos Mais Recentes", convert_anime_data(latest_completed_animes))
-
-        home_layout.addWidget(spotlight_section)
-        home_layout.addWidget(trending_section)
-        home_layout.addWidget(latest_episode_section)
-        home_layout.addWidget(top_uncoming_section)
-        home_layout.addWidget(top_airing_section)
-        home_layout.addWidget(popular_section)
-        home_layout.addWidget(favorite_section)
-        home_layout.addWidget(latest_completed_section)
\ No newline at end of file
+        # Placeholders com a altura da seção mantêm a barra de rolagem estável
+        for key, title in HOME_SECTIONS:
+            placeholder = QWidget()
+            placeholder.setFixedHeight(SECTION_ESTIMATED_HEIGHT)
+            home_layout.addWidget(placeholder)
+            self.pending.append((title, home_animes_data["data"].get(key, []), placeholder))
+
+        # Rolar ou aumentar a janela pode trazer novas seções para perto da tela
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.schedule_slice)
+        self.scroll_area.viewport().installEventFilter(self)
+        self.schedule_slice()
+        self.loaded.emit()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.schedule_slice()
+        return False
+
+    def schedule_slice(self):
+        if self.pending and not self.slice_timer.isActive():
+            self.slice_timer.start(0)
+
+    def is_near_viewport(self, placeholder):
+        viewport_bottom = self.scroll_area.verticalScrollBar().value() + self.scroll_area.viewport().height()
+        return self.placeholder_top(placeholder) <= viewport_bottom + PRELOAD_MARGIN
+
+    def placeholder_top(self, placeholder):
+        # Calculado pelos sizeHints: a geometria real só é aplicada no próximo relayout
+        # (e a seção recém-criada ainda está oculta, então o item do layout diz 0)
+        top = self.home_layout.contentsMargins().top()
+        for i in range(self.home_layout.indexOf(placeholder)):
+            widget = self.home_layout.itemAt(i).widget()
+            if widget:
+                top += max(widget.sizeHint().height(), widget.minimumHeight()) + self.home_layout.spacing()
+        return top
+
+    def build_next_slice(self):
+        """Constrói seções próximas da tela até estourar o orçamento do frame"""
+        elapsed = QElapsedTimer()
+        elapsed.start()
+
+        while self.pending and self.is_near_viewport(self.pending[0][2]):
+            title, animes, placeholder = self.pending.pop(0)
+            self.build_section(title, animes, placeholder)
+
+            if elapsed.elapsed() >= FRAME_BUDGET_MS:
+                # Continua no próximo ciclo do event loop
+                self.schedule_slice()
+                break
+
+        if not self.pending:
+            self.stop()
+            logger.info("✅ Página inicial montada")
+
+    def stop(self):
+        """Interrompe a construção (ex.: a página inicial foi recarregada)"""
+        self.fetch.cancel()
+        self.slice_timer.stop()
+        self.pending = []
+        self.scroll_area.viewport().removeEventFilter(self)
+        try:
+            self.scroll_area.verticalScrollBar().valueChanged.disconnect(self.schedule_slice)
+        except (RuntimeError, TypeError):
+            pass
+
+    def build_section(self, title, animes, placeholder):
+        section = self.create_anime_section(title, convert_anime_data(animes))
+        self.home_layout.replaceWidget(placeholder, section)
+        placeholder.deleteLater()
+
+        # Ajusta os placeholders restantes para a altura real de uma seção
+        section_height = section.sizeHint().height()
+        for _, _, pending_placeholder in self.pending:
+            pending_placeholder.setFixedHeight(section_height)
@@ -0,0 +1,130 @@
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtMultimedia import QMediaPlayer, QVideoSink
+from loguru import logger
+
+from modules.streaming.local_server import local_stream_url
+
+# Desiste se o stream não tiver um quadro pronto nesse tempo
+STANDBY_TIMEOUT_MS = 20000
+# Se a posição pedida se afastou mais que isso enquanto o oculto buscava o
+# ponto (o player visível seguiu tocando ou o usuário pulou), busca de novo (uma vez)
+MAX_SWITCH_DRIFT_MS = 1500
+
+def create_media_player():
+    player = QMediaPlayer()
+    # Configurações para melhor compatibilidade
+    player.setProperty("videoOutput", "software")
+    return player
+
+class StandbyPlayer(QObject):
+    """Carrega um stream em um QMediaPlayer oculto até ter imagem na posição pedida
+
+    Enquanto carrega, o player não tem áudio e desenha num QVideoSink sem tela.
+    ready é emitido com o player pausado e o primeiro quadro já decodificado;
+    quem recebe chama take_player() e o coloca no lugar do atual. position
+    pode ser um int ou uma função, lida só quando a mídia termina de abrir
+    (ex.: a posição do player que está tocando).
+    """
+
+    ready = Signal()
+    failed = Signal(str)
+
+    def __init__(self, stream_url, position=0, parent=None):
+        super().__init__(parent)
+        self.stream_url = stream_url
+        self.position = position
+        self.seek_target = None
+        self.drift_retried = False
+        self.buffered = False
+        self.has_frame = False
+        self.finished = False
+        self.is_ready = False
+
+        self.player = create_media_player()
+        self.sink = QVideoSink(self)
+        self.player.setVideoSink(self.sink)
+        self.player.mediaStatusChanged.connect(self.on_media_status)
+        self.player.errorOccurred.connect(self.on_error)
+        self.sink.videoFrameChanged.connect(self.on_frame)
+
+        self.timeout = QTimer(self)
+        self.timeout.setSingleShot(True)
+        self.timeout.timeout.connect(lambda: self.fail("tempo esgotado ao carregar o stream"))
+
+    def start(self):
+        self.timeout.start(STANDBY_TIMEOUT_MS)
+        self.player.setSource(QUrl(local_stream_url(self.stream_url)))
+
+    def requested_position(self):
+        return self.position() if callable(self.position) else self.position
+
+    def seek(self, position):
+        self.seek_target = max(0, position)
+        # Pausado, o status fica em BufferedMedia; só o quadro novo confirma o seek
+        self.has_frame = False
+        if self.seek_target > 0:
+            self.player.setPosition(self.seek_target)
+        # pause() monta o pipeline e decodifica o quadro da posição, sem tocar
+        self.player.pause()
+
+    def on_media_status(self, status):
+        if self.finished:
+            return
+        if status == QMediaPlayer.LoadedMedia and self.seek_target is None:
+            self.seek(self.requested_position())
+        elif status == QMediaPlayer.BufferedMedia and self.seek_target is not None:
+            self.buffered = True
+            self.check_ready()
+        elif status == QMediaPlayer.InvalidMedia:
+            self.fail("mídia inválida")
+
+    def on_frame(self, frame):
+        if self.finished or self.seek_target is None or not frame.isValid():
+            return
+        self.has_frame = True
+        self.check_ready()
+
+    def check_ready(self):
+        if not (self.buffered and self.has_frame):
+            return
+
+        drift = self.requested_position() - self.player.position()
+        if abs(drift) > MAX_SWITCH_DRIFT_MS and not self.drift_retried:
+            # Se ficou para trás, mira à frente pelo atraso medido no seek
+            self.drift_retried = True
+            logger.debug(f"⏩ Player oculto {drift} ms fora da posição, buscando de novo")
+            self.seek(self.requested_position() + max(drift, 0))
+            return
+
+        self.finished = self.is_ready = True
+        self.timeout.stop()
+        self.ready.emit()
+
+    def on_error(self, error, error_string):
+        self.fail(error_string or str(error))
+
+    def fail(self, reason):
+        if self.finished:
+            return
+        self.finished = True
+        logger.warning(f"⚠️ Player oculto falhou: {reason}")
+        self.failed.emit(reason)
+
+    def take_player(self):
+        """Entrega o player pronto; a partir daqui ele pertence a quem chamou"""
+        player = self.player
+        self.player = None
+        player.mediaStatusChanged.disconnect(self.on_media_status)
+        player.errorOccurred.disconnect(self.on_error)
+        player.setVideoSink(None)
+        return player
+
+    def discard(self):
+        """Cancela o carregamento e libera o player (se não foi entregue)"""
+        self.finished = True
+        self.timeout.stop()
+        if self.player:
+            self.player.stop()
+            self.player.deleteLater()
+            self.player = None
+        self.deleteLater()
@@ -1,33 +1,122 @@
 # modules/ui/video_player.py
 import os
+import time
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QSlider, QComboBox, QFrame,
-                               QProgressBar, QMessageBox, QWidget)
-from PySide6.QtCore import Qt, QUrl, QTimer, QTime, QPropertyAnimation, QEasingCurve
+                               QProgressBar, QMessageBox, QWidget, QStackedWidget)
+from PySide6.QtCore import Qt, QUrl, QTimer, QTime, QPropertyAnimation, QEasingCurve, Signal
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtGui import QIcon, QPalette, QColor
 from loguru import logger
 
+from modules.database.connection_manager import get_connection_manager
+from modules.history.watch_progress import get_watch_progress
+from modules.metrics.playback_metrics import PlaybackSession, get_playback_metrics
+from modules.streaming.link_cache import get_link_cache
+from modules.streaming.local_server import local_stream_url
+from modules.streaming.quality_probe import choose_quality, ranked_qualities, host_of, get_host_throughput
+from modules.streaming.rebuffer_monitor import RebufferMonitor
+from modules.streaming.subtitles import load_subtitles
+from modules.ui.standby_player import StandbyPlayer, create_media_player
+from modules.tasks.task_manager import run_task, CancellationToken, PRIORITY_INTERACTIVE, PRIORITY_PREFETCH
+from styles.theme import set_style_state
+
+# Os links do próximo episódio são buscados quando o atual passa desta fração
+NEXT_EPISODE_PREFETCH_AT = 0.75
+# Deixa o começo do próximo episódio carregado em um player oculto
+PREBUFFER_NEXT_EPISODE = True
+# Idiomas resolvidos juntos ao abrir um episódio, com o texto do botão
+LANGUAGES = {'dublado': "🇧🇷 Dub", 'legendado': "🇧🇷 Leg"}
+# A cada quanto tempo ver se a vazão permite subir a qualidade
+UPSHIFT_CHECK_MS = 30000
+# Tempo tocando sem travar antes de tentar subir
+UPSHIFT_STABLE_SECONDS = 60
+
 class VideoPlayerDialog(QDialog):
-    def __init__(self, video_data, parent=None):
+    # (lista de fontes, fonte): provedor que respondeu depois da corrida, emitido da thread dele
+    late_source_found = Signal(object, object)
+    
+    def __init__(self, video_data, parent=None, resolver=None, next_episode=None):
         super().__init__(parent)
         self.video_data = video_data
+        self.anime = video_data.get('anime', {})
+        self.episode = video_data.get('episode_data', {})
+        # Progresso vai para a fila write-behind do usuário logado (None sem login)
+        self.watch_progress = get_watch_progress()
+        self.resume_position = None
+        # resolver(episódio, idioma, reportar_progresso, evento_cancelamento, fonte_atrasada)
+        # -> [StreamSource], a fonte de início mais rápido primeiro; fonte_atrasada(lista, fonte)
+        # é chamada de outra thread para provedores que respondem depois
+        self.resolver = resolver
+        self.late_source_found.connect(self.on_late_source)
+        self.resolve_token = CancellationToken()
+        # Links do episódio atual por idioma, e os idiomas que falharam (com o erro)
+        self.language_links = {}
+        self.language_failed = {}
+        # Fontes de cada idioma, para trocar se a atual falhar tocando: a lista
+        # da corrida de provedores (que cresce se um atrasado responder) e a
+        # posição da fonte em uso nela
+        self.language_sources = {}
+        self.language_source_index = {}
+        # Provedor da fonte em uso em cada idioma (para as métricas)
+        self.language_provider = {}
+        # Legenda externa da fonte em uso (fontes cujo vídeo não traz a legenda)
+        self.subtitle_url = None
+        self.subtitles = None
+        self.subtitle_text = ""
+        # Idioma que deve começar a tocar assim que seus links chegarem
+        self.waiting_language = None
+        # next_episode(episódio) -> episódio seguinte ou None
+        self.next_episode_of = next_episode
+        self.next_token = CancellationToken()
+        self.next_standby = None
+        self.autoplay = self.load_autoplay_preference()
         self.media_player = None
         self.audio_output = None
+        # Stream sendo preparado em um player oculto (troca de qualidade)
+        self.standby = None
         self.is_playing = False
         self.is_fullscreen = False
         self.current_quality = None
+        # False depois de o usuário escolher a qualidade: aí ela só desce se travar
+        self.auto_quality = True
         self.current_language = 'dublado'  # Padrão dublado
+        self.rebuffer_monitor = RebufferMonitor()
+        # Métricas de experiência do episódio atual, gravadas ao trocar de episódio ou fechar
+        self.playback_metrics = get_playback_metrics()
+        self.qoe = self.new_qoe_session()
+        self.watching_frames = False
+        # time.time() da última descida automática de qualidade
+        self.downshifted_at = None
+        # Enquanto travado, confere o orçamento de travamentos a cada segundo
+        self.stall_timer = QTimer(self)
+        self.stall_timer.setInterval(1000)
+        self.stall_timer.timeout.connect(self.check_stall_budget)
+        self.upshift_timer = QTimer(self)
+        self.upshift_timer.setInterval(UPSHIFT_CHECK_MS)
+        self.upshift_timer.timeout.connect(self.maybe_upshift)
         self.was_playing_before_minimize = False
         self.controls_visible = True
+        # Última posição informada pelo player e segundo mostrado no relógio
+        self.last_position = 0
+        self.shown_second = 0
         self.mouse_inactivity_timer = QTimer()
         self.controls_animation = None
         
         self.setup_ui()
         self.setup_media_player()
         self.setup_animations()
-        self.load_video()
+        self.reset_next_episode()
+        self.upshift_timer.start()
+        
+        if self.resolver:
+            # Abre na hora em estado de carregamento; a reprodução começa quando os links chegarem
+            self.start_stream_resolution()
+        else:
+            self.load_video()
+            # Sem resolver não há como buscar o outro idioma
+            self.update_language_button()
         
     def setup_ui(self):
         self.setWindowTitle("Player de Anime")
@@ -40,16 +129,21 @@ class VideoPlayerDialog(QDialog):
         
         # Widget de vídeo
         self.video_widget = QVideoWidget()
-        self.video_widget.setStyleSheet("""
-            QVideoWidget {
-                background: #000000;
-                border: none;
-            }
-        """)
         self.video_widget.setAspectRatioMode(Qt.KeepAspectRatio)
         self.video_widget.setMouseTracking(True)
         
-        main_layout.addWidget(self.video_widget, 1)
+        # Tela de carregamento exibida enquanto os links são resolvidos
+        self.loading_label = QLabel("Carregando...")
+        self.loading_label.setObjectName("player_loading")
+        self.loading_label.setAlignment(Qt.AlignCenter)
+        self.loading_label.setWordWrap(True)
+        
+        self.video_stack = QStackedWidget()
+        self.video_stack.addWidget(self.loading_label)
+        self.video_stack.addWidget(self.video_widget)
+        self.video_stack.setCurrentWidget(self.video_widget)
+        
+        main_layout.addWidget(self.video_stack, 1)
         
         # Controles
         self.controls_widget = self.create_controls()
@@ -58,11 +152,6 @@ class VideoPlayerDialog(QDialog):
         
         self.setLayout(main_layout)
         
-        # Timer para atualizar controles
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_controls)
-        self.update_timer.start(100)
-        
         # Timer para ocultar controles em tela cheia
         self.mouse_inactivity_timer.timeout.connect(self.hide_controls)
         self.mouse_inactivity_timer.setSingleShot(True)
@@ -83,6 +172,7 @@ class VideoPlayerDialog(QDialog):
         self.controls_animation = QPropertyAnimation(self.controls_widget, b"maximumHeight")
         self.controls_animation.setDuration(300)
         self.controls_animation.setEasingCurve(QEasingCurve.OutCubic)
+        self.controls_animation.finished.connect(self.on_controls_animation_finished)
     
     def show_controls_temporarily(self):
         """Mostra controles temporariamente em tela cheia"""
@@ -99,26 +189,28 @@ class VideoPlayerDialog(QDialog):
             self.controls_animation.setEndValue(100)
             self.controls_animation.start()
             self.controls_visible = True
+            # Enquanto ocultos os controles não acompanharam a posição
+            self.refresh_position(self.last_position)
     
     def hide_controls(self):
         """Oculta controles com animação (apenas em tela cheia)"""
         if self.is_fullscreen and self.controls_visible:
+            # Com a altura mínima fixa a animação não teria como encolher a barra
+            self.controls_widget.setMinimumHeight(0)
             self.controls_animation.setStartValue(100)
             self.controls_animation.setEndValue(0)
             self.controls_animation.start()
             self.controls_visible = False
     
+    def on_controls_animation_finished(self):
+        if self.controls_visible:
+            self.controls_widget.setMinimumHeight(100)
+    
     def create_controls(self):
         """Cria a barra de controles"""
         controls = QWidget()
         controls.setFixedHeight(100)
-        controls.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(26, 26, 26, 220), stop:1 rgba(10, 10, 10, 220));
-                border-top: 1px solid #333;
-            }
-        """)
+        controls.setObjectName("player_controls")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 8, 15, 12)
@@ -130,47 +222,16 @@ class VideoPlayerDialog(QDialog):
         progress_layout.setSpacing(10)
         
         self.current_time_label = QLabel("00:00")
-        self.current_time_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 40px;
-            }
-        """)
+        self.current_time_label.setProperty("role", "time_label")
         
         self.progress_slider = QSlider(Qt.Horizontal)
-        self.progress_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #404040;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #ff7b00;
-                width: 16px;
-                height: 16px;
-                border-radius: 8px;
-                margin: -5px 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #ff7b00;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_slider.setObjectName("progress_slider")
         self.progress_slider.sliderPressed.connect(self.on_slider_pressed)
         self.progress_slider.sliderReleased.connect(self.on_slider_released)
         self.progress_slider.sliderMoved.connect(self.on_slider_moved)
         
         self.total_time_label = QLabel("00:00")
-        self.total_time_label.setStyleSheet("""
-            QLabel {
-                color: #cccccc;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 40px;
-            }
-        """)
+        self.total_time_label.setProperty("role", "time_label")
         
         progress_layout.addWidget(self.current_time_label)
         progress_layout.addWidget(self.progress_slider, 1)
@@ -187,60 +248,29 @@ class VideoPlayerDialog(QDialog):
         
         self.play_btn = QPushButton("⏸️")
         self.play_btn.setFixedSize(40, 40)
-        self.play_btn.setStyleSheet("""
-            QPushButton {
-                background: #ff7b00;
-                border: none;
-                border-radius: 20px;
-                font-size: 16px;
-                color: white;
-            }
-            QPushButton:hover {
-                background: #ff9500;
-            }
-            QPushButton:pressed {
-                background: #e66a00;
-            }
-        """)
+        self.play_btn.setObjectName("play_button")
         self.play_btn.clicked.connect(self.toggle_play_pause)
         
         self.rewind_btn = QPushButton("⏪ 10s")
         self.rewind_btn.setFixedSize(70, 30)
-        self.rewind_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                border: 1px solid #555555;
-                border-radius: 5px;
-                color: white;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #444444;
-                border: 1px solid #666666;
-            }
-        """)
+        self.rewind_btn.setProperty("variant", "seek")
         self.rewind_btn.clicked.connect(self.rewind_10s)
         
         self.forward_btn = QPushButton("⏩ 10s")
         self.forward_btn.setFixedSize(70, 30)
-        self.forward_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                border: 1px solid #555555;
-                border-radius: 5px;
-                color: white;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #444444;
-                border: 1px solid #666666;
-            }
-        """)
+        self.forward_btn.setProperty("variant", "seek")
         self.forward_btn.clicked.connect(self.forward_10s)
         
+        self.next_btn = QPushButton("⏭️")
+        self.next_btn.setFixedSize(40, 30)
+        self.next_btn.setProperty("variant", "seek")
+        self.next_btn.setToolTip("Próximo episódio")
+        self.next_btn.clicked.connect(self.play_next_episode)
+        
         left_controls.addWidget(self.play_btn)
         left_controls.addWidget(self.rewind_btn)
         left_controls.addWidget(self.forward_btn)
+        left_controls.addWidget(self.next_btn)
         
         # Centro - Informações
         center_controls = QHBoxLayout()
@@ -252,41 +282,14 @@ class VideoPlayerDialog(QDialog):
         
         self.volume_btn = QPushButton("🔊")
         self.volume_btn.setFixedSize(30, 30)
-        self.volume_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                font-size: 14px;
-                color: #cccccc;
-            }
-            QPushButton:hover {
-                color: #ffffff;
-            }
-        """)
+        self.volume_btn.setObjectName("volume_button")
         self.volume_btn.clicked.connect(self.toggle_mute)
         
         self.volume_slider = QSlider(Qt.Horizontal)
         self.volume_slider.setFixedWidth(80)
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(80)
-        self.volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #404040;
-                height: 4px;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #cccccc;
-                width: 12px;
-                height: 12px;
-                border-radius: 6px;
-                margin: -4px 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #ff7b00;
-                border-radius: 2px;
-            }
-        """)
+        self.volume_slider.setObjectName("volume_slider")
         self.volume_slider.valueChanged.connect(self.set_volume)
         
         volume_layout.addWidget(self.volume_btn)
@@ -303,30 +306,11 @@ class VideoPlayerDialog(QDialog):
         quality_layout.setSpacing(5)
         
         quality_label = QLabel("Qualidade:")
-        quality_label.setStyleSheet("color: #cccccc; font-size: 11px;")
+        quality_label.setObjectName("quality_label")
         
         self.quality_combo = QComboBox()
         self.quality_combo.setFixedSize(80, 25)
-        self.quality_combo.setStyleSheet("""
-            QComboBox {
-                background: #333333;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                padding: 2px 5px;
-                font-size: 11px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 15px;
-            }
-            QComboBox QAbstractItemView {
-                background: #333333;
-                color: white;
-                border: 1px solid #555555;
-                selection-background-color: #ff7b00;
-            }
-        """)
+        self.quality_combo.setObjectName("quality_combo")
         self.quality_combo.currentTextChanged.connect(self.change_quality)
         
         quality_layout.addWidget(quality_label)
@@ -335,35 +319,14 @@ class VideoPlayerDialog(QDialog):
         # Idioma - AGORA FUNCIONAL
         self.language_btn = QPushButton("🇧🇷 Dub")
         self.language_btn.setFixedSize(60, 25)
-        self.language_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
+        self.language_btn.setProperty("variant", "player_option")
         self.language_btn.clicked.connect(self.toggle_language)
         
         # Tela cheia
         self.fullscreen_btn = QPushButton("⛶")
         self.fullscreen_btn.setFixedSize(35, 25)
-        self.fullscreen_btn.setStyleSheet("""
-            QPushButton {
-                background: #333333;
-                color: white;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background: #444444;
-            }
-        """)
+        self.fullscreen_btn.setObjectName("fullscreen_button")
+        self.fullscreen_btn.setProperty("variant", "player_option")
         self.fullscreen_btn.clicked.connect(self.toggle_fullscreen)
         
         right_controls.addLayout(quality_layout)
@@ -386,19 +349,8 @@ class VideoPlayerDialog(QDialog):
     def setup_media_player(self):
         """Configura o player de mídia com tratamento robusto de erros"""
         try:
-            self.media_player = QMediaPlayer()
             self.audio_output = QAudioOutput()
-            self.media_player.setAudioOutput(self.audio_output)
-            self.media_player.setVideoOutput(self.video_widget)
-            
-            # Configurações para melhor compatibilidade
-            self.media_player.setProperty("videoOutput", "software")
-            
-            # Conecta sinais
-            self.media_player.positionChanged.connect(self.position_changed)
-            self.media_player.durationChanged.connect(self.duration_changed)
-            self.media_player.playbackStateChanged.connect(self.playback_state_changed)
-            self.media_player.errorOccurred.connect(self.handle_player_error)
+            self.attach_media_player(create_media_player())
             
             # Configura volume inicial
             self.set_volume(80)
@@ -407,6 +359,142 @@ class VideoPlayerDialog(QDialog):
             logger.error(f"❌ Erro ao configurar media player: {e}")
             self.show_error(f"Erro na configuração do player: {str(e)}")
     
+    def player_signal_slots(self, player):
+        return [
+            (player.positionChanged, self.position_changed),
+            (player.durationChanged, self.duration_changed),
+            (player.playbackStateChanged, self.playback_state_changed),
+            (player.errorOccurred, self.handle_player_error),
+            (player.mediaStatusChanged, self.media_status_changed),
+        ]
+    
+    def attach_media_player(self, player):
+        """Coloca o player na tela, no áudio e nos controles"""
+        player.setAudioOutput(self.audio_output)
+        player.setVideoOutput(self.video_widget)
+        for signal, slot in self.player_signal_slots(player):
+            signal.connect(slot)
+        self.media_player = player
+    
+    def detach_media_player(self, player):
+        """Desliga e descarta um player que saiu de cena"""
+        for signal, slot in self.player_signal_slots(player):
+            signal.disconnect(slot)
+        player.stop()
+        player.setVideoOutput(None)
+        player.setAudioOutput(None)
+        player.deleteLater()
+    
+    def swap_media_player(self, new_player, play):
+        """Troca o player atual por um que veio pronto de um StandbyPlayer"""
+        self.detach_media_player(self.media_player)
+        self.attach_media_player(new_player)
+        # durationChanged já passou enquanto estava oculto
+        self.duration_changed(new_player.duration())
+        self.position_changed(new_player.position())
+        # O player novo já chega com buffer
+        self.rebuffer_monitor.reset(started=True)
+        self.stall_timer.stop()
+        if play:
+            new_player.play()
+    
+    def start_stream_resolution(self):
+        """Dispara a busca dos links em background"""
+        self.video_stack.setCurrentWidget(self.loading_label)
+        self.loading_label.setText("🔄 Buscando links de streaming...")
+        set_style_state(self.loading_label, "state", None)
+        self.quality_combo.setEnabled(False)
+        self.language_btn.setEnabled(False)
+        
+        # Os dois idiomas ao mesmo tempo: trocar depois não espera raspagem
+        self.waiting_language = self.current_language
+        for language in LANGUAGES:
+            self.resolve_language(language, PRIORITY_INTERACTIVE)
+    
+    def resolve_language(self, language, priority):
+        """Links do episódio atual em um idioma, do cache ou buscados em background"""
+        episode = self.episode
+        sources = get_link_cache().get(self.anime.get('id'), episode.get('number'), language)
+        if sources:
+            self.on_language_resolved(episode, language, sources)
+            return
+        
+        resolver = self.resolver
+        # Só o idioma esperado narra o carregamento
+        on_progress = self.on_resolve_progress if language == self.waiting_language else None
+        run_task(
+            lambda task: resolver(episode, language, task.report_progress, task.token.event,
+                                  self.late_source_found.emit),
+            priority=priority, token=self.resolve_token, with_task=True
+        ).then(lambda sources: self.on_language_resolved(episode, language, sources),
+               lambda error: self.on_language_failed(episode, language, error),
+               on_progress)
+    
+    def on_language_resolved(self, episode, language, sources):
+        if episode is not self.episode:
+            return
+        if not sources:
+            return self.on_language_failed(episode, language, "nenhum link de streaming")
+        get_link_cache().put(self.anime.get('id'), episode.get('number'), language, sources)
+        streaming_links = sources[0].streaming_links
+        self.language_links[language] = streaming_links
+        self.language_provider[language] = sources[0].provider
+        self.language_sources[language] = sources
+        self.language_source_index[language] = 0
+        
+        if language == self.waiting_language:
+            self.waiting_language = None
+            self.apply_language(language, streaming_links)
+        else:
+            self.update_language_button()
+    
+    def on_late_source(self, sources, source):
+        """Acrescentada aqui, na thread da interface, que é quem usa a lista
+        
+        A lista é a mesma guardada em language_sources, next_sources e no
+        cache de links, então a fonte fica disponível para a troca de provedor.
+        """
+        sources.append(source)
+    
+    def on_language_failed(self, episode, language, error):
+        if episode is not self.episode:
+            return
+        logger.warning(f"⚠️ Sem links {language} para o episódio {episode.get('number')}: {error}")
+        self.language_failed[language] = error
+        self.update_language_button()
+        if language != self.waiting_language:
+            return
+        
+        self.waiting_language = None
+        if self.media_player.mediaStatus() != QMediaPlayer.NoMedia:
+            # Já tocando: segue no idioma atual
+            self.show_error("Não foi possível carregar o stream no idioma selecionado")
+            return
+        # Nada tocando ainda: abre no outro idioma
+        other = self.other_language(language)
+        if other in self.language_links:
+            self.apply_language(other, self.language_links[other])
+        elif other in self.language_failed:
+            self.on_resolve_failed(error)
+        else:
+            self.waiting_language = other
+    
+    def on_resolve_progress(self, message):
+        self.loading_label.setText(f"🔄 {message}")
+    
+    def on_stream_resolved(self, streaming_links):
+        logger.info(f"✅ Links disponíveis: {list(streaming_links.keys())}")
+        self.video_data['streaming_links'] = streaming_links
+        self.video_stack.setCurrentWidget(self.video_widget)
+        self.quality_combo.setEnabled(True)
+        self.load_video()
+        self.update_subtitles()
+    
+    def on_resolve_failed(self, error):
+        logger.error(f"❌ Falha ao obter links de streaming: {error}")
+        self.loading_label.setText(f"❌ Não foi possível encontrar links de streaming para este episódio.\n\n{error}")
+        set_style_state(self.loading_label, "state", "error")
+    
     def load_video(self):
         """Carrega o vídeo baseado nos dados fornecidos"""
         try:
@@ -416,36 +504,213 @@ class VideoPlayerDialog(QDialog):
                 self.show_error("Nenhum link de streaming disponível")
                 return
             
-            # Preenche o seletor de qualidade
-            self.quality_combo.clear()
-            for quality in streaming_links.keys():
-                self.quality_combo.addItem(quality)
+            if self.resume_position is None:
+                # Só na primeira carga; aplicada quando a duração for conhecida
+                self.resume_position = self.get_resume_position()
             
-            # Tenta carregar a melhor qualidade primeiro
-            preferred_qualities = ['F-HD', 'HD', 'SD']
-            for quality in preferred_qualities:
-                if quality in streaming_links:
-                    self.current_quality = quality
-                    self.quality_combo.setCurrentText(quality)
-                    self.play_stream(streaming_links[quality])
-                    break
+            self.fill_quality_combo(streaming_links)
             
-            if not self.current_quality and streaming_links:
-                # Usa o primeiro link disponível
-                first_quality = list(streaming_links.keys())[0]
-                self.current_quality = first_quality
-                self.quality_combo.setCurrentText(first_quality)
-                self.play_stream(streaming_links[first_quality])
+            # A maior qualidade que a vazão medida para o host sustenta
+            quality = self.pick_quality(streaming_links)
+            self.current_quality = quality
+            self.set_quality_text(quality)
+            self.play_stream(streaming_links[quality])
                 
         except Exception as e:
             logger.error(f"❌ Erro ao carregar vídeo: {e}")
             self.show_error(f"Erro ao carregar vídeo: {str(e)}")
     
+    def fill_quality_combo(self, streaming_links):
+        # Sem disparar change_quality
+        self.quality_combo.blockSignals(True)
+        self.quality_combo.clear()
+        for quality in streaming_links.keys():
+            self.quality_combo.addItem(quality)
+        self.quality_combo.blockSignals(False)
+    
+    def get_resume_position(self, episode=None):
+        if not self.watch_progress:
+            return 0
+        episode = episode or self.episode
+        return self.watch_progress.get_resume_position(self.anime.get('id'), episode.get('number'))
+    
+    def load_autoplay_preference(self):
+        """preferences.auto_play do usuário logado; sem login, autoplay ligado"""
+        if not self.watch_progress:
+            return True
+        try:
+            conn = get_connection_manager().connection(self.watch_progress.db_name)
+            row = conn.execute("SELECT auto_play FROM preferences WHERE user_id = ?",
+                               (self.watch_progress.user_id,)).fetchone()
+        except Exception as e:
+            logger.error(f"❌ Erro ao ler preferência de autoplay: {e}")
+            return True
+        return bool(row[0]) if row else True
+    
+    def reset_next_episode(self):
+        """Descarta o que foi pré-carregado e aponta para o episódio seguinte ao atual"""
+        self.next_token.cancel()
+        self.next_token = CancellationToken()
+        if self.next_standby:
+            self.next_standby.discard()
+        self.next_standby = None
+        self.next_links = None
+        self.next_sources = []
+        self.next_language = None
+        self.next_resolving = False
+        self.next_requested = False
+        self.next_prefetch_started = False
+        self.next_episode = None
+        if self.next_episode_of and self.resolver:
+            self.next_episode = self.next_episode_of(self.episode)
+        self.next_btn.setEnabled(self.next_episode is not None)
+    
+    def maybe_prefetch_next(self, position):
+        duration = self.media_player.duration()
+        if (self.next_episode and not self.next_prefetch_started and duration > 0
+                and position >= duration * NEXT_EPISODE_PREFETCH_AT):
+            self.prefetch_next_episode(PRIORITY_PREFETCH)
+    
+    def prefetch_next_episode(self, priority):
+        """Resolve os links do próximo episódio em background"""
+        self.next_prefetch_started = True
+        self.next_resolving = True
+        resolver, episode, language = self.resolver, self.next_episode, self.current_language
+        cached = get_link_cache().get(self.anime.get('id'), episode.get('number'), language)
+        if cached:
+            self.on_next_resolved(episode, language, cached)
+            return
+        logger.info(f"⏭️ Buscando links do episódio {episode.get('number')} antecipadamente")
+        
+        run_task(
+            lambda task: resolver(episode, language, task.report_progress, task.token.event,
+                                  self.late_source_found.emit),
+            priority=priority, token=self.next_token, with_task=True
+        ).then(lambda sources: self.on_next_resolved(episode, language, sources), self.on_next_failed)
+    
+    def on_next_resolved(self, episode, language, sources):
+        self.next_resolving = False
+        if not sources:
+            return self.on_next_failed("nenhum link de streaming")
+        get_link_cache().put(self.anime.get('id'), episode.get('number'), language, sources)
+        streaming_links = sources[0].streaming_links
+        self.next_links = streaming_links
+        self.next_sources = sources
+        self.next_language = language
+        
+        if self.next_requested:
+            self.play_next_episode()
+        elif PREBUFFER_NEXT_EPISODE:
+            quality = self.pick_quality(streaming_links)
+            standby = StandbyPlayer(streaming_links[quality], self.get_resume_position(self.next_episode), self)
+            standby.failed.connect(lambda reason: self.discard_next_standby(standby))
+            self.next_standby = standby
+            standby.start()
+    
+    def on_next_failed(self, error):
+        self.next_resolving = False
+        logger.warning(f"⚠️ Não foi possível antecipar o próximo episódio: {error}")
+        if self.next_requested:
+            self.next_requested = False
+            self.on_resolve_failed(error)
+    
+    def discard_next_standby(self, standby):
+        if standby is self.next_standby:
+            standby.discard()
+            self.next_standby = None
+    
+    def pick_quality(self, streaming_links):
+        """A qualidade atual se existir, senão a maior que a conexão sustenta"""
+        if self.current_quality in streaming_links:
+            return self.current_quality
+        # Durações de episódios de um mesmo anime são parecidas
+        duration = self.media_player.duration() if self.media_player else 0
+        return choose_quality(streaming_links, duration / 1000 if duration > 0 else None)
+    
+    def play_next_episode(self):
+        """Vai para o próximo episódio, usando o que já estiver pré-carregado"""
+        if not self.next_episode:
+            return
+        
+        if self.next_links is None:
+            # Ainda sem links: mostra o carregamento e continua em on_next_resolved
+            self.next_requested = True
+            self.save_progress()
+            self.media_player.pause()
+            self.video_stack.setCurrentWidget(self.loading_label)
+            self.loading_label.setText("🔄 Carregando próximo episódio...")
+            set_style_state(self.loading_label, "state", None)
+            if not self.next_resolving:
+                self.prefetch_next_episode(PRIORITY_INTERACTIVE)
+            return
+        
+        self.save_progress()
+        episode, streaming_links, standby = self.next_episode, self.next_links, self.next_standby
+        language, sources = self.next_language, self.next_sources
+        self.next_standby = None
+        
+        self.episode = episode
+        self.video_data['episode_data'] = episode
+        self.video_data['streaming_links'] = streaming_links
+        self.reset_next_episode()
+        # Os links do outro idioma para o novo episódio, já para a próxima troca
+        self.resolve_token.cancel()
+        self.resolve_token = CancellationToken()
+        self.current_language = language
+        self.language_links = {language: streaming_links}
+        self.language_failed = {}
+        self.language_sources = {language: sources}
+        self.language_source_index = {language: 0}
+        self.language_provider = {language: sources[0].provider if sources else None}
+        self.finish_qoe_session()
+        self.qoe = self.new_qoe_session()
+        self.waiting_language = None
+        self.update_language_button()
+        self.resolve_language(self.other_language(language), PRIORITY_PREFETCH)
+        self.discard_standby()
+        self.video_stack.setCurrentWidget(self.video_widget)
+        logger.info(f"⏭️ Próximo episódio: {episode.get('number')}")
+        
+        if standby and standby.is_ready:
+            quality = self.pick_quality(streaming_links)
+            self.current_quality = quality
+            self.fill_quality_combo(streaming_links)
+            self.set_quality_text(quality)
+            self.resume_position = 0
+            self.swap_media_player(standby.take_player(), play=True)
+            standby.discard()
+            self.qoe.stream_started(self.current_provider(), host_of(streaming_links[quality]), quality,
+                                    language, preloaded=True)
+            self.watch_frames()
+        else:
+            if standby:
+                standby.discard()
+            self.current_quality = None
+            self.resume_position = None
+            self.load_video()
+        self.update_subtitles()
+    
+    def save_progress(self, flush=True):
+        """Enfileira a posição atual; flush pede a gravação sem esperar por ela"""
+        if not self.watch_progress or not self.media_player:
+            return
+        self.watch_progress.record(self.anime, self.episode, self.media_player.position(), self.media_player.duration())
+        if flush:
+            self.watch_progress.flush()
+    
     def play_stream(self, stream_url):
         """Reproduz um stream URL com tratamento robusto"""
         try:
             logger.info(f"🎬 Carregando stream: {stream_url[:100]}...")
             
+            # Uma troca de qualidade pendente seria do stream anterior
+            self.discard_standby()
+            self.rebuffer_monitor.reset()
+            self.stall_timer.stop()
+            self.qoe.stream_started(self.current_provider(), host_of(stream_url), self.current_quality,
+                                    self.current_language)
+            self.watch_frames()
+            
             # Para qualquer reprodução anterior de forma segura
             if self.media_player:
                 self.media_player.stop()
@@ -459,7 +724,8 @@ class VideoPlayerDialog(QDialog):
     def _start_stream(self, stream_url):
         """Inicia o stream após limpeza"""
         try:
-            self.media_player.setSource(QUrl(stream_url))
+            # Pelo servidor local: seeks e trocas reaproveitam o que já foi baixado
+            self.media_player.setSource(QUrl(local_stream_url(stream_url)))
             # Pequeno delay antes de reproduzir
             QTimer.singleShot(100, self.media_player.play)
             logger.info("✅ Stream configurado com sucesso")
@@ -485,7 +751,7 @@ class VideoPlayerDialog(QDialog):
         if self.media_player:
             try:
                 current_pos = self.media_player.position()
-                self.media_player.setPosition(max(0, current_pos - 10000))
+                self.seek(max(0, current_pos - 10000))
             except Exception as e:
                 logger.error(f"❌ Erro ao retroceder: {e}")
     
@@ -495,10 +761,17 @@ class VideoPlayerDialog(QDialog):
             try:
                 current_pos = self.media_player.position()
                 duration = self.media_player.duration()
-                self.media_player.setPosition(min(duration, current_pos + 10000))
+                self.seek(min(duration, current_pos + 10000))
             except Exception as e:
                 logger.error(f"❌ Erro ao avançar: {e}")
     
+    def seek(self, position):
+        # O buffer que vem depois não conta como travamento
+        self.rebuffer_monitor.seeked()
+        self.qoe.seek_started()
+        self.watch_frames()
+        self.media_player.setPosition(position)
+    
     def set_volume(self, volume):
         """Ajusta o volume"""
         if self.audio_output:
@@ -543,94 +816,140 @@ class VideoPlayerDialog(QDialog):
         if self.media_player:
             try:
                 # Atualiza o tempo atual imediatamente
-                current_time = QTime(0, 0, 0, 0).addMSecs(position)
-                self.current_time_label.setText(current_time.toString("mm:ss"))
+                self.show_time(position)
                 
                 # Define a posição no player
-                self.media_player.setPosition(position)
+                self.seek(position)
             except Exception as e:
                 logger.error(f"❌ Erro ao mover slider: {e}")
     
+    def set_quality_text(self, quality):
+        self.quality_combo.blockSignals(True)
+        self.quality_combo.setCurrentText(quality)
+        self.quality_combo.blockSignals(False)
+    
     def change_quality(self, quality):
-        """Muda a qualidade do vídeo"""
-        if quality != self.current_quality:
-            streaming_links = self.video_data.get('streaming_links', {})
-            if quality in streaming_links:
-                self.current_quality = quality
-                current_position = self.media_player.position()
-                self.play_stream(streaming_links[quality])
-                # Restaura a posição após carregar
-                QTimer.singleShot(2000, lambda: self.media_player.setPosition(current_position))
+        """Muda a qualidade do vídeo sem interromper a reprodução"""
+        streaming_links = self.video_data.get('streaming_links', {})
+        if quality not in streaming_links:
+            return
+        # Escolha do usuário: a qualidade não sobe mais sozinha
+        self.auto_quality = False
+        if quality == self.current_quality:
+            # Voltou para a qualidade que já está tocando: cancela a troca pendente
+            self.discard_standby()
+            return
+        
+        if self.media_player.mediaStatus() == QMediaPlayer.NoMedia:
+            self.current_quality = quality
+            self.play_stream(streaming_links[quality])
+            return
+        
+        logger.info(f"🔄 Preparando qualidade {quality} em segundo plano")
+        self.switch_stream(streaming_links[quality], quality)
+    
+    def switch_stream(self, stream_url, quality, on_failed=None):
+        """Carrega o stream em um player oculto e troca quando houver imagem
+        
+        O player atual segue tocando até o novo estar pausado na mesma posição
+        com o primeiro quadro decodificado; aí os dois trocam de lugar.
+        """
+        self.discard_standby()
+        standby = StandbyPlayer(stream_url, self.media_player.position, self)
+        standby.ready.connect(lambda: self.on_standby_ready(standby, quality))
+        standby.failed.connect(lambda reason: self.on_standby_failed(standby, on_failed))
+        self.standby = standby
+        standby.start()
+    
+    def on_standby_ready(self, standby, quality):
+        if standby is not self.standby:
+            return
+        self.standby = None
+        
+        was_playing = self.media_player.playbackState() == QMediaPlayer.PlayingState
+        new_player = standby.take_player()
+        standby.discard()
+        
+        self.swap_media_player(new_player, play=was_playing)
+        self.current_quality = quality
+        stream_url = (self.video_data.get('streaming_links') or {}).get(quality, "")
+        self.qoe.stream_started(self.current_provider(), host_of(stream_url), quality,
+                                self.current_language, preloaded=True)
+        # Troca de idioma: a legenda passa a ser a da fonte do novo idioma
+        self.update_subtitles()
+        logger.info(f"✅ Qualidade trocada para {quality} em {new_player.position() // 1000}s")
+    
+    def on_standby_failed(self, standby, on_failed=None):
+        if standby is not self.standby:
+            return
+        self.discard_standby()
+        if on_failed:
+            on_failed()
+        # Continua na qualidade atual
+        self.set_quality_text(self.current_quality)
+    
+    def discard_standby(self):
+        if self.standby:
+            self.standby.discard()
+            self.standby = None
+    
+    def other_language(self, language):
+        return 'legendado' if language == 'dublado' else 'dublado'
+    
+    def update_language_button(self):
+        self.language_btn.setText(LANGUAGES[self.current_language])
+        other = self.other_language(self.current_language)
+        # Só troca depois de começar a tocar, e enquanto o outro idioma puder existir
+        available = self.current_language in self.language_links and other not in self.language_failed
+        self.language_btn.setEnabled(available)
+        if other in self.language_failed:
+            self.language_btn.setToolTip(f"Episódio sem versão {other}")
+        else:
+            self.language_btn.setToolTip("")
     
     def toggle_language(self):
-        """Alterna entre legendado e dublado - AGORA FUNCIONAL"""
-        try:
-            # Primeiro para a reprodução atual
-            was_playing = self.media_player.playbackState() == QMediaPlayer.PlayingState
-            current_position = self.media_player.position()
-            
-            # Alterna o idioma
-            if self.current_language == 'dublado':
-                self.current_language = 'legendado'
-                self.language_btn.setText("🇧🇷 Leg")
-                logger.info("🔄 Alternando para LEGENDADO")
-            else:
-                self.current_language = 'dublado'
-                self.language_btn.setText("🇧🇷 Dub")
-                logger.info("🔄 Alternando para DUBLADO")
-            
-            # Obtém o episódio atual
-            episode_data = self.video_data.get('episode_data', {})
-            episode_number = episode_data.get('number', 1)
-            anime_name = self.video_data.get('anime_name', '')
-            
-            # Gera novo link baseado no idioma
-            from modules.anime.animefire_downloader import AnimeFireDownloader
-            downloader = AnimeFireDownloader()
-            
-            if self.current_language == 'dublado':
-                new_url = f"https://animefire.plus/animes/{anime_name}-dublado/{episode_number}"
-            else:
-                new_url = f"https://animefire.plus/animes/{anime_name}/{episode_number}"
-            
-            logger.info(f"🔗 Novo URL: {new_url}")
-            
-            # Obtém novos links de streaming
-            new_streaming_info = downloader.obter_links_streaming_episodio(new_url)
-            
-            if new_streaming_info['success'] and new_streaming_info['streaming_links']:
-                # Atualiza os dados do vídeo
-                self.video_data['streaming_links'] = new_streaming_info['streaming_links']
-                
-                # Recarrega as qualidades disponíveis
-                self.quality_combo.clear()
-                for quality in new_streaming_info['streaming_links'].keys():
-                    self.quality_combo.addItem(quality)
-                
-                # Reproduz a mesma qualidade se disponível, senão a melhor disponível
-                if self.current_quality in new_streaming_info['streaming_links']:
-                    new_stream_url = new_streaming_info['streaming_links'][self.current_quality]
-                else:
-                    # Pega a primeira qualidade disponível
-                    first_quality = list(new_streaming_info['streaming_links'].keys())[0]
-                    new_stream_url = new_streaming_info['streaming_links'][first_quality]
-                    self.current_quality = first_quality
-                    self.quality_combo.setCurrentText(first_quality)
-                
-                # Reproduz o novo stream
-                self.play_stream(new_stream_url)
-                
-                # Restaura a posição e estado de reprodução
-                if was_playing:
-                    QTimer.singleShot(2500, self.media_player.play)
-                QTimer.singleShot(2000, lambda: self.media_player.setPosition(current_position))
-                
-            else:
-                self.show_error("Não foi possível carregar o stream no idioma selecionado")
-                
-        except Exception as e:
-            logger.error(f"❌ Erro ao alternar idioma: {e}")
-            self.show_error(f"Erro ao alternar idioma: {str(e)}")
+        """Alterna entre legendado e dublado sem parar o vídeo"""
+        target = self.other_language(self.current_language)
+        streaming_links = self.language_links.get(target)
+        if streaming_links:
+            self.apply_language(target, streaming_links)
+        elif target in self.language_failed:
+            self.show_error("Não foi possível carregar o stream no idioma selecionado")
+        elif self.waiting_language == target:
+            # Segundo clique enquanto espera: desiste da troca
+            self.waiting_language = None
+            self.update_language_button()
+        else:
+            # Ainda buscando: troca em on_language_resolved
+            logger.info(f"⏳ Aguardando links {target}")
+            self.waiting_language = target
+            self.language_btn.setText(f"⏳ {LANGUAGES[target]}")
+    
+    def apply_language(self, language, streaming_links):
+        """Passa a tocar os links do idioma, na mesma posição"""
+        previous_language = self.current_language
+        previous_links = self.video_data.get('streaming_links')
+        self.current_language = language
+        self.video_data['streaming_links'] = streaming_links
+        self.update_language_button()
+        
+        if self.media_player.mediaStatus() == QMediaPlayer.NoMedia:
+            self.on_stream_resolved(streaming_links)
+            return
+        
+        def revert():
+            self.current_language = previous_language
+            self.video_data['streaming_links'] = previous_links
+            self.fill_quality_combo(previous_links)
+            self.update_language_button()
+            self.show_error("Não foi possível carregar o stream no idioma selecionado")
+        
+        quality = self.pick_quality(streaming_links)
+        self.fill_quality_combo(streaming_links)
+        self.set_quality_text(quality)
+        logger.info(f"🔄 Alternando para {language.upper()}")
+        # O player oculto abre na posição atual; a troca acontece quando houver imagem
+        self.switch_stream(streaming_links[quality], quality, on_failed=revert)
     
     def toggle_fullscreen(self):
         """Alterna entre tela cheia e normal"""
@@ -650,14 +969,38 @@ class VideoPlayerDialog(QDialog):
     def position_changed(self, position):
         """Atualiza quando a posição do vídeo muda"""
         try:
-            if not self.progress_slider.isSliderDown():
-                self.progress_slider.setValue(position)
+            self.last_position = position
+            if self.subtitles:
+                self.show_subtitle(self.subtitles.text_at(position))
+            # Com os controles ocultos (tela cheia) não há o que redesenhar
+            if self.controls_visible:
+                self.refresh_position(position)
             
-            current_time = QTime(0, 0, 0, 0).addMSecs(position)
-            self.current_time_label.setText(current_time.toString("mm:ss"))
+            if self.is_playing:
+                # Só atualiza a fila em memória; a escrita é da thread do store
+                self.save_progress(flush=False)
+                self.maybe_prefetch_next(position)
         except Exception as e:
             pass  # Ignora erros temporários
     
+    def refresh_position(self, position):
+        """Redesenha barra e relógio só quando o que aparece muda
+        
+        O positionChanged chega muitas vezes por segundo; a barra só anda
+        quando a posição avança um pixel e o relógio a cada segundo.
+        """
+        slider = self.progress_slider
+        if not slider.isSliderDown():
+            ms_per_pixel = (slider.maximum() - slider.minimum()) / max(slider.width(), 1)
+            if abs(position - slider.value()) >= ms_per_pixel:
+                slider.setValue(position)
+        if position // 1000 != self.shown_second:
+            self.show_time(position)
+    
+    def show_time(self, position):
+        self.shown_second = position // 1000
+        self.current_time_label.setText(QTime(0, 0, 0, 0).addMSecs(position).toString("mm:ss"))
+    
     def duration_changed(self, duration):
         """Atualiza quando a duração do vídeo é conhecida"""
         try:
@@ -665,33 +1008,146 @@ class VideoPlayerDialog(QDialog):
                 self.progress_slider.setRange(0, duration)
                 total_time = QTime(0, 0, 0, 0).addMSecs(duration)
                 self.total_time_label.setText(total_time.toString("mm:ss"))
+                
+                if self.resume_position:
+                    logger.info(f"⏩ Retomando em {self.resume_position // 1000}s")
+                    self.seek(self.resume_position)
+                    self.resume_position = 0
         except Exception as e:
             pass  # Ignora erros temporários
     
     def playback_state_changed(self, state):
         """Atualiza o estado de reprodução"""
+        self.qoe.playing(state == QMediaPlayer.PlayingState)
         if state == QMediaPlayer.PlayingState:
             self.play_btn.setText("⏸️")
             self.is_playing = True
         else:
             self.play_btn.setText("▶️")
+            if self.is_playing and state == QMediaPlayer.PausedState:
+                self.save_progress()
             self.is_playing = False
     
-    def update_controls(self):
-        """Atualiza os controles periodicamente"""
-        try:
-            if (self.media_player and 
-                self.media_player.playbackState() == QMediaPlayer.PlayingState and
-                not self.progress_slider.isSliderDown()):
-                
-                position = self.media_player.position()
-                duration = self.media_player.duration()
-                
-                if duration > 0:
-                    self.progress_slider.setValue(position)
-                    
-        except Exception as e:
-            pass  # Ignora erros de atualização
+    def media_status_changed(self, status):
+        if status == QMediaPlayer.StalledMedia:
+            if self.rebuffer_monitor.stall_started():
+                logger.info("⏳ Reprodução travou, aguardando buffer")
+                self.stall_timer.start()
+                self.check_stall_budget()
+        elif status in (QMediaPlayer.BufferingMedia, QMediaPlayer.BufferedMedia):
+            if status == QMediaPlayer.BufferedMedia:
+                self.rebuffer_monitor.playing()
+                self.qoe.buffered()
+            stalled = self.rebuffer_monitor.stall_ended()
+            if stalled is not None:
+                self.stall_timer.stop()
+                self.qoe.rebuffered(stalled)
+                logger.info(f"▶️ Reprodução voltou depois de {stalled:.1f}s travada")
+                self.check_stall_budget()
+        elif status == QMediaPlayer.EndOfMedia:
+            self.save_progress()
+            if self.autoplay and self.next_episode:
+                self.play_next_episode()
+    
+    def new_qoe_session(self):
+        return PlaybackSession(self.anime.get('id'), self.episode.get('number'))
+    
+    def finish_qoe_session(self):
+        self.playback_metrics.record(self.qoe)
+    
+    def current_provider(self):
+        return self.language_provider.get(self.current_language)
+    
+    def current_source(self):
+        sources = self.language_sources.get(self.current_language) or []
+        index = self.language_source_index.get(self.current_language, 0)
+        return sources[index] if index < len(sources) else None
+    
+    def update_subtitles(self):
+        """Carrega a legenda externa da fonte em uso, ou tira a anterior se ela não tiver"""
+        source = self.current_source()
+        subtitle_url = source.subtitles[0]['url'] if source and source.subtitles else None
+        if subtitle_url == self.subtitle_url:
+            return
+        self.subtitle_url = subtitle_url
+        self.subtitles = None
+        self.show_subtitle("")
+        if not subtitle_url:
+            return
+        
+        logger.info(f"💬 Carregando legenda {source.subtitles[0].get('label', '')}")
+        run_task(load_subtitles, subtitle_url, source.headers,
+                 priority=PRIORITY_INTERACTIVE, token=self.resolve_token
+        ).then(lambda subtitles: self.on_subtitles_loaded(subtitle_url, subtitles),
+               lambda error: logger.warning(f"⚠️ Não foi possível carregar a legenda: {error}"))
+    
+    def on_subtitles_loaded(self, subtitle_url, subtitles):
+        if subtitle_url != self.subtitle_url:
+            return
+        self.subtitles = subtitles
+        self.show_subtitle(subtitles.text_at(self.last_position))
+    
+    def show_subtitle(self, text):
+        # Desenhada pelo próprio QVideoWidget, por cima do vídeo
+        if text != self.subtitle_text:
+            self.subtitle_text = text
+            self.video_widget.videoSink().setSubtitleText(text)
+    
+    def watch_frames(self):
+        """Observa os quadros só enquanto há um a medir (primeiro quadro ou seek)"""
+        if self.watching_frames:
+            return
+        self.video_widget.videoSink().videoFrameChanged.connect(self.on_video_frame)
+        self.watching_frames = True
+    
+    def on_video_frame(self, frame):
+        self.qoe.frame()
+        if not self.qoe.waiting_frame:
+            self.video_widget.videoSink().videoFrameChanged.disconnect(self.on_video_frame)
+            self.watching_frames = False
+    
+    def check_stall_budget(self):
+        if self.rebuffer_monitor.over_budget():
+            self.downshift_quality()
+    
+    def downshift_quality(self):
+        """Desce um nível de qualidade, na mesma posição, depois de travar demais"""
+        streaming_links = self.video_data.get('streaming_links') or {}
+        ranked = ranked_qualities(streaming_links)
+        if self.standby or self.current_quality not in ranked:
+            # Já há uma troca em andamento
+            return
+        lower = ranked[ranked.index(self.current_quality) + 1:]
+        if not lower:
+            return
+        quality = lower[0]
+        logger.warning(f"📉 Muitos travamentos em {self.current_quality}: descendo para {quality}")
+        self.downshifted_at = time.time()
+        self.set_quality_text(quality)
+        self.switch_stream(streaming_links[quality], quality)
+    
+    def maybe_upshift(self):
+        """Sobe um nível quando a vazão medida no host sustenta a qualidade acima"""
+        if not self.auto_quality or self.standby or not self.is_playing:
+            return
+        if not self.rebuffer_monitor.stable_for(UPSHIFT_STABLE_SECONDS):
+            return
+        streaming_links = self.video_data.get('streaming_links') or {}
+        ranked = ranked_qualities(streaming_links)
+        if self.current_quality not in ranked or ranked.index(self.current_quality) == 0:
+            return
+        quality = ranked[ranked.index(self.current_quality) - 1]
+        measurement = get_host_throughput().measurement(host_of(streaming_links[quality]))
+        # Depois de descer, só sobe com uma medição feita depois disso
+        if not measurement or (self.downshifted_at and measurement["updated"] <= self.downshifted_at):
+            return
+        duration = self.media_player.duration()
+        best = choose_quality(streaming_links, duration / 1000 if duration > 0 else None)
+        if ranked.index(best) > ranked.index(quality):
+            return
+        logger.info(f"📈 Vazão sustenta {quality}: subindo de {self.current_quality}")
+        self.set_quality_text(quality)
+        self.switch_stream(streaming_links[quality], quality)
     
     def handle_player_error(self, error, error_string):
         """Lida com erros do player de forma robusta"""
@@ -714,11 +1170,38 @@ class VideoPlayerDialog(QDialog):
         
         error_msg = error_messages.get(error, f"Erro desconhecido: {error}")
         logger.error(f"❌ Erro no player: {error_msg} - {error_string}")
+        self.qoe.error(f"{error_msg} - {error_string}")
+        # O link pode ter expirado: reabrir o episódio resolve de novo
+        get_link_cache().discard(self.anime.get('id'), self.episode.get('number'), self.current_language)
+        if error != QMediaPlayer.NoError and self.failover_source():
+            return
         
         # Só mostra dialog para erros críticos quando a janela está ativa
         if error not in [QMediaPlayer.NoError] and self.isActiveWindow():
             self.show_error(f"Erro na reprodução: {error_msg}")
     
+    def failover_source(self):
+        """Continua, na mesma posição, na próxima fonte do idioma atual"""
+        sources = self.language_sources.get(self.current_language) or []
+        index = self.language_source_index.get(self.current_language, 0) + 1
+        if index >= len(sources):
+            return False
+        source = sources[index]
+        self.language_source_index[self.current_language] = index
+        position = self.last_position
+        logger.warning(f"🔁 Trocando para o provedor {source.provider} em {position // 1000}s")
+        get_link_cache().put(self.anime.get('id'), self.episode.get('number'), self.current_language,
+                             sources[index:])
+        
+        self.language_links[self.current_language] = source.streaming_links
+        self.language_provider[self.current_language] = source.provider
+        self.video_data['streaming_links'] = source.streaming_links
+        self.resume_position = position
+        self.current_quality = None
+        self.load_video()
+        self.update_subtitles()
+        return True
+    
     def show_error(self, message):
         """Mostra mensagem de erro"""
         QMessageBox.warning(self, "Erro no Player", message)
@@ -740,9 +1223,15 @@ class VideoPlayerDialog(QDialog):
     
     def closeEvent(self, event):
         """Limpeza ao fechar"""
+        # Descarta a resolução de links ainda em andamento
+        self.resolve_token.cancel()
+        self.save_progress()
+        self.discard_standby()
+        self.reset_next_episode()
+        self.stall_timer.stop()
+        self.upshift_timer.stop()
+        self.finish_qoe_session()
         try:
-            if self.update_timer:
-                self.update_timer.stop()
             if self.mouse_inactivity_timer:
                 self.mouse_inactivity_timer.stop()
             if self.media_player:
@@ -752,6 +1241,17 @@ class VideoPlayerDialog(QDialog):
         
         event.accept()
     
+    def done(self, result):
+        # Esc/reject não passam pelo closeEvent
+        self.resolve_token.cancel()
+        self.save_progress()
+        self.discard_standby()
+        self.reset_next_episode()
+        self.stall_timer.stop()
+        self.upshift_timer.stop()
+        self.finish_qoe_session()
+        super().done(result)
+    
     def keyPressEvent(self, event):
         """Atalhos de teclado"""
         if event.key() == Qt.Key_Space:
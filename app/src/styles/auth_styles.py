@@ -1,137 +1,131 @@
+MESSAGE_COLORS = {
+    "error": "#e53e3e",
+    "warning": "#dd6b20",
+    "success": "#38a169",
+    "info": "#3182ce"
+}
+
 def get_auth_styles():
     return """
-    /* Estilos Gerais */
-    QWidget {
-        font-family: 'Segoe UI', Arial, sans-serif;
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                   stop:0 #667eea, stop:1 #764ba2);
+    /* Autenticação */
+    AuthWidget QWidget {
+        background: #1a1a1a;
+        color: white;
     }
-    
-    /* Container Principal */
-    QWidget#auth_container {
-        background: rgba(255, 255, 255, 0.95);
-        border-radius: 15px;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        padding: 30px;
+
+    AuthWidget QFrame#auth_container {
+        background: #2a2a2a;
+        border-radius: 10px;
     }
-    
-    /* Títulos */
-    QLabel {
-        color: #2d3748;
-        font-size: 24px;
-        font-weight: bold;
+
+    QLabel#auth_title {
+        font-size: 36px;
         margin-bottom: 20px;
-        background: transparent;
-        border: none;
+        color: #ff7b00;
+        font-weight: bold;
     }
-    
-    QLabel#subtitle {
-        color: #718096;
+
+    /* Abas - o estado ativo vem da propriedade dinâmica "active" */
+    QPushButton[variant="auth_tab"] {
+        padding: 12px 24px;
+        border: none;
+        color: white;
+        background: transparent;
+        border-bottom: 2px solid transparent;
         font-size: 14px;
-        font-weight: normal;
-        margin-bottom: 30px;
     }
-    
+
+    QPushButton[variant="auth_tab"]:hover {
+        background: #3a3a3a;
+    }
+
+    QPushButton[variant="auth_tab"][active="true"] {
+        border-bottom: 2px solid #ff7b00;
+        color: #ff7b00;
+    }
+
     /* Campos de Input */
-    QLineEdit {
-        background: #f7fafc;
-        border: 2px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 12px 15px;
+    AuthWidget QLineEdit {
+        padding: 12px;
+        background: #3a3a3a;
+        color: white;
+        border: 1px solid #444;
+        border-radius: 5px;
         font-size: 14px;
-        color: #2d3748;
-        margin-bottom: 15px;
-        min-height: 20px;
-    }
-    
-    QLineEdit:focus {
-        border-color: #667eea;
-        background: #ffffff;
     }
-    
-    QLineEdit::placeholder {
-        color: #a0aec0;
+
+    AuthWidget QLineEdit:focus {
+        border-color: #ff7b00;
     }
-    
-    /* Botões Principais */
-    QPushButton {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #667eea, stop:1 #764ba2);
+
+    /* Botões de envio */
+    QPushButton[variant="submit"] {
+        padding: 12px;
+        background: #ff7b00;
         color: white;
         border: none;
-        border-radius: 8px;
-        padding: 12px;
-        font-size: 14px;
+        border-radius: 5px;
+        font-size: 16px;
         font-weight: bold;
-        margin-top: 10px;
-        min-height: 20px;
     }
-    
-    QPushButton:hover {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #5a6fd8, stop:1 #6a4190);
+
+    QPushButton[variant="submit"]:hover {
+        background: #ff9500;
+    }
+
+    QPushButton[variant="submit"]:disabled {
+        background: #666;
+        color: #999;
     }
-    
-    QPushButton:pressed {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #4c5bc6, stop:1 #58357e);
+
+    /* Links entre login e cadastro */
+    QLabel[role="switch_label"] {
+        color: #ccc;
     }
-    
-    /* Botões Secundários */
-    QPushButton#secondary {
+
+    QPushButton[variant="link"] {
         background: transparent;
-        color: #667eea;
-        border: 2px solid #667eea;
-        border-radius: 8px;
-        padding: 10px;
+        color: #ff7b00;
+        border: none;
+        text-decoration: underline;
+        padding: 5px;
+    }
+
+    QPushButton[variant="link"]:hover {
+        color: #ff9500;
+    }
+    """ + get_message_styles()
+
+def get_message_styles():
+    """Estilos das mensagens, um bloco por tipo (propriedade messageType)"""
+    styles = ""
+    for message_type, border in MESSAGE_COLORS.items():
+        styles += f"""
+    QMessageBox[messageType="{message_type}"] {{
+        background-color: #2a2a2a;
+        color: #f7fafc;
+        border: 2px solid {border};
+        border-radius: 10px;
+    }}
+
+    QMessageBox[messageType="{message_type}"] QLabel {{
+        color: #f7fafc;
         font-size: 14px;
-        font-weight: bold;
-        margin-top: 5px;
-    }
-    
-    QPushButton#secondary:hover {
-        background: #667eea;
+        padding: 10px;
+    }}
+
+    QMessageBox[messageType="{message_type}"] QPushButton {{
+        background-color: {border};
         color: white;
-    }
-    
-    /* Cards/Containers Internos */
-    QFrame {
-        background: white;
-        border-radius: 10px;
-        border: 1px solid #e2e8f0;
-    }
-    
-    /* Mensagens de Erro/Sucesso */
-    QLabel#error {
-        color: #e53e3e;
-        font-size: 12px;
-        background: #fed7d7;
-        padding: 8px;
+        border: none;
         border-radius: 5px;
-        border: 1px solid #feb2b2;
-    }
-    
-    QLabel#success {
-        color: #38a169;
+        padding: 8px 20px;
         font-size: 12px;
-        background: #c6f6d5;
-        padding: 8px;
-        border-radius: 5px;
-        border: 1px solid #9ae6b4;
-    }
-    
-    /* Loading Spinner */
-    QProgressBar {
-        border: none;
-        background: #e2e8f0;
-        border-radius: 10px;
-        text-align: center;
-        color: #4a5568;
-    }
-    
-    QProgressBar::chunk {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #667eea, stop:1 #764ba2);
-        border-radius: 10px;
-    }
-    """
\ No newline at end of file
+        min-width: 80px;
+    }}
+
+    QMessageBox[messageType="{message_type}"] QPushButton:hover {{
+        background-color: #4a5568;
+    }}
+    """
+    return styles
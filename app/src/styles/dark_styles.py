@@ -1,102 +1,484 @@
 def get_dark_styles():
     return """
-    /* Tema Escuro - CORRIGIDO */
-    QWidget {
-        font-family: 'Segoe UI', Arial, sans-serif;
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                   stop:0 #1a202c, stop:1 #2d3748);
-        color: #f7fafc; /* 🔥 CORRIGIDO: Cor do texto padrão */
-    }
-    
-    QWidget#auth_container {
-        background: rgba(45, 55, 72, 0.95);
-        border-radius: 15px;
-        border: 1px solid #4a5568;
-        padding: 30px;
-    }
-    
-    /* 🔥 CORRIGIDO: Estilo explícito para QLabel */
-    QLabel {
-        color: #f7fafc !important;
-        font-size: 18px;
-        font-weight: bold;
-        margin-bottom: 10px;
+    /* Tema Escuro do AniPlay - aplicado uma única vez na QApplication */
+
+    /* Áreas de rolagem */
+    QScrollArea {
+        border: none;
         background: transparent;
+    }
+
+    QScrollBar:vertical {
+        background: #2a2a2a;
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+
+    QScrollBar::handle:vertical {
+        background: #ff7b00;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+
+    QScrollBar:horizontal {
+        background: #2a2a2a;
+        height: 8px;
+        border-radius: 4px;
+    }
+
+    QScrollBar::handle:horizontal {
+        background: #ff7b00;
+        border-radius: 4px;
+    }
+
+    QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+        background: #ff9500;
+    }
+
+    QScrollBar::add-line, QScrollBar::sub-line {
         border: none;
-        padding: 5px;
+        background: none;
+    }
+
+    /* Botões reutilizados */
+    QPushButton[variant="primary"] {
+        padding: 8px 16px;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+        background: #ff7b00;
+        color: white;
+    }
+
+    QPushButton[variant="primary"]:hover {
+        background: #ff9500;
     }
-    
-    QLabel#subtitle {
-        color: #a0aec0 !important;
+
+    QPushButton[variant="outline"] {
+        padding: 8px 16px;
+        border-radius: 5px;
         font-size: 14px;
-        font-weight: normal;
+        background: transparent;
+        color: #ff7b00;
+        border: 1px solid #ff7b00;
+    }
+
+    QPushButton[variant="outline"]:hover {
+        background: #3a3a3a;
+    }
+
+    QPushButton[variant="pager"] {
+        padding: 8px 16px;
+        background: #3a3a3a;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+
+    QPushButton[variant="pager"]:hover:enabled {
+        background: #ff7b00;
+    }
+
+    QPushButton[variant="pager"]:disabled {
+        background: #2a2a2a;
+        color: #666;
+    }
+
+    /* Header */
+    QWidget#header, QWidget#header QWidget {
+        background: #2a2a2a;
+        border-radius: 10px;
+    }
+
+    QLabel#logo {
+        font-size: 24px;
+        font-weight: bold;
+        color: #ff7b00;
+    }
+
+    QLabel#welcome_label {
+        color: #ccc;
+    }
+
+    /* Busca */
+    QWidget#search_section, QWidget#search_section QWidget {
+        background: #2a2a2a;
+        border-radius: 10px;
+    }
+
+    QWidget#search_section {
+        padding: 20px;
+        margin-bottom: 30px;
+    }
+
+    QLineEdit#search_input {
+        padding: 12px;
+        border-radius: 5px;
+        font-size: 16px;
+        background: #3a3a3a;
+        color: white;
+        border: 1px solid #444;
+    }
+
+    QPushButton#search_btn {
+        padding: 12px;
+        font-size: 16px;
+    }
+
+    QLabel#page_label {
+        color: white;
+        padding: 0 15px;
+    }
+
+    /* Abas - o estado ativo vem da propriedade dinâmica "active" */
+    QWidget#tabs_bar {
+        background: #2a2a2a;
+        border-radius: 10px;
+        padding: 5px;
         margin-bottom: 20px;
     }
-    
-    QLineEdit {
-        background: #2d3748;
-        border: 2px solid #4a5568;
+
+    QPushButton[variant="tab"] {
+        padding: 12px 24px;
         border-radius: 8px;
-        padding: 12px 15px;
+        border: none;
+        color: white;
+        background: transparent;
+    }
+
+    QPushButton[variant="tab"]:hover {
+        background: #3a3a3a;
+    }
+
+    QPushButton[variant="tab"][active="true"] {
+        background: #ff7b00;
+        color: white;
+    }
+
+    /* Conteúdo das abas */
+    QLabel#loading_label {
+        font-size: 32px;
+        color: #ff7b00;
+        padding: 50px;
+    }
+
+    QLabel[role="section_title"] {
+        font-size: 24px;
+        margin-bottom: 20px;
+        color: #ff7b00;
+        border-left: 4px solid #ff7b00;
+        padding-left: 15px;
+    }
+
+    QLabel[role="placeholder"] {
+        color: #888;
+        padding: 40px;
+        font-size: 16px;
+    }
+
+    QLabel[role="profile_message"] {
+        padding: 40px;
+        color: #ff7b00;
+        font-size: 18px;
+    }
+
+    QLabel#profile_info {
+        color: white;
         font-size: 14px;
-        color: #f7fafc;
+    }
+
+    QDialog#auth_dialog {
+        background: #2a2a2a;
+        border-radius: 10px;
+    }
+
+    /* Grade de animes - cards e hover pintados pelo delegate */
+    AnimeGridView {
+        border: none;
+        background: transparent;
+    }
+
+    QLabel[posterState="failed"] {
+        color: #666;
+        font-size: 12px;
+    }
+
+    /* Detalhes do anime */
+    QDialog#anime_details {
+        background: #1e1e1e;
+        border-radius: 15px;
+        border: 2px solid #ff7b00;
+    }
+
+    QFrame[role="panel"] {
+        background: #2a2a2a;
+        border-radius: 10px;
+        padding: 15px;
+    }
+
+    QFrame[role="panel"] QLabel {
+        background: transparent;
+    }
+
+    QLabel[role="panel_title"] {
+        color: #ff7b00;
+        font-size: 18px;
+        font-weight: bold;
         margin-bottom: 15px;
-        min-height: 20px;
     }
-    
-    QLineEdit:focus {
-        border-color: #667eea;
-        background: #1a202c;
+
+    QLabel#description_title {
+        font-size: 16px;
+        margin-bottom: 10px;
+    }
+
+    QLabel#description_text {
+        color: #cccccc;
+        font-size: 14px;
+    }
+
+    QLabel#episodes_status {
+        color: #888;
+        font-size: 14px;
+        padding: 20px;
+    }
+
+    QLabel#episodes_status[state="error"] {
+        color: #ff4444;
+    }
+
+    QLabel#details_poster {
+        background: #2a2a2a;
+        border-radius: 10px;
+        border: 2px solid #444;
+    }
+
+    QLabel#details_title {
+        color: #ff7b00;
+        font-size: 24px;
+        font-weight: bold;
+    }
+
+    QLabel#details_metadata {
+        background: transparent;
+    }
+
+    QLabel[role="info_title"] {
+        color: #ff7b00;
+        font-size: 14px;
+        font-weight: bold;
+        min-width: 100px;
     }
-    
-    QLineEdit::placeholder {
-        color: #718096;
+
+    QLabel[role="info_value"] {
+        color: white;
+        font-size: 14px;
     }
-    
-    QPushButton {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #667eea, stop:1 #764ba2);
+
+    QPushButton#close_button {
+        background: #3a3a3a;
         color: white;
         border: none;
         border-radius: 8px;
-        padding: 12px;
+        padding: 12px 20px;
         font-size: 14px;
         font-weight: bold;
-        margin-top: 10px;
-        min-height: 20px;
     }
-    
-    QPushButton:hover {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #5a6fd8, stop:1 #6a4190);
+
+    QPushButton#close_button:hover {
+        background: #ff7b00;
     }
-    
-    QPushButton:pressed {
-        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                                   stop:0 #4c5bc6, stop:1 #58357e);
+
+    /* Lista de episódios */
+    EpisodeBrowser QComboBox, EpisodeBrowser QLineEdit, EpisodeBrowser QSpinBox {
+        background: #3a3a3a;
+        color: white;
+        border: 1px solid #444;
+        border-radius: 5px;
+        padding: 6px;
+        font-size: 13px;
     }
-    
-    QPushButton#secondary {
+
+    EpisodeBrowser QComboBox:focus, EpisodeBrowser QLineEdit:focus, EpisodeBrowser QSpinBox:focus {
+        border-color: #ff7b00;
+    }
+
+    EpisodeBrowser QLabel {
+        color: #cccccc;
+        font-size: 13px;
         background: transparent;
-        color: #667eea;
-        border: 2px solid #667eea;
-        border-radius: 8px;
-        padding: 10px;
-        font-size: 14px;
+    }
+
+    EpisodeBrowser QListView {
+        border: none;
+        background: transparent;
+    }
+
+    QPushButton#jump_button {
+        background: #3a3a3a;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 6px 14px;
+        font-size: 13px;
+    }
+
+    QPushButton#jump_button:hover {
+        background: #ff7b00;
+    }
+
+    /* Player de vídeo */
+    QVideoWidget {
+        background: #000000;
+        border: none;
+    }
+
+    QLabel#player_loading {
+        background: #000000;
+        color: #cccccc;
+        font-size: 16px;
+        padding: 40px;
+    }
+
+    QLabel#player_loading[state="error"] {
+        color: #ff4444;
+    }
+
+    QWidget#player_controls {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(26, 26, 26, 220), stop:1 rgba(10, 10, 10, 220));
+        border-top: 1px solid #333;
+    }
+
+    QWidget#player_controls QLabel {
+        background: transparent;
+        color: #cccccc;
+    }
+
+    QLabel[role="time_label"] {
+        font-size: 12px;
         font-weight: bold;
-        margin-top: 5px;
+        min-width: 40px;
+    }
+
+    QLabel#quality_label {
+        font-size: 11px;
     }
-    
-    QPushButton#secondary:hover {
-        background: #667eea;
+
+    QSlider#progress_slider::groove:horizontal {
+        background: #404040;
+        height: 6px;
+        border-radius: 3px;
+    }
+
+    QSlider#progress_slider::handle:horizontal {
+        background: #ff7b00;
+        width: 16px;
+        height: 16px;
+        border-radius: 8px;
+        margin: -5px 0;
+    }
+
+    QSlider#progress_slider::sub-page:horizontal {
+        background: #ff7b00;
+        border-radius: 3px;
+    }
+
+    QSlider#volume_slider::groove:horizontal {
+        background: #404040;
+        height: 4px;
+        border-radius: 2px;
+    }
+
+    QSlider#volume_slider::handle:horizontal {
+        background: #cccccc;
+        width: 12px;
+        height: 12px;
+        border-radius: 6px;
+        margin: -4px 0;
+    }
+
+    QSlider#volume_slider::sub-page:horizontal {
+        background: #ff7b00;
+        border-radius: 2px;
+    }
+
+    QPushButton#play_button {
+        background: #ff7b00;
+        border: none;
+        border-radius: 20px;
+        font-size: 16px;
         color: white;
     }
-    
-    /* 🔥 ADICIONADO: Estilo para o separador */
-    QLabel[objectName="separator"] {
-        color: #a0aec0;
+
+    QPushButton#play_button:hover {
+        background: #ff9500;
+    }
+
+    QPushButton#play_button:pressed {
+        background: #e66a00;
+    }
+
+    QPushButton[variant="seek"] {
+        background: #333333;
+        border: 1px solid #555555;
+        border-radius: 5px;
+        color: white;
+        font-size: 11px;
+    }
+
+    QPushButton[variant="seek"]:hover {
+        background: #444444;
+        border: 1px solid #666666;
+    }
+
+    QPushButton#volume_button {
         background: transparent;
-        padding: 10px;
-        margin: 10px 0;
+        border: none;
+        font-size: 14px;
+        color: #cccccc;
+    }
+
+    QPushButton#volume_button:hover {
+        color: #ffffff;
+    }
+
+    QComboBox#quality_combo {
+        background: #333333;
+        color: white;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        padding: 2px 5px;
+        font-size: 11px;
+    }
+
+    QComboBox#quality_combo::drop-down {
+        border: none;
+        width: 15px;
+    }
+
+    QComboBox#quality_combo QAbstractItemView {
+        background: #333333;
+        color: white;
+        border: 1px solid #555555;
+        selection-background-color: #ff7b00;
+    }
+
+    QPushButton[variant="player_option"] {
+        background: #333333;
+        color: white;
+        border: 1px solid #555555;
+        border-radius: 3px;
+        font-size: 11px;
+    }
+
+    QPushButton[variant="player_option"]:hover {
+        background: #444444;
+    }
+
+    QPushButton#fullscreen_button {
+        font-size: 12px;
     }
-    """
\ No newline at end of file
+    """
@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from styles.dark_styles import get_dark_styles
+from styles.auth_styles import get_auth_styles
+
+@lru_cache(maxsize=1)
+def build_stylesheet():
+    """Monta o tema completo da aplicação (uma única vez por processo)"""
+    return get_dark_styles() + get_auth_styles()
+
+def apply_theme(app):
+    """Aplica o tema na QApplication; widgets não devem chamar setStyleSheet"""
+    app.setStyleSheet(build_stylesheet())
+
+def set_style_state(widget, name, value):
+    """Altera um estado visual (propriedade dinâmica) sem reprocessar o CSS"""
+    if widget.property(name) == value:
+        return
+
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()